@@ -0,0 +1,90 @@
+"""Benchmark the import of the core of the energy cost model.
+
+The core is imported in fresh interpreters and the best time is compared
+to a budget; importing it must load neither gemseo nor matplotlib::
+
+    python benchmarks/import_time.py --budget 0.5
+
+The detailed timings of the imports can be printed with ``python -X importtime``.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import subprocess
+import sys
+
+CORE_MODULES = (
+    "energy_house_cost.database.catalog",
+    "energy_house_cost.database.lib_components",
+    "energy_house_cost.evaluation",
+    "energy_house_cost.executor",
+    "energy_house_cost.finance",
+    "energy_house_cost.fleet",
+    "energy_house_cost.portfolio",
+    "energy_house_cost.sampling",
+    "energy_house_cost.sensitivity",
+    "energy_house_cost.service",
+    "energy_house_cost.surrogate",
+)
+"""The modules of the core, which must not depend on gemseo and matplotlib."""
+
+OPTIONAL_PACKAGES = ("gemseo", "matplotlib")
+"""The packages loaded only by the adapters."""
+
+_SCRIPT = f"""
+import json
+import sys
+import time
+
+start = time.perf_counter()
+for name in {CORE_MODULES!r}:
+    __import__(name)
+seconds = time.perf_counter() - start
+loaded = [name for name in {OPTIONAL_PACKAGES!r} if name in sys.modules]
+print(json.dumps({{"seconds": seconds, "loaded": loaded}}))
+"""
+
+
+def measure(repeat: int = 5) -> tuple[float, list[str]]:
+    """Return the best time in seconds of the import of the core in a new process,
+    and the optional packages it loads."""
+    results = [
+        json.loads(
+            subprocess.run(
+                [sys.executable, "-c", _SCRIPT],
+                check=True,
+                capture_output=True,
+                text=True,
+            ).stdout
+        )
+        for _ in range(repeat)
+    ]
+    return min(result["seconds"] for result in results), results[0]["loaded"]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--budget",
+        type=float,
+        default=0.5,
+        help="the maximum time in seconds of the import of the core",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="the number of interpreters"
+    )
+    args = parser.parse_args(argv)
+    seconds, loaded = measure(args.repeat)
+    print(f"import of the core: {seconds * 1e3:.1f} ms (budget {args.budget * 1e3} ms)")
+    if loaded:
+        print(f"The core imports the optional packages {', '.join(loaded)}.")
+        return 1
+    if seconds > args.budget:
+        print("The import of the core exceeds its budget.")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,240 @@
+"""Benchmark the evaluation of the energy cost model.
+
+The results are written to a json file which can be compared to a baseline,
+e.g. the results of a previous commit::
+
+    python benchmarks/run_benchmarks.py --output baseline.json
+    python benchmarks/run_benchmarks.py --baseline baseline.json
+
+The comparison fails when a benchmark is slower than its baseline
+by more than the tolerance.
+"""
+from __future__ import annotations
+
+import argparse
+import datetime
+import json
+import platform
+import sys
+import tempfile
+import timeit
+from itertools import cycle
+from itertools import product
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+from energy_house_cost.database import DB_PATH
+from energy_house_cost.database.lib_components import PV
+from energy_house_cost.energetic_components import EnergeticComponent
+from energy_house_cost.energy_cost import EnergyCostProjection
+from energy_house_cost.energy_item import create_parameter_store
+from energy_house_cost.energy_item import EnergyItem
+from energy_house_cost.energy_scenario import EnergyScenario
+from energy_house_cost.evaluation import component_integrated_cost
+from energy_house_cost.evaluation import compute_cost
+from energy_house_cost.evaluation import compute_cost_batch
+from energy_house_cost.sampling import generate_samples
+
+DURATIONS = (10, 30, 100)
+N_ITEMS = (1, 10, 200)
+N_POINTS = (3, 10, 50)
+N_SAMPLES = (100, 10000, 100000)
+
+
+def create_cost(
+    profile_type: str, duration_years: int, directory: Path, n_points: int = 3
+) -> EnergyCostProjection:
+    """Create an energy cost whose profile spans the duration."""
+    if profile_type != "user_points":
+        return EnergyCostProjection(
+            DB_PATH / f"mock_energy_cost_{profile_type}.json", duration_years
+        )
+
+    years = np.linspace(1, duration_years, n_points)
+    data = {
+        "name": "user_points",
+        "energy_name": "electricity",
+        "profile_type": "user_points",
+        "initial_cost_one_kwh": {"value": 0.2, "min": 0.0, "max": 1.0},
+        "points": [
+            {"year": year, "value": 0.2 + 0.01 * year, "min": 0.0, "max": 2.0}
+            for year in years.tolist()
+        ],
+    }
+    path = directory / f"user_points_{duration_years}_{n_points}.json"
+    path.write_text(json.dumps(data))
+    return EnergyCostProjection(path, duration_years)
+
+
+def create_energy_items(n_items: int, duration_years: int) -> list[EnergyItem]:
+    """Create energy items alternating components and energy costs."""
+    electricity_cost = EnergyCostProjection(
+        DB_PATH / "electricity_cost.json", duration_years
+    )
+    gas_cost = EnergyCostProjection(DB_PATH / "gas_cost.json", duration_years)
+    energy_items = []
+    for i in range(n_items):
+        if i % 3 == 0:
+            item = EnergyItem(
+                3400.0, EnergeticComponent(f"boiler{i}", 7000.0, 100.0, 0.6), gas_cost
+            )
+        elif i % 3 == 1:
+            item = EnergyItem(
+                2400.0, EnergeticComponent(f"tank{i}", 1000.0, 0.0), electricity_cost
+            )
+        else:
+            item = EnergyItem(
+                0.0, PV(f"pv{i}", 5000.0, 0.0), electricity_cost, is_produced=True
+            )
+        energy_items.append(item)
+    return energy_items
+
+
+def measure(function: Callable[[], object], repeat: int = 5) -> float:
+    """Return the best time in seconds of a call to a function."""
+    timer = timeit.Timer(function)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat, number)) / number
+
+
+def generate_benchmarks(directory: Path):
+    """Yield the names, parameters and functions of the benchmarks."""
+    for profile_type, duration_years in product(
+        ("linear", "power", "user_points"), DURATIONS
+    ):
+        cost = create_cost(profile_type, duration_years, directory)
+        years = np.arange(duration_years)
+        yield "cost_compute", {
+            "profile_type": profile_type,
+            "duration_years": duration_years,
+        }, lambda cost=cost, years=years: cost.compute_profile(years, 1e3)
+
+    for n_points, duration_years in product(N_POINTS, DURATIONS):
+        cost = create_cost("user_points", duration_years, directory, n_points)
+        yield "cost_compute_integral", {
+            "n_points": n_points,
+            "duration_years": duration_years,
+        }, lambda cost=cost, duration_years=duration_years: cost.compute_integral(
+            duration_years, 1e3
+        )
+
+    for duration_years in DURATIONS:
+        item = create_energy_items(3, duration_years)[2]
+        yield "component_integrated_cost", {
+            "duration_years": duration_years
+        }, lambda item=item, duration_years=duration_years: component_integrated_cost(
+            item, duration_years
+        )
+
+    for n_items, duration_years in product(N_ITEMS, DURATIONS):
+        energy_items = create_energy_items(n_items, duration_years)
+        yield "compute_cost", {
+            "n_items": n_items,
+            "duration_years": duration_years,
+        }, lambda items=energy_items, duration_years=duration_years: compute_cost(
+            items, duration_years
+        )
+
+    for n_items, duration_years in product(N_ITEMS, DURATIONS):
+        scenario = EnergyScenario(
+            create_energy_items(n_items, duration_years), duration_years
+        )
+        parameters = {"n_items": n_items, "duration_years": duration_years}
+        # Other inputs at every call, as the discipline cache answers the same ones.
+        names = scenario.parameter_store.names
+        samples = generate_samples(scenario.parameter_store, 16)
+        inputs = cycle([dict(zip(names, sample[:, np.newaxis])) for sample in samples])
+        yield "scenario_execute", parameters, lambda scenario=scenario, inputs=inputs: (
+            scenario.execute(next(inputs))
+        )
+        yield "scenario_execute_cached", parameters, scenario.execute
+
+    for n_samples, n_items in product(N_SAMPLES, N_ITEMS[:2]):
+        energy_items = create_energy_items(n_items, 15)
+        parameter_store = create_parameter_store(energy_items)
+        samples = generate_samples(parameter_store, n_samples)
+        yield "doe_sampling", {
+            "n_samples": n_samples,
+            "n_items": n_items,
+        }, lambda items=energy_items, samples=samples, store=parameter_store: (
+            compute_cost_batch(items, 15, samples, store)
+        )
+
+
+def get_key(name: str, parameters: dict[str, object]) -> str:
+    """Return the key of a benchmark in the json file."""
+    return f"{name}[{','.join(f'{k}={v}' for k, v in parameters.items())}]"
+
+
+def run(name_filter: str = "") -> dict[str, object]:
+    """Run the benchmarks whose keys contain a filter."""
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        for name, parameters, function in generate_benchmarks(Path(directory)):
+            key = get_key(name, parameters)
+            if name_filter not in key:
+                continue
+            seconds = measure(function)
+            results[key] = {"name": name, "parameters": parameters, "seconds": seconds}
+            print(f"{key}: {seconds * 1e6:.1f} us")
+    return {
+        "metadata": {
+            "date": datetime.datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+        },
+        "results": results,
+    }
+
+
+def compare(
+    results: dict[str, object], baseline: dict[str, object], tolerance: float
+) -> list[str]:
+    """Compare results to a baseline and return the keys of the regressions."""
+    regressions = []
+    for key, result in results["results"].items():
+        reference = baseline["results"].get(key)
+        if reference is None:
+            continue
+        ratio = result["seconds"] / reference["seconds"]
+        status = "REGRESSION" if ratio > 1 + tolerance else "ok"
+        print(f"{key}: {ratio:.2f}x baseline {status}")
+        if status != "ok":
+            regressions.append(key)
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--output", type=Path, default=Path("benchmarks.json"), help="the json file"
+    )
+    parser.add_argument("--baseline", type=Path, help="the json file of the baseline")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.2,
+        help="the relative slowdown above which a benchmark regresses",
+    )
+    parser.add_argument(
+        "--filter", default="", help="run only the benchmarks containing this text"
+    )
+    args = parser.parse_args(argv)
+    results = run(args.filter)
+    args.output.write_text(json.dumps(results, indent=2))
+    if args.baseline is None:
+        return 0
+
+    regressions = compare(
+        results, json.loads(args.baseline.read_text()), args.tolerance
+    )
+    if regressions:
+        print(f"{len(regressions)} benchmarks regressed.")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
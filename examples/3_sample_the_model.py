@@ -21,7 +21,7 @@ if __name__ == "__main__":
 
     from gemseo.api import create_scenario
 
-    output_names = ["total_cost"]
+    output_names = ["total_cost", "cost_per_year_per_component"]
     scenario = create_scenario(
         [scenario],
         "DisciplinaryOpt",
@@ -0,0 +1,29 @@
+"""
+5. Compute sensitivity indices
+==============================
+
+"""
+from __future__ import annotations
+
+from energy_house_cost.sensitivity import compute_morris_indices
+from energy_house_cost.sensitivity import compute_sobol_indices
+from house_energy_cost import scenario
+
+if __name__ == "__main__":
+    # %%
+    # Screen the parameters with the Morris method
+    # --------------------------------------------
+    morris = compute_morris_indices(scenario, 50)
+    for name, mu_star, sigma in zip(
+        morris.input_names, morris.mu_star[0], morris.sigma[0]
+    ):
+        print(f"{name}: mu* = {mu_star:.0f} euros, sigma = {sigma:.0f} euros")
+
+    # %%
+    # Estimate the Sobol' indices
+    # ---------------------------
+    sobol = compute_sobol_indices(scenario, 10000)
+    for output_name in sobol.output_names:
+        print(output_name)
+        for name, (first_order, total_order) in sobol.get_indices(output_name).items():
+            print(f"  {name}: S = {first_order:.2f}, ST = {total_order:.2f}")
@@ -0,0 +1,22 @@
+"""
+6. Compute output statistics online
+===================================
+
+"""
+from __future__ import annotations
+
+from energy_house_cost.sampling import compute_statistics
+from house_energy_cost import scenario
+
+if __name__ == "__main__":
+    statistics = compute_statistics(scenario, n_samples=1000000)
+    name = "total_cost"
+    print(statistics.compute_mean()[name])
+    print(statistics.compute_standard_deviation()[name])
+    print(statistics.compute_variation_coefficient()[name])
+    print(statistics.compute_margin(3)[name])
+    # The ranks of the quantiles are exact up to this error.
+    print(statistics.sketch.rank_error_bound)
+    print(statistics.compute_quantile(0.8)[name])
+    print(statistics.compute_quartile(3)[name])
+    print(statistics.compute_percentile(23)[name])
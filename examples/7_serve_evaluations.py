@@ -0,0 +1,39 @@
+"""
+7. Serve the evaluations of what-if queries
+===========================================
+
+"""
+from __future__ import annotations
+
+import asyncio
+
+from energy_house_cost.service import BatchingEvaluator
+from energy_house_cost.service import serve
+from house_energy_cost import DURATION_YEARS
+from house_energy_cost import energy_items_1
+from numpy.random import default_rng
+
+
+async def send_queries(evaluator: BatchingEvaluator, n_queries: int):
+    """Send concurrent queries as a web front end would do."""
+    slopes = default_rng(0).uniform(0.005, 0.02, n_queries)
+    await asyncio.gather(
+        *(evaluator.evaluate({"gas_cost.slope": slope}) for slope in slopes)
+    )
+
+
+if __name__ == "__main__":
+    # %%
+    # Evaluate concurrent queries in micro-batches
+    # --------------------------------------------
+    evaluator = BatchingEvaluator(energy_items_1, DURATION_YEARS, max_wait=0.002)
+    asyncio.run(send_queries(evaluator, 10000))
+    for name, value in evaluator.metrics.get_summary().items():
+        print(f"{name}: {value:.4g}")
+
+    # %%
+    # Serve the queries over HTTP
+    # ---------------------------
+    # Then ``curl -d '{"gas_cost.slope": 0.01}' localhost:8080/evaluate``
+    # evaluates a query and ``curl localhost:8080/metrics`` returns the metrics.
+    asyncio.run(serve(evaluator, port=8080))
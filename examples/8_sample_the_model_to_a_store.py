@@ -0,0 +1,28 @@
+"""
+8. Sample the model to a store on disk
+======================================
+
+"""
+from __future__ import annotations
+
+from energy_house_cost.sampling import sample_scenario_to_store
+from house_energy_cost import scenario
+
+if __name__ == "__main__":
+    # %%
+    # The samples are drawn from the triangular distributions of the uncertain space
+    # and every chunk of samples is saved in the directory ``"doe"``
+    # as soon as it is evaluated.
+    # If the sampling is interrupted,
+    # running this example again resumes it from the last saved chunk.
+    store = sample_scenario_to_store(
+        scenario, "doe", n_samples=1000000, seed=0, chunk_size=10000
+    )
+    print(f"{len(store.chunk_indices)} chunks saved in {store.directory}")
+
+    # %%
+    # A chunk is read lazily as memory-mapped arrays.
+    # The statistics of the store are computed one chunk at a time
+    # in the example 4.
+    chunk = store.get_chunk(store.chunk_indices[0])
+    print(chunk.total_cost[:10])
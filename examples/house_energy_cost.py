@@ -4,10 +4,9 @@ from energy_house_cost.database import DB_PATH
 from energy_house_cost.database.lib_components import PV
 from energy_house_cost.energetic_components import EnergeticComponent
 from energy_house_cost.energy_cost import EnergyCostProjection
-from energy_house_cost.energy_scenario import compute_cost
 from energy_house_cost.energy_scenario import EnergyItem
 from energy_house_cost.energy_scenario import EnergyScenario
-from energy_house_cost.energy_scenario import plot_integrated_cost_per_component
+from energy_house_cost.plotting import plot_integrated_cost_per_component
 
 DURATION_YEARS = 15
 BOILER_EFFICIENCY = 0.6
@@ -47,10 +46,9 @@ if __name__ == "__main__":
     scenario.execute()
     output_data = scenario.get_output_data()
     total_cost = output_data["total_cost"][0]
+    print(scenario.get_report())
 
-    # Cost per component is not an output of the scenario (due to grammar validation problem
-    # since it is an array of array). So it is obtained by calling directly compute_cost.
-    _, cost_per_year_per_component = compute_cost(energy_items_1, DURATION_YEARS)
+    cost_per_year_per_component = scenario.get_cost_per_year_per_component()
     component_names = []
     for item in energy_items_1:
         component_names.append(item.component.name)
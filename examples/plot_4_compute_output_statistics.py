@@ -5,23 +5,24 @@
 """
 from __future__ import annotations
 
-from pickle import load
+from energy_house_cost.sampling import SamplingStore
+from gemseo.uncertainty.api import create_statistics
 
 
 if __name__ == "__main__":
-    with open("dataset.pkl", "rb") as f:
-        dataset = load(f)
-
-    print(dataset)
-
-    dataframe = dataset.export_to_dataframe()
-    dataframe
-    df_statistics = dataframe.describe()
-    df_statistics
-    from gemseo.uncertainty.api import create_statistics
-
+    # %%
+    # The store written by the example 8 is read lazily, one chunk at a time.
+    store = SamplingStore("doe")
+    print(
+        f"{len(store.chunk_indices)} chunks of {store.metadata['chunk_size']} samples"
+    )
     name = "total_cost"
-    empirical_statistics = create_statistics(dataset, variables_names=[name])
+    empirical_statistics = store.compute_statistics()
+
+    # %%
+    # The parametric statistics and the plots use the first chunk only,
+    # so that the memory is bounded by the size of a chunk.
+    dataset = store.get_chunk(store.chunk_indices[0]).to_dataset()
     parametric_statistics = create_statistics(
         dataset,
         variables_names=[name],
@@ -29,32 +30,32 @@ if __name__ == "__main__":
         fitting_criterion="Kolmogorov",
     )
     parametric_statistics.plot_criteria(name)
-    print(empirical_statistics.compute_mean()[name][0])
+    print(empirical_statistics.compute_mean()[name])
     print(parametric_statistics.compute_mean()[name][0])
-    print(empirical_statistics.compute_standard_deviation()[name][0])
+    print(empirical_statistics.compute_standard_deviation()[name])
     print(parametric_statistics.compute_standard_deviation()[name][0])
 
-    print(empirical_statistics.compute_variation_coefficient()[name][0])
+    print(empirical_statistics.compute_variation_coefficient()[name])
     print(parametric_statistics.compute_variation_coefficient()[name][0])
 
-    print(empirical_statistics.compute_margin(3)[name][0])
+    print(empirical_statistics.compute_margin(3)[name])
     print(parametric_statistics.compute_margin(3)[name][0])
 
     print(
-        empirical_statistics.compute_quantile(0.8)[name][0]
+        empirical_statistics.compute_quantile(0.8)[name]
     )  # 80% of the values are lower than this one
     print(
         parametric_statistics.compute_quantile(0.8)[name][0]
     )  # 80% of the values are lower than this one
 
     print(
-        empirical_statistics.compute_quartile(3)[name][0]
+        empirical_statistics.compute_quartile(3)[name]
     )  # 75% of the values are lower than this one
     print(
         parametric_statistics.compute_quartile(3)[name][0]
     )  # 75% of the values are lower than this one
     print(
-        empirical_statistics.compute_percentile(23)[name][0]
+        empirical_statistics.compute_percentile(23)[name]
     )  # 23% of the values are lower than this one
     print(
         parametric_statistics.compute_percentile(23)[name][0]
@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Iterable
+
+from numpy import ascontiguousarray
+from numpy import frombuffer
+from numpy import generic
+from numpy import ndarray
+
+from energy_house_cost.energy_item import EnergyItem
+
+
+def _encode(value: object) -> object:
+    """Encode a value that is not serializable to JSON.
+
+    An array is encoded by its dtype, its shape and a digest of all its elements,
+    since its string representation shortens it.
+
+    Raises:
+        TypeError: When the type of the value is not supported,
+            since its string representation can be ambiguous
+            or differ from a process to another, e.g. with a memory address.
+    """
+    if isinstance(value, ndarray):
+        value = ascontiguousarray(value)
+        return [
+            str(value.dtype),
+            value.shape,
+            hashlib.sha256(value.tobytes()).hexdigest(),
+        ]
+    if isinstance(value, generic):
+        return value.item()
+    if isinstance(value, Path):
+        return str(value)
+    raise TypeError(
+        f"A value of type {value.__class__.__name__} cannot be fingerprinted."
+    )
+
+
+def compute_fingerprint(energy_items: Iterable[EnergyItem], duration_years: int) -> str:
+    """Compute a fingerprint of the configuration of an energy scenario.
+
+    The fingerprint depends on the duration, the energy items,
+    the public attributes of their components and the definitions of their costs,
+    including the modification times and sizes of the files of the series of prices,
+    but not on the values of the uncertain parameters.
+
+    Args:
+        energy_items: The energy items.
+        duration_years: The period in years over which the cost is computed.
+
+    Returns:
+        The fingerprint.
+
+    Raises:
+        TypeError: When an attribute of a component cannot be fingerprinted.
+    """
+    configuration = {"duration_years": duration_years, "items": []}
+    for item in energy_items:
+        component = item.component
+        energy_cost = {"definition": item.energy_cost._data}
+        if item.energy_cost.profile_type == "series":
+            path = item.energy_cost._series_path.resolve()
+            stat = path.stat()
+            energy_cost["series"] = [str(path), stat.st_mtime_ns, stat.st_size]
+        configuration["items"].append(
+            {
+                "energy_value": item.energy_value,
+                "is_produced": item.is_produced,
+                "component": [
+                    component.__class__.__name__,
+                    {k: v for k, v in vars(component).items() if k[0] != "_"},
+                ],
+                "energy_cost": energy_cost,
+            }
+        )
+    return hashlib.sha256(
+        json.dumps(configuration, sort_keys=True, default=_encode).encode()
+    ).hexdigest()
+
+
+class EvaluationCache:
+    """A cache of the outputs of an energy scenario.
+
+    The outputs are stored in memory for the ``max_size`` most recently used inputs,
+    and optionally on disk in a SQLite database without size limit.
+    The cache can be shared by threads.
+    """
+
+    def __init__(self, max_size: int = 1000, path: str | Path | None = None):
+        """Constructor.
+
+        Args:
+            max_size: The maximum number of entries stored in memory.
+            path: The path to the SQLite database storing the entries on disk.
+                If ``None``, store the entries only in memory.
+        """
+        self.max_size = max_size
+        self.hits = 0
+        """The number of outputs found in the cache."""
+
+        self.disk_hits = 0
+        """The number of outputs found on disk but not in memory."""
+
+        self.misses = 0
+        """The number of outputs not found in the cache."""
+
+        self.__entries = OrderedDict()
+        # Guards the entries, the counters and the connection shared by the threads.
+        self.__lock = threading.Lock()
+        self.__connection = None
+        if path is not None:
+            self.__connection = sqlite3.connect(path, check_same_thread=False)
+            self.__connection.execute(
+                "CREATE TABLE IF NOT EXISTS entries"
+                " (key TEXT PRIMARY KEY, total_cost REAL, costs BLOB)"
+            )
+
+    def __len__(self) -> int:
+        with self.__lock:
+            return len(self.__entries)
+
+    @staticmethod
+    def compute_key(fingerprint: str, values: ndarray) -> str:
+        """Compute the key of the outputs of a scenario.
+
+        Args:
+            fingerprint: The fingerprint of the configuration of the scenario.
+            values: The values of the parameters shaped as ``(n_parameters,)``.
+
+        Returns:
+            The key.
+        """
+        return hashlib.sha256(
+            fingerprint.encode() + values.astype(float).tobytes()
+        ).hexdigest()
+
+    def get(self, key: str) -> tuple[float, ndarray] | None:
+        """Return the outputs of a scenario.
+
+        Args:
+            key: The key of the outputs.
+
+        Returns:
+            The total cost and the flattened cost per year per component,
+            or ``None`` when the outputs are not in the cache.
+        """
+        with self.__lock:
+            return self.__get(key)
+
+    def __get(self, key: str) -> tuple[float, ndarray] | None:
+        outputs = self.__entries.get(key)
+        if outputs is not None:
+            self.__entries.move_to_end(key)
+            self.hits += 1
+            return outputs
+
+        if self.__connection is not None:
+            row = self.__connection.execute(
+                "SELECT total_cost, costs FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None:
+                outputs = (row[0], frombuffer(row[1]))
+                self.__store_in_memory(key, outputs)
+                self.hits += 1
+                self.disk_hits += 1
+                return outputs
+
+        self.misses += 1
+        return None
+
+    def set(self, key: str, total_cost: float, cost_per_year_per_component: ndarray):
+        """Store the outputs of a scenario.
+
+        Args:
+            key: The key of the outputs.
+            total_cost: The total cost.
+            cost_per_year_per_component: The cost per year per component.
+        """
+        outputs = (float(total_cost), cost_per_year_per_component.ravel().copy())
+        with self.__lock:
+            self.__store_in_memory(key, outputs)
+            if self.__connection is not None:
+                with self.__connection:
+                    self.__connection.execute(
+                        "INSERT OR REPLACE INTO entries VALUES (?, ?, ?)",
+                        (key, outputs[0], outputs[1].tobytes()),
+                    )
+
+    def __store_in_memory(self, key: str, outputs: tuple[float, ndarray]):
+        self.__entries[key] = outputs
+        self.__entries.move_to_end(key)
+        if len(self.__entries) > self.max_size:
+            self.__entries.popitem(last=False)
+
+    def clear(self):
+        """Remove the entries from memory and reset the counters."""
+        with self.__lock:
+            self.__entries.clear()
+            self.hits = self.disk_hits = self.misses = 0
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from copy import copy
+from pathlib import Path
+
+from energy_house_cost.database import DB_PATH
+from energy_house_cost.energy_cost import EnergyCostProjection
+
+
+class Catalog:
+    """The energy costs defined by the json files of a directory.
+
+    The definitions are parsed and validated once, when the catalog is created or
+    refreshed. Then every energy cost handed out is a copy of a prototype, sharing
+    its definition and its profile but with its own uncertain parameters, so that
+    no file is read.
+    """
+
+    def __init__(self, path: str | Path = DB_PATH):
+        """Constructor.
+
+        Args:
+            path: The directory of the json files defining the energy costs.
+        """
+        self.path = Path(path)
+        self.__prototypes = {}
+        self.refresh()
+
+    @property
+    def cost_names(self) -> list[str]:
+        """The names of the energy costs, i.e. the stems of their json files."""
+        return list(self.__prototypes)
+
+    def refresh(self):
+        """Parse the definitions of the new and modified files.
+
+        The definitions of the removed files are forgotten.
+        """
+        prototypes = {}
+        for file_path in sorted(self.path.glob("*.json")):
+            mtime = file_path.stat().st_mtime_ns
+            prototype = self.__prototypes.get(file_path.stem)
+            if prototype is None or prototype[0] != mtime:
+                prototype = (mtime, EnergyCostProjection(file_path, 0))
+            prototypes[file_path.stem] = prototype
+        self.__prototypes = prototypes
+
+    def get_cost(self, name: str, duration_years: int) -> EnergyCostProjection:
+        """Return an energy cost.
+
+        Args:
+            name: The name of the energy cost.
+            duration_years: The number of years over which the cost projection
+                is computed.
+
+        Returns:
+            The energy cost, independent of the other ones.
+
+        Raises:
+            ValueError: When the energy cost is not in the catalog.
+        """
+        prototype = self.__prototypes.get(name)
+        if prototype is None:
+            raise ValueError(f"{name} is not an energy cost of the catalog.")
+        cost = copy(prototype[1])
+        cost.duration_years = duration_years
+        return cost
@@ -1,7 +1,14 @@
 from __future__ import annotations
 
+from typing import Mapping
+
+from numpy import asarray
+from numpy import ndarray
+from numpy.typing import NDArray
+
 from energy_house_cost.energetic_components import EnergeticComponent
 from energy_house_cost.energetic_components import ProductorComponent
+from energy_house_cost.time_series import compute_self_consumption
 
 
 class Mock(EnergeticComponent):
@@ -15,8 +22,21 @@ class Mock(EnergeticComponent):
     ):
         super().__init__(name, initial_install_cost, maintenance_cost, True)
 
-    def compute(self, energy_value: float, is_produced: bool):
-        return self._uncertain_parameters[f"{self.name}.param1"].value
+    def compute(
+        self,
+        energy_value: float,
+        is_produced: bool,
+        parameter_values: Mapping[str, ndarray] | None = None,
+    ):
+        return self._get_parameter_value("param1", parameter_values)
+
+    def compute_jacobian(
+        self,
+        energy_value: float,
+        is_produced: bool,
+        parameter_values: Mapping[str, float] | None = None,
+    ):
+        return {f"{self.name}.param1": 1.0}
 
 
 class PV(ProductorComponent):
@@ -33,19 +53,81 @@ class PV(ProductorComponent):
         name: str,
         initial_install_cost: float = 0.0,
         maintenance_cost: float = 0.0,
+        production_profile: NDArray[float] | None = None,
+        consumption_profile: NDArray[float] | None = None,
     ):
+        """Constructor.
+
+        Args:
+            name: The name of the component.
+            initial_install_cost: The cost of the installation in euros.
+            maintenance_cost: The cost of the maintenance in euros per year.
+            production_profile: The energy produced in kWh per time step over one
+                year, e.g. hourly, see :mod:`energy_house_cost.time_series`.
+                If ``None``, use a fixed ``auto_consumption_ratio``.
+            consumption_profile: The energy consumed by the house in kWh
+                per time step, used with ``production_profile``
+                to compute the self-consumed and injected energies
+                once, at construction.
+        """
         super().__init__(name, initial_install_cost, maintenance_cost, True)
 
-        self.produced_energy_kwh = 4800.0
+        self.production_profile = production_profile
+        self.consumption_profile = consumption_profile
+        if production_profile is None:
+            self.produced_energy_kwh = 4800.0
+        else:
+            if consumption_profile is None:
+                raise ValueError(
+                    "consumption_profile must be defined with production_profile."
+                )
+            self.produced_energy_kwh = float(asarray(production_profile).sum())
+            # The self-consumption is computed from the profiles.
+            self._uncertain_parameters = {}
+            self_consumed, injected = compute_self_consumption(
+                production_profile, consumption_profile
+            )
+            self.__self_consumed_energy_kwh = float(self_consumed)
+            self.__injected_energy_kwh = float(injected)
 
-    def compute(self, energy_value: float, is_produced: bool):
-        # TODO take into account variation of power per season
+    @property
+    def is_time_resolved(self) -> bool:
+        """Whether the self-consumption is computed from energy profiles."""
+        return self.production_profile is not None
+
+    def compute(
+        self,
+        energy_value: float,
+        is_produced: bool,
+        parameter_values: Mapping[str, ndarray] | None = None,
+    ):
+        if self.is_time_resolved:
+            return -self.__self_consumed_energy_kwh
         return (
-            -self._uncertain_parameters[f"{self.name}.auto_consumption_ratio"].value
+            -self._get_parameter_value("auto_consumption_ratio", parameter_values)
             * self.produced_energy_kwh
         )
 
-    def injected_energy(self):
+    def compute_jacobian(
+        self,
+        energy_value: float,
+        is_produced: bool,
+        parameter_values: Mapping[str, float] | None = None,
+    ):
+        if self.is_time_resolved:
+            return {}
+        return {f"{self.name}.auto_consumption_ratio": -self.produced_energy_kwh}
+
+    def injected_energy(self, parameter_values: Mapping[str, ndarray] | None = None):
+        if self.is_time_resolved:
+            return self.__injected_energy_kwh
         return (
-            1 - self._uncertain_parameters[f"{self.name}.auto_consumption_ratio"].value
+            1 - self._get_parameter_value("auto_consumption_ratio", parameter_values)
         ) * self.produced_energy_kwh
+
+    def injected_energy_jacobian(
+        self, parameter_values: Mapping[str, float] | None = None
+    ):
+        if self.is_time_resolved:
+            return {}
+        return {f"{self.name}.auto_consumption_ratio": -self.produced_energy_kwh}
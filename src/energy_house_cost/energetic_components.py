@@ -1,13 +1,17 @@
 from __future__ import annotations
 
+from copy import copy
 from typing import ClassVar
 from typing import Iterable
 from typing import Mapping
 
+from numpy import ndarray
 
-class EnergeticComponent:
-    from energy_house_cost.uncertain import UncertainParameter
+from energy_house_cost.parameter_store import UncertainParametersMixin
+from energy_house_cost.uncertain import UncertainParameter
 
+
+class EnergeticComponent(UncertainParametersMixin):
     UNCERTAIN_PARAMETERS: ClassVar[Mapping[str:UncertainParameter] | float] = None
 
     # TODO add init args as uncertain parameters
@@ -24,14 +28,20 @@ class EnergeticComponent:
         self.production_over_consumption_ratio = production_over_consumption_ratio
         self._uncertain_parameters = {}
         if self.UNCERTAIN_PARAMETERS is not None:
-            for k in self.UNCERTAIN_PARAMETERS.keys():
-                self._uncertain_parameters[
-                    f"{self.name}.{k}"
-                ] = self.UNCERTAIN_PARAMETERS[k]
-        else:
-            self._uncertain_parameters = {}
+            for k, parameter in self.UNCERTAIN_PARAMETERS.items():
+                name = f"{self.name}.{k}"
+                # The parameters of the class are not shared by its instances.
+                if isinstance(parameter, UncertainParameter):
+                    parameter = copy(parameter)
+                    parameter.name = name
+                self._uncertain_parameters[name] = parameter
 
-    def compute(self, energy_value: float, is_produced: bool) -> float:
+    def compute(
+        self,
+        energy_value: float,
+        is_produced: bool,
+        parameter_values: Mapping[str, ndarray] | None = None,
+    ) -> float | ndarray:
         """Computes the energy consumed based on the energy produced.
 
         Args:
@@ -40,6 +50,8 @@ class EnergeticComponent:
             It is practical since in general, we know the energy produced and
             the efficiency (i.e. :attr:`production_over_consumption_ratio`.
             Otherwise it is considered as consumed by the component.
+            parameter_values: values overriding the ones of the uncertain parameters,
+            e.g. arrays of samples, in which case the energy is an array.
 
         Returns: energy consumed in kWh per year.
         """
@@ -52,7 +64,37 @@ class EnergeticComponent:
         else:
             return energy_value
 
-    def get_summary(self, energy_value: float) -> str:
+    def compute_jacobian(
+        self,
+        energy_value: float,
+        is_produced: bool,
+        parameter_values: Mapping[str, float] | None = None,
+    ) -> dict[str, float]:
+        """Computes the derivatives of :meth:`compute` wrt the uncertain parameters.
+
+        Args:
+            energy_value: energy produced in kWh per year.
+            is_produced: if True the energy is considered produced by the component.
+            parameter_values: values overriding the ones of the uncertain parameters.
+
+        Returns: the non-zero derivatives of the energy consumed in kWh per year
+            per name of parameter.
+        """
+        return {}
+
+    def get_summary(
+        self,
+        energy_value: float,
+        parameter_values: Mapping[str, float] | None = None,
+    ) -> str:
+        """Return a description of the energy of the component.
+
+        Args:
+            energy_value: energy consumed in kWh per year.
+            parameter_values: values overriding the ones of the uncertain parameters.
+
+        Returns: the description.
+        """
         return f"consumed {energy_value} kWh on the grid"
 
     @property
@@ -71,12 +113,32 @@ class ProductorComponent(EnergeticComponent):
         super().__init__(name, initial_install_cost, maintenance_cost, None)
         self.can_inject_energy = can_inject_energy
 
-    def injected_energy(self) -> float:
+    def injected_energy(
+        self, parameter_values: Mapping[str, ndarray] | None = None
+    ) -> float | ndarray:
         return 0.0
 
-    def get_summary(self, energy_value: float) -> str:
+    def injected_energy_jacobian(
+        self, parameter_values: Mapping[str, float] | None = None
+    ) -> dict[str, float]:
+        """Computes the derivatives of :meth:`injected_energy` wrt the parameters.
+
+        Args:
+            parameter_values: values overriding the ones of the uncertain parameters.
+
+        Returns: the non-zero derivatives of the energy injected in kWh per year
+            per name of parameter.
+        """
+        return {}
+
+    def get_summary(
+        self,
+        energy_value: float,
+        parameter_values: Mapping[str, float] | None = None,
+    ) -> str:
         if self.can_inject_energy:
-            inject_energy_msg = f" and sold {self.injected_energy()} kWh"
+            injected_energy = self.injected_energy(parameter_values)
+            inject_energy_msg = f" and sold {injected_energy} kWh"
         else:
             inject_energy_msg = ""
         return f"saved {energy_value} kWh from the grid{inject_energy_msg}"
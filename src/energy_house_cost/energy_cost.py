@@ -1,20 +1,50 @@
 from __future__ import annotations
 
 import json
+from copy import copy
 from pathlib import Path
 from typing import ClassVar
 from typing import Iterable
 from typing import Mapping
 
 import numpy as np
-from matplotlib import pyplot as plt
-from numpy import array
-from numpy import interp
+from numpy import argsort
+from numpy import asarray
+from numpy import ndarray
+from numpy import newaxis
 
+from energy_house_cost.parameter_store import UncertainParametersMixin
+from energy_house_cost.profiles import LinearProfile
+from energy_house_cost.profiles import PiecewiseLinearProfile
+from energy_house_cost.profiles import PowerProfile
+from energy_house_cost.profiles import SeriesProfile
+from energy_house_cost.time_series import compute_yearly_means
+from energy_house_cost.time_series import load_series
 from energy_house_cost.uncertain import UncertainParameter
 
+# The parsed json definitions with the modification times of their files.
+_DEFINITIONS: dict[Path, tuple[int, dict]] = {}
 
-class Component:
+
+def load_definition(data_file_path: Path) -> dict:
+    """Load a json definition, parsed again only when its file is modified.
+
+    Args:
+        data_file_path: The path to the json file.
+
+    Returns:
+        The definition, shared by all the callers and thus not to be modified.
+    """
+    path = Path(data_file_path).resolve()
+    mtime = path.stat().st_mtime_ns
+    definition = _DEFINITIONS.get(path)
+    if definition is None or definition[0] != mtime:
+        with open(path) as data_file:
+            definition = _DEFINITIONS[path] = (mtime, json.load(data_file))
+    return definition[1]
+
+
+class Component(UncertainParametersMixin):
     _uncertain_parameters = None
 
     UNCERTAIN_PARAMETERS: ClassVar[Mapping[str, UncertainParameter] | None] = None
@@ -22,7 +52,7 @@ class Component:
     _RESERVED_KEYS = ["name"]
 
     def __init__(self, data_file_path: Path | None = None):
-        data = json.load(open(data_file_path)) if data_file_path is not None else {}
+        data = load_definition(data_file_path) if data_file_path is not None else {}
         self._data = data
         self._uncertain_parameters = {}
 
@@ -50,6 +80,15 @@ class Component:
             value = v
         return UncertainParameter(name, value, min_value, max_value)
 
+    def __copy__(self) -> Component:
+        """Return a copy sharing the definition, with its own uncertain parameters."""
+        component = object.__new__(self.__class__)
+        component.__dict__.update(self.__dict__)
+        component._uncertain_parameters = {
+            name: copy(param) for name, param in self._uncertain_parameters.items()
+        }
+        return component
+
     @property
     def parameters(self) -> Iterable[UncertainParameter]:
         return self._uncertain_parameters
@@ -58,7 +97,15 @@ class Component:
 class EnergyCostProjection(Component):
     """Estimates the cost of energy in the future."""
 
-    _RESERVED_KEYS = ["name", "energy_name", "profile_type", "points"]
+    _RESERVED_KEYS = [
+        "name",
+        "energy_name",
+        "profile_type",
+        "points",
+        "path",
+        "column",
+        "steps_per_year",
+    ]
 
     def __init__(self, data_file_path: Path, duration_years):
         """Constructor.
@@ -66,105 +113,261 @@ class EnergyCostProjection(Component):
         Args:
             data_file_path: The path to a json file defining the cost.
             duration_years: The number of years over which the cost projection is computed.
+
+        Raises:
+            ValueError: When the profile type is unknown.
         """
         super().__init__(data_file_path)
         self.energy_name = self._data["energy_name"]
         self.duration_years = duration_years
         self.profile_type = self._data["profile_type"]
-        if self.profile_type == "user_points":
+        if self.profile_type == "linear":
+            profile_keys = ["initial_cost_one_kwh", "slope"]
+        elif self.profile_type == "power":
+            profile_keys = ["initial_cost_one_kwh", "percentage_of_increase_per_year"]
+        elif self.profile_type == "user_points":
+            profile_keys = ["initial_cost_one_kwh"]
+            self._profile_years = [0.0]
             for i, p in enumerate(self._data["points"]):
                 param_name = f"{self.name}.point{i}"
                 param = self._parse_single_key(param_name, p)
                 self._uncertain_parameters[param_name] = param
+                profile_keys.append(f"point{i}")
+                self._profile_years.append(p["year"])
+        elif self.profile_type == "series":
+            # The series of prices per kWh is read at the first use of the profile.
+            profile_keys = []
+            self._series_path = Path(data_file_path).parent / self._data["path"]
+        else:
+            raise ValueError(
+                "The profile type should be 'linear', 'power', 'user_points'"
+                " or 'series'."
+            )
 
-    def compute_linear_profile_value(self, year: int):
-        return (
-            self._uncertain_parameters[f"{self.name}.initial_cost_one_kwh"].value
-            + self._uncertain_parameters[f"{self.name}.slope"].value * year
-        )
+        self._profile_keys = profile_keys
+        # The names of the parameters ordered as the values of the profile.
+        if self.profile_type == "user_points":
+            order = argsort(self._profile_years, kind="stable")
+        else:
+            order = range(len(profile_keys))
+        self._profile_value_names = [f"{self.name}.{profile_keys[i]}" for i in order]
+        # The values of the parameters of the cached profile, and the profile.
+        self.__profile = None
 
-    def compute_power_profile_value(self, year: int):
-        return (
-            self._uncertain_parameters[f"{self.name}.initial_cost_one_kwh"].value
-            * (
-                1
-                + 0.01
-                * self._uncertain_parameters[
-                    f"{self.name}.percentage_of_increase_per_year"
-                ].value
+    def __get_profile_values(
+        self, parameter_values: Mapping[str, ndarray] | None
+    ) -> list[ndarray]:
+        """Return the values of the parameters of the profile."""
+        return [
+            asarray(self._get_parameter_value(key, parameter_values))
+            for key in self._profile_keys
+        ]
+
+    def __compile_profile(self, values: list[ndarray]):
+        """Create the profile from the values of its parameters."""
+        if self.profile_type == "linear":
+            return LinearProfile(*values)
+        if self.profile_type == "power":
+            return PowerProfile(*values)
+        if self.profile_type == "series":
+            series = load_series(self._series_path, self._data.get("column"))
+            return SeriesProfile(
+                compute_yearly_means(series, self._data["steps_per_year"])
+            )
+        return PiecewiseLinearProfile.from_points(self._profile_years, values)
+
+    def get_profile(
+        self, parameter_values: Mapping[str, ndarray] | None = None
+    ) -> LinearProfile | PowerProfile | PiecewiseLinearProfile | SeriesProfile:
+        """Return the profile of the price of one kWh.
+
+        The profile defined by scalar values of the parameters is cached
+        until one of these values changes.
+
+        Args:
+            parameter_values: values overriding the ones of the uncertain parameters,
+                e.g. arrays of samples.
+
+        Returns: the profile.
+        """
+        values = self.__get_profile_values(parameter_values)
+        if any(value.ndim for value in values):
+            return self.__compile_profile(values)
+
+        key = tuple(value.item() for value in values)
+        # A local reference, as another thread can replace the cached profile.
+        cached_profile = self.__profile
+        if cached_profile is None or cached_profile[0] != key:
+            cached_profile = self.__profile = (key, self.__compile_profile(values))
+        return cached_profile[1]
+
+    def __check_years(self, profile, last_year: float):
+        """Check that a profile covers the years up to ``last_year``."""
+        if profile.last_year < last_year:
+            raise ValueError(
+                f"Last value of year axis of curve must be greater than arg"
+                f" year_n + 1 which is {last_year}."
             )
-            ** year
-        )
 
-    def __compute_band_value(self, value_start, value_end):
-        return 0.5 * (value_start + value_end)
+    def compute_linear_profile_value(
+        self,
+        year: int | ndarray,
+        parameter_values: Mapping[str, ndarray] | None = None,
+    ):
+        return LinearProfile(
+            asarray(
+                self._get_parameter_value("initial_cost_one_kwh", parameter_values)
+            ),
+            asarray(self._get_parameter_value("slope", parameter_values)),
+        ).compute(asarray(year))
 
-    def compute(self, year_n: int, energy_kwh: float) -> float:
+    def compute_power_profile_value(
+        self,
+        year: int | ndarray,
+        parameter_values: Mapping[str, ndarray] | None = None,
+    ):
+        return PowerProfile(
+            asarray(
+                self._get_parameter_value("initial_cost_one_kwh", parameter_values)
+            ),
+            asarray(
+                self._get_parameter_value(
+                    "percentage_of_increase_per_year", parameter_values
+                )
+            ),
+        ).compute(asarray(year))
+
+    def compute_profile(
+        self,
+        years: ndarray,
+        energy_kwh: float | ndarray,
+        parameter_values: Mapping[str, ndarray] | None = None,
+    ) -> ndarray:
+        """Computes price in euros during several years of a given number of kWh.
+
+        Args:
+            years: numbers of years in the future at which price is computed.
+            energy_kwh: number of kWh for which price is computed,
+                possibly shaped as ``(n_samples,)``.
+            parameter_values: values overriding the ones of the uncertain parameters,
+                possibly shaped as ``(n_samples,)``.
+
+        Returns: price of ``energy_kWh`` of energy per year,
+            shaped as ``(*years.shape)`` or ``(n_samples, *years.shape)``.
+        """
+        years = asarray(years)
+        profile = self.get_profile(parameter_values)
+        self.__check_years(profile, years.max(initial=0))
+
+        # Compute price as the half sum of the price at beginning of the year and
+        # price at the end of the year.
+        price_one_kwh = profile.compute_band_values(years)
+        return asarray(energy_kwh)[(...,) + (newaxis,) * years.ndim] * price_one_kwh
+
+    def compute(
+        self,
+        year_n: int,
+        energy_kwh: float | ndarray,
+        parameter_values: Mapping[str, ndarray] | None = None,
+    ) -> float | ndarray:
         """Computes price in euros during ``year_n`` of a given number of kWh of energy.
 
         Args:
             year_n: number of year in the future at which price is computed.
             energy_kwh: number of kWh for which price is computed.
+            parameter_values: values overriding the ones of the uncertain parameters,
+                e.g. arrays of samples, in which case the price is an array.
 
         Returns: price of ``energy_kWh`` of energy at year ``year_n``.
         """
-        if self.profile_type == "linear":
-            price_one_kwh_january = self.compute_linear_profile_value(year_n)
-            price_one_kwh_december = self.compute_linear_profile_value(year_n + 1)
-            price_one_kwh_at_year_n = self.__compute_band_value(
-                price_one_kwh_january, price_one_kwh_december
-            )
-        elif self.profile_type == "power":
-            price_one_kwh_january = self.compute_power_profile_value(year_n)
-            price_one_kwh_december = self.compute_power_profile_value(year_n + 1)
-            price_one_kwh_at_year_n = self.__compute_band_value(
-                price_one_kwh_january, price_one_kwh_december
-            )
-        elif self.profile_type == "user_points":
-            profile = []
-            profile.append(
-                (0.0, self._uncertain_parameters[f"{self.name}.initial_cost_one_kwh"])
-            )
-            for i, p in enumerate(self._data["points"]):
-                value = self._uncertain_parameters[f"{self.name}.point{i}"]
-                profile.append((p["year"], value))
-            profile_y_values = [v[1].value for v in profile]
-            year_axis = [v[0] for v in profile]
-            if year_axis[-1] < year_n:
-                raise ValueError(
-                    f"Last value of year axis of curve must be greater than arg"
-                    f" year_n + 1 which is {year_n}."
-                )
-            # Compute price as the half sum of the price at beginning of the year and
-            # price at the end of the year.
-            price_one_kwh_january = interp(
-                array([year_n]), year_axis, profile_y_values
-            )[0]
-            price_one_kwh_december = interp(
-                array([year_n + 1]), year_axis, profile_y_values
-            )[0]
-            price_one_kwh_at_year_n = self.__compute_band_value(
-                price_one_kwh_january, price_one_kwh_december
-            )
-        else:
-            raise ValueError(
-                "The profile type should be 'linear', 'power' or 'user_points'."
-            )
+        return self.compute_profile(year_n, energy_kwh, parameter_values)[()]
 
-        return energy_kwh * price_one_kwh_at_year_n
+    def compute_integral(
+        self,
+        duration_years: int,
+        energy_kwh: float | ndarray,
+        parameter_values: Mapping[str, ndarray] | None = None,
+    ) -> float | ndarray:
+        """Computes price in euros of a given number of kWh per year over a period.
 
-    def compute_injected(self, year_n: int, energy_kwh: float) -> float:
+        The price is the sum of the prices computed by :meth:`compute`
+        over the years in ``[0, duration_years)``,
+        in closed form for the linear and power profiles.
+
+        Args:
+            duration_years: the period in years over which the price is integrated.
+            energy_kwh: number of kWh per year for which price is computed.
+            parameter_values: values overriding the ones of the uncertain parameters,
+                e.g. arrays of samples, in which case the price is an array.
+
+        Returns: price of ``energy_kWh`` of energy per year over ``duration_years``.
+        """
+        profile = self.get_profile(parameter_values)
+        self.__check_years(profile, duration_years - 1)
+        price_one_kwh = profile.compute_integral(duration_years)
+        return asarray(energy_kwh * price_one_kwh)[()]
+
+    def compute_profile_jacobian(
+        self,
+        years: ndarray,
+        energy_kwh: float,
+        parameter_values: Mapping[str, float] | None = None,
+    ) -> dict[str, ndarray]:
+        """Computes the derivatives of :meth:`compute_profile` wrt the parameters.
+
+        Args:
+            years: numbers of years in the future at which price is computed,
+                shaped as ``(n_years,)``.
+            energy_kwh: number of kWh for which price is computed.
+            parameter_values: values overriding the ones of the uncertain parameters,
+                which must not be arrays of samples.
+
+        Returns: derivatives of the price per year shaped as ``(n_years,)``
+            per name of parameter of the profile.
+        """
+        years = asarray(years)
+        profile = self.get_profile(parameter_values)
+        self.__check_years(profile, years.max(initial=0))
+        jacobian = profile.compute_band_jacobian(years)
+        return {
+            name: energy_kwh * jacobian[i]
+            for i, name in enumerate(self._profile_value_names)
+        }
+
+    def compute_injected(
+        self,
+        year_n: int,
+        energy_kwh: float | ndarray,
+        parameter_values: Mapping[str, ndarray] | None = None,
+    ) -> float | ndarray:
         return (
-            self._uncertain_parameters[f"{self.name}.injected_price_per_kwh"].value
+            self._get_parameter_value("injected_price_per_kwh", parameter_values)
             * energy_kwh
         )
 
+    def compute_injected_jacobian(
+        self,
+        year_n: int,
+        energy_kwh: float,
+        parameter_values: Mapping[str, float] | None = None,
+    ) -> dict[str, float]:
+        """Computes the derivatives of :meth:`compute_injected` wrt the parameters.
+
+        Args:
+            year_n: number of year in the future at which price is computed.
+            energy_kwh: number of kWh for which price is computed.
+            parameter_values: values overriding the ones of the uncertain parameters.
+
+        Returns: derivatives of the price per name of parameter.
+        """
+        return {f"{self.name}.injected_price_per_kwh": energy_kwh}
+
     def plot(self, nb_years, show=False, save=False):
         if show or save:
+            from matplotlib import pyplot as plt
+
             x = np.linspace(0, nb_years, nb_years + 1)
-            y = np.empty(len(x))
-            for i, year in np.ndenumerate(x):
-                y[i] = self.compute(year, 1)
+            y = self.compute_profile(x, 1.0)
 
             fig, ax = plt.subplots()
             ax.plot(x, y, linewidth=2.0)
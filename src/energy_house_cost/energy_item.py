@@ -1,14 +1,11 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from pprint import pprint
 from typing import Iterable
-from typing import Mapping
-
-from numpy._typing import NDArray
 
 from energy_house_cost.energetic_components import EnergeticComponent
 from energy_house_cost.energy_cost import EnergyCostProjection
+from energy_house_cost.parameter_store import ParameterStore
 
 
 @dataclass
@@ -22,7 +19,18 @@ class EnergyItem:
     component: EnergeticComponent
     energy_cost: EnergyCostProjection
     is_produced: bool = False
-    integrated_cost: float = 0.0
+
+    @property
+    def integrated_cost(self) -> float:
+        """The integrated cost in euros over the duration of the energy cost.
+
+        It is computed from the current values of the uncertain parameters.
+        """
+        from energy_house_cost.evaluation import compute_cost_evolution
+
+        return float(
+            compute_cost_evolution(self, self.energy_cost.duration_years).sum()
+        )
 
     def __repr__(self):
         energy_value = self.component.compute(self.energy_value, self.is_produced)
@@ -41,17 +49,50 @@ def get_uncertain_parameters(energy_items: Iterable[EnergyItem]):
     for e in energy_items:
         uncertain_params.update(e.component._uncertain_parameters)
         uncertain_params.update(e.energy_cost._uncertain_parameters)
-    print("Scenario parameters")
-    pprint(uncertain_params)
     return uncertain_params
 
 
-# TODO prefix uncertain param name to make sure they are unique.
-def set_uncertain_parameters(
-    energy_items: Iterable[EnergyItem], input_data: Mapping[str : NDArray[float]]
+def get_item_dependencies(energy_items: Iterable[EnergyItem]) -> list[frozenset[str]]:
+    """Return the names of the uncertain parameters of every energy item.
+
+    Args:
+        energy_items: The energy items.
+
+    Returns:
+        The names of the parameters of the component and of the energy cost
+        of every energy item.
+    """
+    return [
+        frozenset(item.component._uncertain_parameters).union(
+            item.energy_cost._uncertain_parameters
+        )
+        for item in energy_items
+    ]
+
+
+def create_parameter_store(energy_items: Iterable[EnergyItem]) -> ParameterStore:
+    """Create a store of the uncertain parameters of energy items.
+
+    Args:
+        energy_items: The energy items.
+
+    Returns:
+        The store of the uncertain parameters.
+    """
+    parameter_store = ParameterStore(get_uncertain_parameters(energy_items))
+    resolve_parameter_indices(energy_items, parameter_store)
+    return parameter_store
+
+
+def resolve_parameter_indices(
+    energy_items: Iterable[EnergyItem], parameter_store: ParameterStore
 ):
-    for e in energy_items:
-        for key, param in e.component._uncertain_parameters.items():
-            param.value = input_data[key][0]
-        for key, param in e.energy_cost._uncertain_parameters.items():
-            param.value = input_data[key][0]
+    """Resolve the indices of the parameters of energy items in a store.
+
+    Args:
+        energy_items: The energy items.
+        parameter_store: The store of the uncertain parameters.
+    """
+    for item in energy_items:
+        item.component.resolve_parameter_indices(parameter_store.indices)
+        item.energy_cost.resolve_parameter_indices(parameter_store.indices)
@@ -1,145 +1,338 @@
 from __future__ import annotations
 
-from pprint import pprint
+import logging
 from typing import Iterable
+from typing import Mapping
+from typing import TYPE_CHECKING
 
 import numpy as np
 from gemseo.core.discipline import MDODiscipline
-from matplotlib import pyplot as plt
 from numpy import atleast_1d
+from numpy import atleast_2d
+from numpy import flatnonzero
+from numpy import ndarray
+from numpy.typing import NDArray
 
-from energy_house_cost.energetic_components import ProductorComponent
+from energy_house_cost.cache import compute_fingerprint
+from energy_house_cost.cache import EvaluationCache
 from energy_house_cost.energy_item import EnergyItem
+from energy_house_cost.energy_item import get_item_dependencies
 from energy_house_cost.energy_item import get_uncertain_parameters
-from energy_house_cost.energy_item import set_uncertain_parameters
+from energy_house_cost.energy_item import resolve_parameter_indices
+from energy_house_cost.evaluation import component_integrated_cost  # noqa: F401
+from energy_house_cost.evaluation import compute_cost  # noqa: F401
+from energy_house_cost.evaluation import compute_cost_batch
+from energy_house_cost.evaluation import compute_cost_evolution
+from energy_house_cost.evaluation import compute_cost_evolution_jacobian  # noqa: F401
+from energy_house_cost.evaluation import compute_cost_jacobian
+from energy_house_cost.parameter_store import ParameterStore
+from energy_house_cost.profiling import count
+from energy_house_cost.profiling import timed
+from energy_house_cost.report import DETAILED
+from energy_house_cost.report import format_parameters
+from energy_house_cost.report import log_report
+from energy_house_cost.report import QUIET
+from energy_house_cost.report import ScenarioReport
+
+if TYPE_CHECKING:
+    from energy_house_cost.surrogate import PolynomialSurrogate
+
+LOGGER = logging.getLogger(__name__)
 
 
 class EnergyScenario(MDODiscipline):
-    def __init__(self, energy_items: Iterable[EnergyItem], duration_years: int):
+    """The cost of energy items over a period as a gemseo discipline.
+
+    The outputs are ``"total_cost"``, the flattened ``"cost_per_year_per_component"``
+    shaped as ``(duration_years * n_items,)``, see
+    :meth:`get_cost_per_year_per_component`, and the cost per year of every energy
+    item named after :attr:`cost_output_names`.
+
+    The cost per year of every energy item is memoized between executions,
+    so that only the energy items depending on modified parameters are recomputed.
+    """
+
+    def __init__(
+        self,
+        energy_items: Iterable[EnergyItem],
+        duration_years: int,
+        verbosity: int = QUIET,
+        cache: EvaluationCache | None = None,
+    ):
+        """Constructor.
+
+        Args:
+            energy_items: The energy items.
+            duration_years: The period in years over which the cost is computed.
+            verbosity: The verbosity level of the log of every execution,
+                see :mod:`energy_house_cost.report`.
+            cache: The cache of the outputs, possibly shared by several scenarios.
+                The configuration of the scenario must not change once created.
+                If ``None``, do not cache the outputs.
+        """
         super().__init__("energy_scenario", grammar_type="SimpleGrammar")
         self.duration_years = duration_years
+        self.verbosity = verbosity
+        # Not self.cache, which is the cache of the inputs and outputs of gemseo.
+        self.evaluation_cache = cache
         self._energy_items = energy_items
+        if cache is not None:
+            self.__fingerprint = compute_fingerprint(energy_items, duration_years)
+        self.__last_result = None
+        uncertain_parameters = get_uncertain_parameters(energy_items)
+        if verbosity >= DETAILED:
+            LOGGER.info("%s", format_parameters(uncertain_parameters))
+        self.parameter_store = ParameterStore(uncertain_parameters)
+        resolve_parameter_indices(energy_items, self.parameter_store)
+        # Whether the energy items depend on the parameters,
+        # shaped as (n_items, n_parameters).
+        self.__dependencies = np.zeros(
+            (len(energy_items), self.parameter_store.size), dtype=bool
+        )
+        for i, names in enumerate(get_item_dependencies(energy_items)):
+            self.__dependencies[
+                i, [self.parameter_store.indices[name] for name in names]
+            ] = True
+        self.__item_costs = np.empty((duration_years, len(energy_items)))
+        self.__item_total_costs = np.empty(len(energy_items))
+        self.__item_values = None
         input_data = {}
-        for name, param in get_uncertain_parameters(energy_items).items():
-            input_data.update({name: atleast_1d(param.value)})
+        for name, value in zip(
+            self.parameter_store.names, self.parameter_store.default_values
+        ):
+            input_data.update({name: atleast_1d(value)})
         self.input_grammar.update_from_data(input_data)
         self.default_inputs = input_data
-        # self.output_grammar.update({"total_cost": float,
-        # "cost_per_year_per_component": list})
-        self.output_grammar.update_from_data({"total_cost": atleast_1d(0.0)})
+        self.cost_output_names = []
+        for item in energy_items:
+            name = f"cost.{item.component.name}"
+            if name in self.cost_output_names:
+                name = f"{name}.{len(self.cost_output_names)}"
+            self.cost_output_names.append(name)
+        output_data = {
+            "total_cost": atleast_1d(0.0),
+            "cost_per_year_per_component": np.zeros(duration_years * len(energy_items)),
+        }
+        for name in self.cost_output_names:
+            output_data[name] = np.zeros(duration_years)
+        self.output_grammar.update_from_data(output_data)
+
+    def execute(self, input_data=None):
+        with timed("scenario.execute"):
+            return super().execute(input_data)
 
     def _run(self):
-        input_data = self.get_input_data()
-        set_uncertain_parameters(self._energy_items, input_data)
-        total_cost, cost_per_year_per_component = compute_cost(
-            self._energy_items, self.duration_years
+        with timed("scenario.run"):
+            self.__run()
+
+    def __run(self):
+        with timed("scenario.update_parameters"):
+            self.parameter_store.update(self.get_input_data())
+        if self.evaluation_cache is None:
+            total_cost, cost_per_year_per_component = self.__compute_cost()
+        else:
+            key = self.evaluation_cache.compute_key(
+                self.__fingerprint, self.parameter_store.values
+            )
+            with timed("scenario.cache"):
+                outputs = self.evaluation_cache.get(key)
+            if outputs is None:
+                total_cost, cost_per_year_per_component = self.__compute_cost()
+                self.evaluation_cache.set(key, total_cost, cost_per_year_per_component)
+            else:
+                total_cost = outputs[0]
+                cost_per_year_per_component = (
+                    outputs[1].reshape(self.duration_years, -1).copy()
+                )
+
+        output_data = {
+            "total_cost": atleast_1d(total_cost),
+            "cost_per_year_per_component": cost_per_year_per_component.ravel(),
+        }
+        for name, cost_evolution in zip(
+            self.cost_output_names, cost_per_year_per_component.T
+        ):
+            output_data[name] = cost_evolution
+        with timed("scenario.store_outputs"):
+            self.store_local_data(**output_data)
+        self.__last_result = (
+            total_cost,
+            cost_per_year_per_component,
+            self.parameter_store.values.copy(),
         )
-        # self.store_local_data(**{"total_cost": total_cost,
-        #     "cost_per_year_per_component": cost_per_year_per_component})
-        self.store_local_data(**{"total_cost": atleast_1d(total_cost)})
+        if self.verbosity > QUIET:
+            log_report(self.get_report(), self.verbosity)
+
+    def __compute_cost(self) -> tuple[float, ndarray]:
+        """Compute the cost, recomputing only the items with modified parameters."""
+        values = self.parameter_store.values
+        if self.__item_values is None:
+            dirty_items = range(len(self._energy_items))
+        else:
+            dirty_items = flatnonzero(
+                self.__dependencies[:, values != self.__item_values].any(axis=1)
+            )
+        count("scenario.recomputed_items", len(dirty_items))
+        parameter_values = self.parameter_store.get_parameter_values()
+        for i in dirty_items:
+            item = self._energy_items[i]
+            with timed("item_cost", item.component.name):
+                cost_evolution = compute_cost_evolution(
+                    item, self.duration_years, parameter_values
+                )
+            self.__item_costs[:, i] = cost_evolution
+            self.__item_total_costs[i] = cost_evolution.sum()
+        self.__item_values = values.copy()
+        return self.__item_total_costs.sum(), self.__item_costs.copy()
 
+    def clear_item_costs(self):
+        """Forget the memoized costs of the energy items.
 
-def component_integrated_cost(
-    energy_item: EnergyItem, duration_years: int
-) -> tuple(float, Iterable[float]):
-    """Computes the integrated cost in euros over ``duration_years`` of an energy item.
+        To be called after modifying the configuration of the energy items.
+        """
+        self.__item_values = None
 
-    Args:
-        energy_item: an energy item (hot water, heating, electricity equipments etc...)
-        duration_years: the period in years over which the cost is computed.
+    def _compute_jacobian(self, inputs=None, outputs=None):
+        self.parameter_store.update(self.get_input_data())
+        self._init_jacobian(inputs, outputs, with_zeros=True)
+        cost_output_indices = {name: i for i, name in enumerate(self.cost_output_names)}
+        for name, derivative in compute_cost_jacobian(
+            self._energy_items,
+            self.duration_years,
+            self.parameter_store.get_parameter_values(),
+        ).items():
+            for output_name, jacobian in self.jac.items():
+                if name not in jacobian:
+                    continue
+                if output_name == "total_cost":
+                    jacobian[name] = atleast_2d(derivative.sum())
+                elif output_name == "cost_per_year_per_component":
+                    jacobian[name] = derivative.reshape(-1, 1)
+                else:
+                    i = cost_output_indices[output_name]
+                    jacobian[name] = derivative[:, [i]]
 
-    Returns:
-        total_cost: the integrated cost in euros of an energy item over ``duration_years``.
-        cost_evolution: the cost in euros per year of an energy item.
-    """
-    energy_kwh = energy_item.component.compute(
-        energy_item.energy_value, energy_item.is_produced
-    )
-    cost_evolution = np.zeros(duration_years)
-
-    for year in range(0, duration_years):
-        cost_evolution[year] = energy_item.energy_cost.compute(year, energy_kwh)
-        if isinstance(energy_item.component, ProductorComponent):
-            energy_kwh_injected = energy_item.component.injected_energy()
-            cost_evolution[year] -= energy_item.energy_cost.compute_injected(
-                year, energy_kwh_injected
-            )
-        if year > 0:
-            cost_evolution[year] += energy_item.component.maintenance_cost_per_year
-    cost_evolution[0] += energy_item.component.initial_install_cost
-
-    total_cost = np.sum(cost_evolution)
-    energy_item.integrated_cost = total_cost
-
-    return total_cost, cost_evolution
-
-
-def plot_integrated_cost_per_component(
-    component_names, cost_per_year_per_component, duration_years
-):
-    columns = component_names
-    columns = tuple(columns)
-    rows = np.linspace(0, duration_years - 1, duration_years)
-
-    # Get some pastel shades for the colors
-    colors = plt.cm.BuPu(np.linspace(0.1, 0.5, len(rows)))
-    n_rows = len(cost_per_year_per_component)
-
-    index = np.arange(len(columns)) + 0.3
-    bar_width = 0.4
-
-    # Initialize the vertical-offset for the stacked bar chart.
-    y_offset = np.zeros(len(columns))
-
-    # Plot bars and create text labels for the table
-    cell_text = []
-    for row in range(n_rows):
-        plt.bar(
-            index,
-            cost_per_year_per_component[row],
-            bar_width,
-            bottom=y_offset,
-            color=colors[row],
+    def get_cost_per_year_per_component(
+        self, output_data: Mapping[str, ndarray] | None = None
+    ) -> ndarray:
+        """Return the cost per year and per energy item from the output data.
+
+        Args:
+            output_data: The output data,
+                e.g. the ones of a sample of a DOE dataset.
+                If ``None``, use the output data of the last execution.
+
+        Returns:
+            The cost in euros shaped as ``(duration_years, n_items)``,
+            whose columns are ordered as :attr:`cost_output_names`.
+        """
+        if output_data is None:
+            output_data = self.get_output_data()
+        return np.reshape(
+            output_data["cost_per_year_per_component"],
+            (self.duration_years, len(self.cost_output_names)),
         )
-        y_offset = y_offset + cost_per_year_per_component[row]
-        cell_text.append(["%1.1f" % (x / 1) for x in y_offset])
-    # Reverse colors and text labels to display the last value at the top.
-    colors = colors[::-1]
-    rows = rows[::-1]
-    cell_text.reverse()
-
-    # Add a table at the bottom of the axes
-    plt.table(
-        cellText=cell_text,
-        rowLabels=rows,
-        rowColours=colors,
-        colLabels=columns,
-        loc="bottom",
-    )
-
-    # Adjust layout to make room for the table:
-    plt.subplots_adjust(left=0.2, bottom=0.5)
-
-    plt.ylabel("Cost in euros")
-    # plt.yticks(values * value_increment, ['%d' % val for val in values])
-    plt.xticks([])
-    plt.title("Integrated cost by component")
-
-    plt.show()
-
-
-def compute_cost(energy_items: Iterable[EnergyItem], duration_years: int):
-    total_cost = 0.0
-    cost_per_year_per_component = np.empty((duration_years, len(energy_items)))
-    for i, item in enumerate(energy_items):
-        (
-            total_cost_of_component,
-            cost_evolution_of_component,
-        ) = component_integrated_cost(item, duration_years)
-        cost_per_year_per_component[:, i] = cost_evolution_of_component
-        total_cost += total_cost_of_component
-    print(f"Integrated cost is {total_cost} euros over {duration_years} years.")
-    print("Detailed cost in kWh per year")
-    pprint([i for i in energy_items])
-
-    return total_cost, cost_per_year_per_component
+
+    def get_report(self) -> ScenarioReport:
+        """Return the report of the last execution.
+
+        Returns:
+            The report of the last execution.
+
+        Raises:
+            ValueError: When the scenario has not been executed.
+        """
+        if self.__last_result is None:
+            raise ValueError("The scenario has not been executed.")
+        total_cost, cost_per_year_per_component, values = self.__last_result
+        return ScenarioReport(
+            self._energy_items,
+            self.duration_years,
+            total_cost,
+            cost_per_year_per_component,
+            self.parameter_store.get_parameter_values(values),
+        )
+
+    def compute_batch(
+        self, samples: Mapping[str, NDArray[float]] | NDArray[float]
+    ) -> tuple[ndarray, ndarray]:
+        """Compute the cost of the scenario for many samples at once.
+
+        The uncertain parameters of the energy items are not modified.
+
+        Args:
+            samples: The samples shaped as ``(n_samples,)`` per parameter name,
+                the parameters missing from ``samples`` keeping their default value,
+                or a sample matrix shaped as ``(n_samples, n_parameters)``
+                whose columns are ordered as :attr:`parameter_store.names`,
+                or a single sample shaped as ``(n_parameters,)``.
+
+        Returns:
+            total_cost: the integrated cost in euros per sample,
+                shaped as ``(n_samples,)``.
+            cost_per_year_per_component: the cost in euros per sample, per year and
+                per energy item, shaped as ``(n_samples, duration_years, n_items)``.
+
+        Raises:
+            ValueError: When the sample matrix has not ``n_parameters`` columns
+                or when a value is out of the bounds of its parameter.
+        """
+        return compute_cost_batch(
+            self._energy_items, self.duration_years, samples, self.parameter_store
+        )
+
+
+class SurrogateScenario(MDODiscipline):
+    """A surrogate of an energy scenario as a gemseo discipline.
+
+    The inputs and outputs are the ones of :class:`.EnergyScenario`.
+    """
+
+    def __init__(self, surrogate: PolynomialSurrogate):
+        """Constructor.
+
+        Args:
+            surrogate: The fitted surrogate.
+        """
+        super().__init__("energy_scenario_surrogate", grammar_type="SimpleGrammar")
+        self.surrogate = surrogate
+        self.duration_years = surrogate.duration_years
+        self.cost_output_names = list(surrogate.cost_output_names)
+        input_data = {
+            name: atleast_1d(value)
+            for name, value in zip(surrogate.input_names, surrogate.default_values)
+        }
+        self.input_grammar.update_from_data(input_data)
+        self.default_inputs = input_data
+        output_data = {
+            "total_cost": atleast_1d(0.0),
+            "cost_per_year_per_component": np.zeros(
+                self.duration_years * len(self.cost_output_names)
+            ),
+        }
+        for name in self.cost_output_names:
+            output_data[name] = np.zeros(self.duration_years)
+        self.output_grammar.update_from_data(output_data)
+
+    def _run(self):
+        input_data = self.get_input_data()
+        inputs = np.array([input_data[name][0] for name in self.surrogate.input_names])
+        total_cost, cost_per_year_per_component = self.surrogate.predict(inputs)
+        output_data = {
+            "total_cost": total_cost,
+            "cost_per_year_per_component": cost_per_year_per_component.ravel(),
+        }
+        for name, cost_evolution in zip(
+            self.cost_output_names, cost_per_year_per_component[0].T
+        ):
+            output_data[name] = cost_evolution
+        self.store_local_data(**output_data)
+
+
+def __getattr__(name: str):
+    # The plotting functions import matplotlib only when used.
+    if name == "plot_integrated_cost_per_component":
+        from energy_house_cost.plotting import plot_integrated_cost_per_component
+
+        return plot_integrated_cost_per_component
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
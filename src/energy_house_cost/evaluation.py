@@ -0,0 +1,264 @@
+from __future__ import annotations
+
+from typing import Iterable
+from typing import Mapping
+
+import numpy as np
+from numpy import broadcast_to
+from numpy import ndarray
+from numpy.typing import NDArray
+
+from energy_house_cost.energetic_components import ProductorComponent
+from energy_house_cost.energy_item import create_parameter_store
+from energy_house_cost.energy_item import EnergyItem
+from energy_house_cost.parameter_store import ParameterStore
+from energy_house_cost.profiling import timed
+
+
+def compute_cost_evolution(
+    energy_item: EnergyItem,
+    duration_years: int,
+    parameter_values: Mapping[str, ndarray] | None = None,
+    price_one_kwh: ndarray | None = None,
+) -> ndarray:
+    """Computes the cost in euros per year of an energy item.
+
+    Args:
+        energy_item: an energy item (hot water, heating, electricity equipments etc...)
+        duration_years: the period in years over which the cost is computed.
+        parameter_values: values overriding the ones of the uncertain parameters,
+            shaped as ``(n_samples,)`` per parameter name.
+        price_one_kwh: the price of one kWh of the energy cost of the item per year,
+            computed from ``parameter_values``, e.g. to share it between items.
+            If ``None``, compute it.
+
+    Returns:
+        The cost in euros per year, shaped as ``(duration_years,)``
+        or ``(n_samples, duration_years)`` when ``parameter_values`` are samples
+        or when the attributes of the energy item are arrays of ``n_samples`` values.
+    """
+    energy_kwh = energy_item.component.compute(
+        energy_item.energy_value, energy_item.is_produced, parameter_values
+    )
+    years = np.arange(duration_years)
+    if price_one_kwh is None:
+        cost_evolution = energy_item.energy_cost.compute_profile(
+            years, energy_kwh, parameter_values
+        )
+    else:
+        cost_evolution = np.asarray(energy_kwh)[..., np.newaxis] * price_one_kwh
+    if isinstance(energy_item.component, ProductorComponent):
+        energy_kwh_injected = energy_item.component.injected_energy(parameter_values)
+        cost_evolution = (
+            cost_evolution
+            - np.asarray(
+                energy_item.energy_cost.compute_injected(
+                    years, energy_kwh_injected, parameter_values
+                )
+            )[..., np.newaxis]
+        )
+
+    # The costs of the component can be arrays, e.g. one value per house of a fleet.
+    maintenance_cost = np.asarray(energy_item.component.maintenance_cost_per_year)
+    initial_install_cost = np.asarray(energy_item.component.initial_install_cost)
+    component_cost = np.empty(
+        np.broadcast_shapes(maintenance_cost.shape, initial_install_cost.shape)
+        + (duration_years,)
+    )
+    component_cost[..., 0] = initial_install_cost
+    component_cost[..., 1:] = maintenance_cost[..., np.newaxis]
+    return cost_evolution + component_cost
+
+
+def compute_cost_evolution_jacobian(
+    energy_item: EnergyItem,
+    duration_years: int,
+    parameter_values: Mapping[str, float] | None = None,
+) -> dict[str, ndarray]:
+    """Computes the derivatives of the cost in euros per year of an energy item.
+
+    Args:
+        energy_item: an energy item (hot water, heating, electricity equipments etc...)
+        duration_years: the period in years over which the cost is computed.
+        parameter_values: values overriding the ones of the uncertain parameters,
+            which must not be arrays of samples.
+
+    Returns:
+        The non-zero derivatives of the cost per year shaped as ``(duration_years,)``
+        per name of parameter.
+    """
+    component = energy_item.component
+    energy_cost = energy_item.energy_cost
+    years = np.arange(duration_years)
+    energy_kwh = component.compute(
+        energy_item.energy_value, energy_item.is_produced, parameter_values
+    )
+    jacobian = energy_cost.compute_profile_jacobian(years, energy_kwh, parameter_values)
+    energy_jacobian = component.compute_jacobian(
+        energy_item.energy_value, energy_item.is_produced, parameter_values
+    )
+    if energy_jacobian:
+        price_one_kwh = energy_cost.compute_profile(years, 1.0, parameter_values)
+        for name, derivative in energy_jacobian.items():
+            jacobian[name] = jacobian.get(name, 0.0) + derivative * price_one_kwh
+
+    if isinstance(component, ProductorComponent):
+        energy_kwh_injected = component.injected_energy(parameter_values)
+        injected_jacobian = energy_cost.compute_injected_jacobian(
+            years, energy_kwh_injected, parameter_values
+        )
+        price_one_kwh_injected = energy_cost.compute_injected(
+            years, 1.0, parameter_values
+        )
+        for name, derivative in component.injected_energy_jacobian(
+            parameter_values
+        ).items():
+            injected_jacobian[name] = (
+                injected_jacobian.get(name, 0.0) + derivative * price_one_kwh_injected
+            )
+        for name, derivative in injected_jacobian.items():
+            jacobian[name] = jacobian.get(name, 0.0) - derivative
+
+    return {
+        name: np.broadcast_to(derivative, (duration_years,))
+        for name, derivative in jacobian.items()
+    }
+
+
+def component_integrated_cost(
+    energy_item: EnergyItem,
+    duration_years: int,
+    parameter_values: Mapping[str, float] | None = None,
+) -> tuple[float, ndarray]:
+    """Computes the integrated cost in euros over ``duration_years`` of an energy item.
+
+    Args:
+        energy_item: an energy item (hot water, heating, electricity equipments etc...)
+        duration_years: the period in years over which the cost is computed.
+        parameter_values: values overriding the ones of the uncertain parameters.
+
+    Returns:
+        total_cost: the integrated cost in euros of an energy item over ``duration_years``.
+        cost_evolution: the cost in euros per year of an energy item.
+    """
+    cost_evolution = compute_cost_evolution(
+        energy_item, duration_years, parameter_values
+    )
+    return np.sum(cost_evolution), cost_evolution
+
+
+def compute_cost(
+    energy_items: Iterable[EnergyItem],
+    duration_years: int,
+    parameter_values: Mapping[str, float] | None = None,
+) -> tuple[float, ndarray]:
+    """Computes the cost of energy items.
+
+    Args:
+        energy_items: the energy items.
+        duration_years: the period in years over which the cost is computed.
+        parameter_values: values overriding the ones of the uncertain parameters.
+
+    Returns:
+        total_cost: the integrated cost in euros of the energy items
+            over ``duration_years``.
+        cost_per_year_per_component: the cost in euros per year and per energy item,
+            shaped as ``(duration_years, n_items)``.
+    """
+    total_cost = 0.0
+    cost_per_year_per_component = np.empty((duration_years, len(energy_items)))
+    for i, item in enumerate(energy_items):
+        with timed("item_cost", item.component.name):
+            (
+                total_cost_of_component,
+                cost_evolution_of_component,
+            ) = component_integrated_cost(item, duration_years, parameter_values)
+        cost_per_year_per_component[:, i] = cost_evolution_of_component
+        total_cost += total_cost_of_component
+
+    return total_cost, cost_per_year_per_component
+
+
+def compute_cost_batch(
+    energy_items: Iterable[EnergyItem],
+    duration_years: int,
+    samples: Mapping[str, NDArray[float]] | NDArray[float],
+    parameter_store: ParameterStore | None = None,
+) -> tuple[ndarray, ndarray]:
+    """Computes the cost of energy items for many samples of their parameters.
+
+    The uncertain parameters of the energy items are not modified.
+
+    Args:
+        energy_items: the energy items.
+        duration_years: the period in years over which the cost is computed.
+        samples: the samples shaped as ``(n_samples,)`` per parameter name,
+            the parameters missing from ``samples`` keeping their default value,
+            or a sample matrix shaped as ``(n_samples, n_parameters)``
+            whose columns are ordered as the names of ``parameter_store``,
+            used without copy,
+            or a single sample shaped as ``(n_parameters,)``.
+        parameter_store: the store of the uncertain parameters of the energy items.
+            If ``None``, create it from the energy items.
+
+    Returns:
+        total_cost: the integrated cost in euros per sample, shaped as ``(n_samples,)``.
+        cost_per_year_per_component: the cost in euros per sample, per year and
+            per energy item, shaped as ``(n_samples, duration_years, n_items)``.
+
+    Raises:
+        ValueError: When the sample matrix has not ``n_parameters`` columns
+            or when a value is out of the bounds of its parameter.
+    """
+    if parameter_store is None:
+        parameter_store = create_parameter_store(energy_items)
+    if isinstance(samples, Mapping):
+        samples = parameter_store.to_array(samples)
+    else:
+        samples = np.atleast_2d(samples)
+        if samples.ndim != 2 or samples.shape[1] != parameter_store.size:
+            raise ValueError(
+                f"The samples should be shaped as (n_samples, {parameter_store.size}),"
+                f" got {samples.shape}."
+            )
+    parameter_values = parameter_store.get_parameter_values(samples)
+    n_samples = len(parameter_values.values)
+    cost_per_year_per_component = np.empty(
+        (n_samples, duration_years, len(energy_items))
+    )
+    for i, item in enumerate(energy_items):
+        with timed("item_cost_batch", item.component.name):
+            cost_per_year_per_component[:, :, i] = broadcast_to(
+                compute_cost_evolution(item, duration_years, parameter_values),
+                (n_samples, duration_years),
+            )
+    total_cost = cost_per_year_per_component.sum(axis=1).sum(axis=1)
+    return total_cost, cost_per_year_per_component
+
+
+def compute_cost_jacobian(
+    energy_items: Iterable[EnergyItem],
+    duration_years: int,
+    parameter_values: Mapping[str, float] | None = None,
+) -> dict[str, ndarray]:
+    """Computes the derivatives of the cost per year and per energy item.
+
+    Args:
+        energy_items: the energy items.
+        duration_years: the period in years over which the cost is computed.
+        parameter_values: values overriding the ones of the uncertain parameters,
+            which must not be arrays of samples.
+
+    Returns:
+        The non-zero derivatives of ``cost_per_year_per_component``
+        shaped as ``(duration_years, n_items)`` per name of parameter.
+    """
+    jacobian = {}
+    for i, item in enumerate(energy_items):
+        for name, derivative in compute_cost_evolution_jacobian(
+            item, duration_years, parameter_values
+        ).items():
+            if name not in jacobian:
+                jacobian[name] = np.zeros((duration_years, len(energy_items)))
+            jacobian[name][:, i] = derivative
+    return jacobian
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from typing import Mapping
+from typing import Sequence
+
+from numpy import asarray
+from numpy import ndarray
+from numpy import stack
+from numpy.typing import NDArray
+
+from energy_house_cost.energy_item import create_parameter_store
+from energy_house_cost.energy_item import EnergyItem
+from energy_house_cost.evaluation import compute_cost
+
+
+class ThreadedEvaluator:
+    """An evaluator of energy items safe to call from several threads.
+
+    An evaluation reads the values of all the parameters from its arguments,
+    the missing ones taking the values of the parameters
+    when the evaluator was created,
+    and modifies neither the energy items nor their uncertain parameters.
+    The energy items must not be modified while the evaluator is used.
+    """
+
+    def __init__(
+        self,
+        energy_items: Sequence[EnergyItem],
+        duration_years: int,
+        n_workers: int | None = None,
+    ):
+        """Constructor.
+
+        Args:
+            energy_items: The energy items.
+            duration_years: The period in years over which the cost is computed.
+            n_workers: The number of threads of the pool.
+                If ``None``, use the default of :class:`.ThreadPoolExecutor`.
+        """
+        self.energy_items = energy_items
+        self.duration_years = duration_years
+        self.parameter_store = create_parameter_store(energy_items)
+        self.__executor = ThreadPoolExecutor(n_workers)
+
+    def evaluate(
+        self, parameter_values: Mapping[str, float] | NDArray[float]
+    ) -> tuple[float, ndarray]:
+        """Evaluate the energy items in the current thread.
+
+        Args:
+            parameter_values: The values of the uncertain parameters,
+                the missing ones keeping their default value,
+                or the values of all of them shaped as ``(n_parameters,)``
+                and ordered as :attr:`parameter_store.names`.
+
+        Returns:
+            total_cost: The integrated cost in euros.
+            cost_per_year_per_component: The cost in euros
+                shaped as ``(duration_years, n_items)``.
+
+        Raises:
+            ValueError: When a parameter is unknown or out of its bounds.
+        """
+        if isinstance(parameter_values, Mapping):
+            values = self.parameter_store.to_array(parameter_values)[0]
+        else:
+            values = asarray(parameter_values, dtype=float)
+        self.parameter_store.check(values)
+        return compute_cost(
+            self.energy_items,
+            self.duration_years,
+            self.parameter_store.get_parameter_values(values),
+        )
+
+    def submit(
+        self, parameter_values: Mapping[str, float] | NDArray[float]
+    ) -> Future[tuple[float, ndarray]]:
+        """Evaluate the energy items in a thread of the pool.
+
+        Args:
+            parameter_values: The values of the uncertain parameters,
+                see :meth:`evaluate`.
+
+        Returns:
+            The future result of :meth:`evaluate`.
+        """
+        return self.__executor.submit(self.evaluate, parameter_values)
+
+    def map(self, samples: NDArray[float]) -> tuple[ndarray, ndarray]:
+        """Evaluate the energy items for many samples with the threads of the pool.
+
+        Args:
+            samples: The samples shaped as ``(n_samples, n_parameters)``
+                whose columns are ordered as :attr:`parameter_store.names`.
+
+        Returns:
+            total_cost: The integrated cost in euros shaped as ``(n_samples,)``.
+            cost_per_year_per_component: The cost in euros
+                shaped as ``(n_samples, duration_years, n_items)``.
+        """
+        total_cost, cost_per_year_per_component = zip(
+            *self.__executor.map(self.evaluate, samples)
+        )
+        return asarray(total_cost), stack(cost_per_year_per_component)
+
+    def shutdown(self):
+        """Wait for the evaluations in progress and stop the threads."""
+        self.__executor.shutdown()
+
+    def __enter__(self) -> ThreadedEvaluator:
+        return self
+
+    def __exit__(self, *args):
+        self.shutdown()
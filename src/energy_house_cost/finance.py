@@ -0,0 +1,310 @@
+from __future__ import annotations
+
+from typing import Mapping
+from typing import Sequence
+
+from numpy import arange
+from numpy import asarray
+from numpy import broadcast_arrays
+from numpy import cumsum
+from numpy import diff
+from numpy import floor
+from numpy import ndarray
+from numpy import newaxis
+from numpy import stack
+from numpy import where
+from numpy import zeros
+from numpy.typing import NDArray
+
+from energy_house_cost.energy_item import EnergyItem
+from energy_house_cost.energy_item import get_uncertain_parameters
+from energy_house_cost.evaluation import compute_cost_batch
+from energy_house_cost.parameter_store import ParameterStore
+from energy_house_cost.uncertain import UncertainParameter
+
+
+class FinancialModel:
+    """The discounted cash flows of the cost of energy items.
+
+    The installation of a component can be subsidized, replaced at the end of its
+    lifetime and financed by a loan repaid by constant annuities.
+    The discount rate, the lifetimes and the loan rates are uncertain parameters
+    named ``"{name}.discount_rate"``, ``"{name}.{component}.lifetime_years"``
+    and ``"{name}.{component}.loan_rate"``,
+    which can be sampled with the parameters of the energy items.
+    The cash flows beyond the period over which the cost is computed are ignored.
+    """
+
+    def __init__(
+        self,
+        discount_rate: float = 0.0,
+        min_discount_rate: float | None = None,
+        max_discount_rate: float | None = None,
+        name: str = "finance",
+    ):
+        """Constructor.
+
+        Args:
+            discount_rate: The discount rate per year.
+            min_discount_rate: The minimum discount rate per year, if uncertain.
+            max_discount_rate: The maximum discount rate per year, if uncertain.
+            name: The name of the model, prefixing the names of its parameters.
+        """
+        self.name = name
+        self._uncertain_parameters = {}
+        self.__lifetimes = {}
+        self.__loans = {}
+        self.__subsidies = {}
+        self.__add_parameter(
+            "discount_rate", discount_rate, min_discount_rate, max_discount_rate
+        )
+
+    @property
+    def parameters(self) -> Mapping[str, UncertainParameter]:
+        return self._uncertain_parameters
+
+    def __add_parameter(
+        self,
+        name: str,
+        value: float,
+        min_value: float | None,
+        max_value: float | None,
+    ) -> str:
+        """Add an uncertain parameter and return its full name."""
+        name = f"{self.name}.{name}"
+        self._uncertain_parameters[name] = UncertainParameter(
+            name, value, min_value, max_value
+        )
+        return name
+
+    def set_lifetime(
+        self,
+        component_name: str,
+        lifetime_years: float,
+        min_value: float | None = None,
+        max_value: float | None = None,
+    ):
+        """Replace a component at the end of its lifetime.
+
+        Args:
+            component_name: The name of the component.
+            lifetime_years: The lifetime in years.
+            min_value: The minimum lifetime in years, if uncertain.
+            max_value: The maximum lifetime in years, if uncertain.
+
+        Raises:
+            ValueError: When the lifetime or its minimum is not positive.
+        """
+        for value in (lifetime_years, min_value):
+            if value is not None and value <= 0:
+                raise ValueError(
+                    f"The lifetime of {component_name} should be positive,"
+                    f" got {value}."
+                )
+        self.__lifetimes[component_name] = self.__add_parameter(
+            f"{component_name}.lifetime_years", lifetime_years, min_value, max_value
+        )
+
+    def set_loan(
+        self,
+        component_name: str,
+        duration_years: int,
+        rate: float,
+        min_rate: float | None = None,
+        max_rate: float | None = None,
+    ):
+        """Finance the installations of a component by loans.
+
+        Every installation is repaid by constant annuities
+        from the year of the installation.
+
+        Args:
+            component_name: The name of the component.
+            duration_years: The number of annuities.
+            rate: The interest rate per year.
+            min_rate: The minimum interest rate per year, if uncertain.
+            max_rate: The maximum interest rate per year, if uncertain.
+
+        Raises:
+            ValueError: When the number of annuities is lower than 1.
+        """
+        if duration_years < 1:
+            raise ValueError(
+                f"The loan of {component_name} should have at least one annuity,"
+                f" got {duration_years}."
+            )
+        self.__loans[component_name] = (
+            duration_years,
+            self.__add_parameter(
+                f"{component_name}.loan_rate", rate, min_rate, max_rate
+            ),
+        )
+
+    def set_subsidy(self, component_name: str, amount: float):
+        """Subsidize the first installation of a component.
+
+        Args:
+            component_name: The name of the component.
+            amount: The subsidy in euros.
+        """
+        self.__subsidies[component_name] = amount
+
+    def __get_value(
+        self, name: str, parameter_values: Mapping[str, ndarray] | None
+    ) -> ndarray:
+        if parameter_values is not None and name in parameter_values:
+            return asarray(parameter_values[name])
+        return asarray(self._uncertain_parameters[name].value)
+
+    def compute_cash_flows(
+        self,
+        energy_items: Sequence[EnergyItem],
+        cost_per_year_per_component: NDArray[float],
+        parameter_values: Mapping[str, ndarray] | None = None,
+    ) -> ndarray:
+        """Compute the discounted cash flows of energy items.
+
+        Args:
+            energy_items: The energy items.
+            cost_per_year_per_component: The nominal cost in euros,
+                including the installations at year 0,
+                shaped as ``(duration_years, n_items)``
+                or ``(n_samples, duration_years, n_items)``.
+            parameter_values: Values overriding the ones of the uncertain parameters,
+                possibly shaped as ``(n_samples,)``.
+
+        Returns:
+            The discounted cash flows in euros
+            shaped as ``(duration_years, n_items)``
+            or ``(n_samples, duration_years, n_items)``.
+        """
+        cash_flows = asarray(cost_per_year_per_component, dtype=float)
+        duration_years = cash_flows.shape[-2]
+        years = arange(duration_years)
+        cash_flows_per_item = []
+        for i, item in enumerate(energy_items):
+            component = item.component
+            install_cost = component.initial_install_cost
+            subsidy = self.__subsidies.get(component.name, 0.0)
+            lifetime_name = self.__lifetimes.get(component.name)
+            loan = self.__loans.get(component.name)
+            cash_flow = cash_flows[..., i]
+            if lifetime_name is None and loan is None and not subsidy:
+                cash_flows_per_item.append(cash_flow)
+                continue
+
+            # The installations per year, shaped as ([n_samples,] duration_years).
+            installations = zeros(duration_years)
+            installations[0] = install_cost - subsidy
+            if lifetime_name is not None:
+                lifetime = self.__get_value(lifetime_name, parameter_values)[
+                    ..., newaxis
+                ]
+                n_replacements = floor(years / lifetime)
+                installations = installations + install_cost * diff(
+                    n_replacements, axis=-1, prepend=0.0
+                )
+
+            if loan is not None:
+                loan_duration, rate_name = loan
+                rate = self.__get_value(rate_name, parameter_values)[..., newaxis]
+                annuity = where(
+                    rate == 0.0,
+                    1.0 / loan_duration,
+                    rate / (1 - (1 + where(rate == 0.0, 1.0, rate)) ** -loan_duration),
+                )
+                cumulated = cumsum(installations, axis=-1)
+                repaid = cumulated.copy()
+                repaid[..., loan_duration:] -= cumulated[..., :-loan_duration]
+                installations = annuity * repaid
+
+            cash_flow = cash_flow + installations
+            cash_flow[..., 0] -= install_cost
+            cash_flows_per_item.append(cash_flow)
+
+        discount_rate = self.__get_value(f"{self.name}.discount_rate", parameter_values)
+        discount_factors = (1 + discount_rate[..., newaxis]) ** -years
+        cash_flows = stack(broadcast_arrays(*cash_flows_per_item), axis=-1)
+        return cash_flows * discount_factors[..., newaxis]
+
+    def compute_net_present_cost(
+        self,
+        energy_items: Sequence[EnergyItem],
+        cost_per_year_per_component: NDArray[float],
+        parameter_values: Mapping[str, ndarray] | None = None,
+    ) -> float | ndarray:
+        """Compute the net present cost of energy items.
+
+        Args:
+            energy_items: The energy items.
+            cost_per_year_per_component: The nominal cost in euros,
+                see :meth:`compute_cash_flows`.
+            parameter_values: Values overriding the ones of the uncertain parameters,
+                possibly shaped as ``(n_samples,)``.
+
+        Returns:
+            The sum of the discounted cash flows in euros, possibly per sample.
+        """
+        return self.compute_cash_flows(
+            energy_items, cost_per_year_per_component, parameter_values
+        ).sum(axis=(-2, -1))[()]
+
+
+def create_financial_parameter_store(
+    energy_items: Sequence[EnergyItem], financial_model: FinancialModel
+) -> ParameterStore:
+    """Create a store of the uncertain parameters of energy items and their finance.
+
+    Args:
+        energy_items: The energy items.
+        financial_model: The financial model.
+
+    Returns:
+        The store of the uncertain parameters.
+    """
+    return ParameterStore(
+        {**get_uncertain_parameters(energy_items), **financial_model.parameters}
+    )
+
+
+def compute_net_present_cost_batch(
+    energy_items: Sequence[EnergyItem],
+    duration_years: int,
+    financial_model: FinancialModel,
+    samples: Mapping[str, NDArray[float]] | NDArray[float],
+    parameter_store: ParameterStore | None = None,
+) -> tuple[ndarray, ndarray]:
+    """Compute the net present cost of energy items for many samples.
+
+    Args:
+        energy_items: The energy items.
+        duration_years: The period in years over which the cost is computed.
+        financial_model: The financial model.
+        samples: The samples shaped as ``(n_samples,)`` per parameter name,
+            the parameters missing from ``samples`` keeping their default value,
+            or a sample matrix shaped as ``(n_samples, n_parameters)``
+            whose columns are ordered as the names of ``parameter_store``.
+        parameter_store: The store of the uncertain parameters of the energy items
+            and of the financial model.
+            If ``None``, create it with :func:`create_financial_parameter_store`.
+
+    Returns:
+        net_present_cost: The net present cost in euros shaped as ``(n_samples,)``.
+        cash_flows: The discounted cash flows in euros
+            shaped as ``(n_samples, duration_years, n_items)``.
+    """
+    if parameter_store is None:
+        parameter_store = create_financial_parameter_store(
+            energy_items, financial_model
+        )
+    if isinstance(samples, Mapping):
+        samples = parameter_store.to_array(samples)
+    _, cost_per_year_per_component = compute_cost_batch(
+        energy_items, duration_years, samples, parameter_store
+    )
+    cash_flows = financial_model.compute_cash_flows(
+        energy_items,
+        cost_per_year_per_component,
+        parameter_store.get_parameter_values(samples),
+    )
+    return cash_flows.sum(axis=(1, 2)), cash_flows
@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+from copy import copy
+from dataclasses import dataclass
+from dataclasses import replace
+from pathlib import Path
+from typing import Mapping
+from typing import Sequence
+
+from numpy import arange
+from numpy import broadcast_to
+from numpy import empty
+from numpy import load
+from numpy import ndarray
+from numpy.lib.format import open_memmap
+
+from energy_house_cost.energy_item import EnergyItem
+from energy_house_cost.evaluation import compute_cost_evolution
+
+FLEET_ATTRIBUTES = (
+    "energy_value",
+    "initial_install_cost",
+    "maintenance_cost",
+    "production_over_consumption_ratio",
+)
+"""The attributes of the energy items which can vary from a house to another."""
+
+
+@dataclass
+class FleetResult:
+    """The cost of the energy items of a fleet of houses."""
+
+    item_names: tuple[str, ...]
+    """The names of the components of the energy items."""
+
+    total_cost: ndarray
+    """The integrated cost in euros shaped as ``(n_houses,)``."""
+
+    cost_per_year_per_component: ndarray
+    """The cost in euros shaped as ``(n_houses, duration_years, n_items)``."""
+
+
+_COMPONENT_ATTRIBUTES = {
+    "initial_install_cost": "initial_install_cost",
+    "maintenance_cost": "maintenance_cost_per_year",
+    "production_over_consumption_ratio": "production_over_consumption_ratio",
+}
+"""The attributes of the components per name of attribute of the houses."""
+
+
+def _compute_chunk(
+    energy_items: Sequence[EnergyItem],
+    duration_years: int,
+    columns: Mapping[str, ndarray],
+    start: int,
+    stop: int,
+    prices_one_kwh: Mapping[int, ndarray],
+    parameter_values: Mapping[str, float] | None,
+) -> ndarray:
+    """Compute the cost of a chunk of houses.
+
+    The cost of every energy item is computed by :func:`.compute_cost_evolution`
+    from a copy whose attributes are the chunks of the columns of the houses.
+
+    Returns:
+        The cost shaped as ``(stop - start, duration_years, n_items)``.
+    """
+    n_houses = stop - start
+    costs = empty((n_houses, duration_years, len(energy_items)))
+    for i, item in enumerate(energy_items):
+        component = copy(item.component)
+        prefix = f"{component.name}."
+        for name, attribute in _COMPONENT_ATTRIBUTES.items():
+            if prefix + name in columns:
+                setattr(component, attribute, columns[prefix + name][start:stop])
+        energy_value = item.energy_value
+        if prefix + "energy_value" in columns:
+            energy_value = columns[prefix + "energy_value"][start:stop]
+        costs[:, :, i] = broadcast_to(
+            compute_cost_evolution(
+                replace(item, energy_value=energy_value, component=component),
+                duration_years,
+                parameter_values,
+                prices_one_kwh[id(item.energy_cost)],
+            ),
+            (n_houses, duration_years),
+        )
+    return costs
+
+
+def compute_fleet_cost(
+    energy_items: Sequence[EnergyItem],
+    duration_years: int,
+    houses: Mapping[str, ndarray] | str | Path,
+    chunk_size: int = 10000,
+    directory: str | Path | None = None,
+    parameter_values: Mapping[str, float] | None = None,
+) -> FleetResult:
+    """Compute the cost of the energy items of a fleet of houses.
+
+    The energy items are templates whose attributes listed in
+    :data:`FLEET_ATTRIBUTES` can be given per house
+    by the columns named ``"{component name}.{attribute}"`` of a table;
+    the missing columns default to the attributes of the templates.
+    The price of one kWh of every energy cost is computed once for all the houses,
+    which are evaluated in chunks.
+
+    Args:
+        energy_items: The templates of the energy items of every house.
+        duration_years: The period in years over which the cost is computed.
+        houses: The columns of the table of the houses shaped as ``(n_houses,)``,
+            e.g. a dictionary of arrays, a pandas data frame or a ``.npz`` file,
+            whose columns used by the energy items are read once,
+            or a directory of ``.npy`` files named after the columns,
+            which are memory-mapped.
+        chunk_size: The maximum number of houses evaluated at once.
+        directory: The directory where to write the outputs,
+            as ``total_cost.npy`` and ``cost_per_year_per_component.npy``,
+            chunk by chunk so that the memory is bounded by the chunk size.
+            If ``None``, return the outputs in memory.
+        parameter_values: The values of the uncertain parameters,
+            shared by all the houses.
+            If ``None``, use the current values of the uncertain parameters.
+
+    Returns:
+        The cost of the houses, memory-mapped read-only if ``directory`` is given.
+
+    Raises:
+        ValueError: When the table has no column
+            or when a column has not the same length as the first one.
+    """
+    if isinstance(houses, (str, Path)):
+        houses = {
+            path.stem: load(path, mmap_mode="r") for path in Path(houses).glob("*.npy")
+        }
+    if not list(houses):
+        raise ValueError("The table of the houses has no column.")
+
+    # Read every column once, e.g. instead of decompressing it for every chunk.
+    columns = {}
+    for item in energy_items:
+        for attribute in FLEET_ATTRIBUTES:
+            name = f"{item.component.name}.{attribute}"
+            if name in houses and name not in columns:
+                columns[name] = houses[name]
+    first_name, first_column = next(iter((columns or houses).items()))
+    n_houses = len(first_column)
+    for name, column in columns.items():
+        if len(column) != n_houses:
+            raise ValueError(
+                f"The column {name} has {len(column)} houses"
+                f" instead of {n_houses} like the column {first_name}."
+            )
+    shape = (n_houses, duration_years, len(energy_items))
+    if directory is None:
+        total_cost = empty(n_houses)
+        cost_per_year_per_component = empty(shape)
+    else:
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        total_cost = open_memmap(directory / "total_cost.npy", "w+", float, (n_houses,))
+        cost_per_year_per_component = open_memmap(
+            directory / "cost_per_year_per_component.npy", "w+", float, shape
+        )
+
+    years = arange(duration_years)
+    prices_one_kwh = {}
+    for item in energy_items:
+        energy_cost = item.energy_cost
+        if id(energy_cost) not in prices_one_kwh:
+            prices_one_kwh[id(energy_cost)] = energy_cost.compute_profile(
+                years, 1.0, parameter_values
+            )
+
+    for start in range(0, n_houses, chunk_size):
+        stop = min(start + chunk_size, n_houses)
+        costs = _compute_chunk(
+            energy_items,
+            duration_years,
+            columns,
+            start,
+            stop,
+            prices_one_kwh,
+            parameter_values,
+        )
+        cost_per_year_per_component[start:stop] = costs
+        total_cost[start:stop] = costs.sum(axis=(1, 2))
+
+    item_names = tuple(item.component.name for item in energy_items)
+    if directory is None:
+        return FleetResult(item_names, total_cost, cost_per_year_per_component)
+
+    total_cost.flush()
+    cost_per_year_per_component.flush()
+    del total_cost, cost_per_year_per_component
+    return FleetResult(
+        item_names,
+        open_memmap(directory / "total_cost.npy", "r"),
+        open_memmap(directory / "cost_per_year_per_component.npy", "r"),
+    )
@@ -0,0 +1,263 @@
+from __future__ import annotations
+
+from typing import Iterable
+from typing import Iterator
+from typing import Mapping
+
+from numpy import array
+from numpy import asarray
+from numpy import broadcast_to
+from numpy import flatnonzero
+from numpy import isfinite
+from numpy import ndarray
+from numpy.typing import NDArray
+
+from energy_house_cost.uncertain import UncertainParameter
+
+
+class ParameterValues(Mapping):
+    """A read-only view of values of parameters indexed by parameter name.
+
+    The values of the parameter number ``i`` of the store are ``values[..., i]``,
+    which is a view of ``values`` without copy.
+    """
+
+    def __init__(self, indices: Mapping[str, int], values: ndarray):
+        """Constructor.
+
+        Args:
+            indices: The indices of the parameters in ``values``.
+            values: The values shaped as ``(n_parameters,)``
+                or ``(n_samples, n_parameters)``.
+        """
+        self.indices = indices
+        """The indices of the parameters in :attr:`values`."""
+
+        self.values = values
+
+    def __getitem__(self, name: str) -> float | ndarray:
+        return self.values[..., self.indices[name]]
+
+    def __contains__(self, name: object) -> bool:
+        return name in self.indices
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.indices)
+
+    def __len__(self) -> int:
+        return len(self.indices)
+
+
+def resolve_indices(
+    prefix: str, names: Iterable[str], indices: Mapping[str, int]
+) -> dict[str, int]:
+    """Return the indices in a store of the parameters of a component.
+
+    Args:
+        prefix: The name of the component.
+        names: The names of the parameters of the component,
+            prefixed by the name of the component.
+        indices: The indices of the parameters of the store.
+
+    Returns:
+        The indices of the parameters of the component that are in the store,
+        per name without the prefix.
+    """
+    start = len(prefix) + 1
+    return {name[start:]: indices[name] for name in names if name in indices}
+
+
+class UncertainParametersMixin:
+    """A mixin reading the uncertain parameters of a component from a store.
+
+    The class using it defines the attributes ``name``
+    and ``_uncertain_parameters``, the uncertain parameters by prefixed name.
+    """
+
+    # The indices of the parameters of the store last used,
+    # and the indices of the parameters of the component in this store.
+    _parameter_indices: tuple[Mapping[str, int] | None, dict[str, int]] = (None, {})
+
+    def _get_parameter_value(
+        self, name: str, parameter_values: Mapping[str, ndarray] | None = None
+    ) -> float | ndarray:
+        """Return the value of a parameter of the component.
+
+        Args:
+            name: The name of the parameter, without the component name prefix.
+            parameter_values: Values overriding the current ones of the parameters,
+                e.g. one array of samples per parameter name.
+                If ``None`` or if the parameter is missing, use its current value.
+
+        Returns:
+            The value of the parameter.
+        """
+        if isinstance(parameter_values, ParameterValues):
+            store_indices, indices = self._parameter_indices
+            if store_indices is not parameter_values.indices:
+                indices = self.resolve_parameter_indices(parameter_values.indices)
+            index = indices.get(name)
+            if index is not None:
+                return parameter_values.values[..., index]
+
+        param_name = f"{self.name}.{name}"
+        if parameter_values is not None and param_name in parameter_values:
+            return parameter_values[param_name]
+        return self._uncertain_parameters[param_name].value
+
+    def resolve_parameter_indices(self, indices: Mapping[str, int]) -> dict[str, int]:
+        """Resolve the indices of the parameters of the component in a store.
+
+        The values of the parameters are then read from the
+        :class:`.ParameterValues` of this store by integer index.
+
+        Args:
+            indices: The indices of the parameters of the store.
+
+        Returns:
+            The indices of the parameters of the component that are in the store,
+            per name without the component name prefix.
+        """
+        component_indices = resolve_indices(
+            self.name, self._uncertain_parameters, indices
+        )
+        self._parameter_indices = (indices, component_indices)
+        return component_indices
+
+
+class ParameterStore:
+    """The values and bounds of uncertain parameters stored in contiguous arrays.
+
+    The parameters are ordered as in the mapping passed at construction.
+    The :class:`UncertainParameter` objects are not modified by the store.
+    """
+
+    def __init__(self, parameters: Mapping[str, UncertainParameter]):
+        """Constructor.
+
+        Args:
+            parameters: The uncertain parameters.
+        """
+        self.names = tuple(parameters)
+        self.indices = {name: i for i, name in enumerate(self.names)}
+        self.default_values = array([p.value for p in parameters.values()], float)
+        self.min_values = array([p.min_value for p in parameters.values()], float)
+        self.max_values = array([p.max_value for p in parameters.values()], float)
+        self.values = self.default_values.copy()
+
+    @property
+    def size(self) -> int:
+        """The number of parameters."""
+        return len(self.names)
+
+    def check(self, values: ndarray):
+        """Check that values are within the bounds of the parameters.
+
+        Args:
+            values: The values shaped as ``(n_parameters,)``
+                or ``(n_samples, n_parameters)``.
+
+        Raises:
+            ValueError: When the values have a wrong shape
+                or when a value is out of the bounds of its parameter,
+                e.g. when it is not finite.
+        """
+        if values.shape[-1:] != (self.size,):
+            raise ValueError(
+                f"The values should have {self.size} columns, got {values.shape}."
+            )
+        # NaN is out of bounds, which it would not be with values < self.min_values.
+        is_out_of_bounds = ~(
+            isfinite(values) & (values >= self.min_values) & (values <= self.max_values)
+        )
+        if is_out_of_bounds.any():
+            i = flatnonzero(is_out_of_bounds.reshape(-1, self.size).any(axis=0))[0]
+            raise ValueError(
+                f"Parameter {self.names[i]} is out of bounds: values should be in"
+                f" [{self.min_values[i]}, {self.max_values[i]}]"
+            )
+
+    def set_values(self, values: NDArray[float]):
+        """Set the current values of the parameters.
+
+        Args:
+            values: The values shaped as ``(n_parameters,)``.
+
+        Raises:
+            ValueError: When a value is out of the bounds of its parameter.
+        """
+        values = asarray(values, dtype=float)
+        self.check(values)
+        self.values[:] = values
+
+    def update(self, data: Mapping[str, NDArray[float]]):
+        """Set the current values of the parameters from arrays of size 1.
+
+        Args:
+            data: The values of the parameters,
+                e.g. the input data of a discipline.
+                The parameters missing from ``data`` keep their current value.
+
+        Raises:
+            ValueError: When a value is out of the bounds of its parameter.
+        """
+        values = self.values.copy()
+        for name, value in data.items():
+            i = self.indices.get(name)
+            if i is not None:
+                values[i] = value[0]
+        self.set_values(values)
+
+    def to_array(self, samples: Mapping[str, NDArray[float]]) -> ndarray:
+        """Convert samples indexed by parameter name into a matrix.
+
+        Args:
+            samples: The samples shaped as ``(n_samples,)`` per parameter name.
+                The parameters missing from ``samples`` keep their default value.
+
+        Returns:
+            The samples shaped as ``(n_samples, n_parameters)``.
+
+        Raises:
+            ValueError: When a parameter is unknown
+                or when the samples have not the same size.
+        """
+        n_samples = None
+        for name, values in samples.items():
+            if name not in self.indices:
+                raise ValueError(f"Parameter {name} is not a parameter of the store.")
+            size = asarray(values).size
+            if n_samples is None:
+                n_samples = size
+            elif size != n_samples:
+                raise ValueError(
+                    f"Parameter {name} has {size} samples instead of {n_samples}."
+                )
+
+        matrix = broadcast_to(self.default_values, (n_samples or 1, self.size)).copy()
+        for name, values in samples.items():
+            matrix[:, self.indices[name]] = asarray(values, dtype=float).ravel()
+        return matrix
+
+    def get_parameter_values(
+        self, values: NDArray[float] | None = None
+    ) -> ParameterValues:
+        """Return values of the parameters indexed by parameter name.
+
+        Args:
+            values: The values shaped as ``(n_parameters,)``
+                or ``(n_samples, n_parameters)``, e.g. a sample matrix,
+                which is checked and used without copy.
+                If ``None``, use the current values.
+
+        Returns:
+            The values of the parameters.
+
+        Raises:
+            ValueError: When a value is out of the bounds of its parameter.
+        """
+        if values is None:
+            return ParameterValues(self.indices, self.values)
+        values = asarray(values, dtype=float)
+        self.check(values)
+        return ParameterValues(self.indices, values)
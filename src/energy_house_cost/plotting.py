@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import numpy as np
+from matplotlib import pyplot as plt
+
+
+def plot_integrated_cost_per_component(
+    component_names, cost_per_year_per_component, duration_years
+):
+    columns = component_names
+    columns = tuple(columns)
+    rows = np.linspace(0, duration_years - 1, duration_years)
+
+    # Get some pastel shades for the colors
+    colors = plt.cm.BuPu(np.linspace(0.1, 0.5, len(rows)))
+    n_rows = len(cost_per_year_per_component)
+
+    index = np.arange(len(columns)) + 0.3
+    bar_width = 0.4
+
+    # Initialize the vertical-offset for the stacked bar chart.
+    y_offset = np.zeros(len(columns))
+
+    # Plot bars and create text labels for the table
+    cell_text = []
+    for row in range(n_rows):
+        plt.bar(
+            index,
+            cost_per_year_per_component[row],
+            bar_width,
+            bottom=y_offset,
+            color=colors[row],
+        )
+        y_offset = y_offset + cost_per_year_per_component[row]
+        cell_text.append(["%1.1f" % (x / 1) for x in y_offset])
+    # Reverse colors and text labels to display the last value at the top.
+    colors = colors[::-1]
+    rows = rows[::-1]
+    cell_text.reverse()
+
+    # Add a table at the bottom of the axes
+    plt.table(
+        cellText=cell_text,
+        rowLabels=rows,
+        rowColours=colors,
+        colLabels=columns,
+        loc="bottom",
+    )
+
+    # Adjust layout to make room for the table:
+    plt.subplots_adjust(left=0.2, bottom=0.5)
+
+    plt.ylabel("Cost in euros")
+    # plt.yticks(values * value_increment, ['%d' % val for val in values])
+    plt.xticks([])
+    plt.title("Integrated cost by component")
+
+    plt.show()
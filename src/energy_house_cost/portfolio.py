@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Mapping
+from typing import Sequence
+
+from numpy import arange
+from numpy import argmin
+from numpy import argsort
+from numpy import atleast_2d
+from numpy import bincount
+from numpy import broadcast_to
+from numpy import empty
+from numpy import ndarray
+from numpy.typing import NDArray
+
+from energy_house_cost.energy_item import EnergyItem
+from energy_house_cost.energy_item import get_uncertain_parameters
+from energy_house_cost.energy_item import resolve_parameter_indices
+from energy_house_cost.evaluation import compute_cost_evolution
+from energy_house_cost.parameter_store import ParameterStore
+
+
+@dataclass
+class PortfolioResult:
+    """The costs of several configurations of energy items for common samples."""
+
+    names: Sequence[str]
+    """The names of the configurations."""
+
+    total_cost: ndarray
+    """The integrated cost in euros shaped as ``(n_samples, n_configurations)``."""
+
+    def compute_probability_of_being_cheapest(self) -> dict[str, float]:
+        """Return the probability that every configuration is the cheapest one.
+
+        In case of a tie, the first configuration is considered the cheapest one.
+
+        Returns:
+            The probability per configuration name.
+        """
+        counts = bincount(argmin(self.total_cost, axis=1), minlength=len(self.names))
+        return dict(zip(self.names, counts / len(self.total_cost)))
+
+    def compute_mean_rank(self) -> dict[str, float]:
+        """Return the mean rank of every configuration, the cheapest being ranked 1.
+
+        Returns:
+            The mean rank per configuration name.
+        """
+        ranks = argsort(argsort(self.total_cost, axis=1), axis=1) + 1
+        return dict(zip(self.names, ranks.mean(axis=0)))
+
+    def compute_mean_cost(self) -> dict[str, float]:
+        """Return the mean integrated cost of every configuration.
+
+        Returns:
+            The mean integrated cost in euros per configuration name.
+        """
+        return dict(zip(self.names, self.total_cost.mean(axis=0)))
+
+
+class ScenarioPortfolio:
+    """Alternative configurations of energy items evaluated for common samples.
+
+    The configurations can share energy items and energy costs: the cost per year
+    of an energy item and the price of one kWh of an energy cost are computed once
+    per evaluation, whatever the number of configurations using them.
+    """
+
+    def __init__(
+        self, configurations: Mapping[str, Sequence[EnergyItem]], duration_years: int
+    ):
+        """Constructor.
+
+        Args:
+            configurations: The energy items per configuration name.
+            duration_years: The period in years over which the cost is computed.
+        """
+        self.configurations = configurations
+        self.duration_years = duration_years
+        uncertain_parameters = {}
+        for energy_items in configurations.values():
+            uncertain_parameters.update(get_uncertain_parameters(energy_items))
+        self.parameter_store = ParameterStore(uncertain_parameters)
+        for energy_items in configurations.values():
+            resolve_parameter_indices(energy_items, self.parameter_store)
+
+    def compute(
+        self, samples: Mapping[str, NDArray[float]] | NDArray[float]
+    ) -> PortfolioResult:
+        """Compute the cost of every configuration for common samples.
+
+        Args:
+            samples: The samples shaped as ``(n_samples,)`` per parameter name,
+                the parameters missing from ``samples`` keeping their default value,
+                or a sample matrix shaped as ``(n_samples, n_parameters)``
+                whose columns are ordered as :attr:`parameter_store.names`,
+                or a single sample shaped as ``(n_parameters,)``.
+
+        Returns:
+            The costs of the configurations.
+
+        Raises:
+            ValueError: When the sample matrix has not ``n_parameters`` columns
+                or when a value is out of the bounds of its parameter.
+        """
+        if isinstance(samples, Mapping):
+            samples = self.parameter_store.to_array(samples)
+        else:
+            samples = atleast_2d(samples)
+            size = self.parameter_store.size
+            if samples.ndim != 2 or samples.shape[1] != size:
+                raise ValueError(
+                    f"The samples should be shaped as (n_samples, {size}),"
+                    f" got {samples.shape}."
+                )
+        parameter_values = self.parameter_store.get_parameter_values(samples)
+        n_samples = len(samples)
+        years = arange(self.duration_years)
+        prices_one_kwh = {}
+        item_costs = {}
+        total_cost = empty((n_samples, len(self.configurations)))
+        for j, energy_items in enumerate(self.configurations.values()):
+            total_cost[:, j] = 0.0
+            for item in energy_items:
+                item_cost = item_costs.get(id(item))
+                if item_cost is None:
+                    energy_cost = item.energy_cost
+                    price_one_kwh = prices_one_kwh.get(id(energy_cost))
+                    if price_one_kwh is None:
+                        price_one_kwh = energy_cost.compute_profile(
+                            years, 1.0, parameter_values
+                        )
+                        prices_one_kwh[id(energy_cost)] = price_one_kwh
+                    item_cost = broadcast_to(
+                        compute_cost_evolution(
+                            item, self.duration_years, parameter_values, price_one_kwh
+                        ).sum(axis=-1),
+                        (n_samples,),
+                    )
+                    item_costs[id(item)] = item_cost
+                total_cost[:, j] += item_cost
+        return PortfolioResult(list(self.configurations), total_cost)
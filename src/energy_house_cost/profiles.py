@@ -0,0 +1,305 @@
+from __future__ import annotations
+
+from abc import ABC
+from abc import abstractmethod
+from dataclasses import dataclass
+from dataclasses import field
+
+from numpy import arange
+from numpy import argsort
+from numpy import asarray
+from numpy import broadcast_arrays
+from numpy import clip
+from numpy import diff
+from numpy import floor
+from numpy import full
+from numpy import ndarray
+from numpy import newaxis
+from numpy import ones
+from numpy import searchsorted
+from numpy import stack
+from numpy import where
+from numpy import zeros
+
+
+def _outer(value: ndarray, years: ndarray) -> ndarray:
+    """Add to a parameter value as many trailing axes as ``years``."""
+    return value[(...,) + (newaxis,) * years.ndim]
+
+
+class BaseProfile(ABC):
+    """A price of one kWh over the years."""
+
+    last_year = float("inf")
+    """The last year for which the profile is defined."""
+
+    @abstractmethod
+    def compute(self, years: ndarray) -> ndarray:
+        """Compute the price of one kWh.
+
+        Args:
+            years: The years.
+
+        Returns:
+            The price shaped as ``(*years.shape)`` or ``(n_samples, *years.shape)``.
+        """
+
+    def compute_band_values(self, years: ndarray) -> ndarray:
+        """Compute the half sum of the prices at the beginning and end of the years.
+
+        Args:
+            years: The years.
+
+        Returns:
+            The price shaped as ``(*years.shape)`` or ``(n_samples, *years.shape)``.
+        """
+        return 0.5 * (self.compute(years) + self.compute(years + 1))
+
+    @abstractmethod
+    def compute_band_jacobian(self, years: ndarray) -> ndarray:
+        """Differentiate the band values with respect to the values of the profile.
+
+        The profile values must not be arrays of samples.
+
+        Args:
+            years: The years shaped as ``(n_years,)``.
+
+        Returns:
+            The derivatives shaped as ``(n_values, n_years)``,
+            ordered as the fields of the profile.
+        """
+
+    def compute_integral(self, duration_years: int) -> ndarray:
+        """Compute the sum of the band values over ``[0, duration_years)``.
+
+        Args:
+            duration_years: The number of years.
+
+        Returns:
+            The integrated price of one kWh.
+        """
+        return self.compute_band_values(arange(duration_years)).sum(axis=-1)
+
+
+@dataclass(frozen=True)
+class LinearProfile(BaseProfile):
+    """A price of one kWh varying linearly with the years.
+
+    The values can be arrays of samples, shaped as ``(n_samples,)``.
+    """
+
+    initial_cost: ndarray
+    slope: ndarray
+
+    def compute(self, years: ndarray) -> ndarray:
+        """Compute the price of one kWh.
+
+        Args:
+            years: The years.
+
+        Returns:
+            The price shaped as ``(*years.shape)`` or ``(n_samples, *years.shape)``.
+        """
+        return _outer(self.initial_cost, years) + _outer(self.slope, years) * years
+
+    def compute_band_jacobian(self, years: ndarray) -> ndarray:
+        return stack([ones(years.shape), years + 0.5])
+
+    def compute_integral(self, duration_years: int) -> ndarray:
+        """Compute the sum of the band values over ``[0, duration_years)``.
+
+        Args:
+            duration_years: The number of years.
+
+        Returns:
+            The integrated price of one kWh.
+        """
+        return (
+            duration_years * self.initial_cost + 0.5 * self.slope * duration_years**2
+        )
+
+
+@dataclass(frozen=True)
+class PowerProfile(BaseProfile):
+    """A price of one kWh increasing by a constant percentage every year.
+
+    The values can be arrays of samples, shaped as ``(n_samples,)``.
+    """
+
+    initial_cost: ndarray
+    percentage_of_increase_per_year: ndarray
+    ratio: ndarray = field(init=False)
+
+    def __post_init__(self):
+        object.__setattr__(
+            self, "ratio", 1 + 0.01 * self.percentage_of_increase_per_year
+        )
+
+    def compute(self, years: ndarray) -> ndarray:
+        """Compute the price of one kWh.
+
+        Args:
+            years: The years.
+
+        Returns:
+            The price shaped as ``(*years.shape)`` or ``(n_samples, *years.shape)``.
+        """
+        return _outer(self.initial_cost, years) * _outer(self.ratio, years) ** years
+
+    def compute_band_jacobian(self, years: ndarray) -> ndarray:
+        power = self.ratio**years
+        next_power = power * self.ratio
+        return stack(
+            [
+                0.5 * (power + next_power),
+                0.005
+                * self.initial_cost
+                * (years * power / self.ratio + (years + 1) * power),
+            ]
+        )
+
+    def compute_integral(self, duration_years: int) -> ndarray:
+        """Compute the sum of the band values over ``[0, duration_years)``.
+
+        Args:
+            duration_years: The number of years.
+
+        Returns:
+            The integrated price of one kWh.
+        """
+        is_constant = self.ratio == 1.0
+        geometric_sum = where(
+            is_constant,
+            duration_years,
+            (self.ratio**duration_years - 1)
+            / where(is_constant, 1.0, self.ratio - 1),
+        )
+        return 0.5 * self.initial_cost * (1 + self.ratio) * geometric_sum
+
+
+@dataclass(frozen=True)
+class PiecewiseLinearProfile(BaseProfile):
+    """A price of one kWh interpolated linearly between points.
+
+    Like :func:`numpy.interp`, the profile is extrapolated by its first value
+    before its first point and by its last value after its last point.
+    """
+
+    year_axis: ndarray
+    """The sorted years of the points."""
+
+    values: ndarray
+    """The prices at the points, shaped as ``(n_points,)`` or
+    ``(n_samples, n_points)``."""
+
+    slopes: ndarray = field(init=False)
+    """The slopes between consecutive points."""
+
+    @property
+    def last_year(self) -> float:
+        return self.year_axis[-1]
+
+    @classmethod
+    def from_points(cls, years, values) -> PiecewiseLinearProfile:
+        """Create a profile from unsorted points.
+
+        Args:
+            years: The years of the points.
+            values: The prices at the points, possibly arrays of samples.
+
+        Returns:
+            The profile.
+
+        Raises:
+            ValueError: When two points have the same year.
+        """
+        years = asarray(years, dtype=float)
+        values = stack(broadcast_arrays(*values), axis=-1).astype(float)
+        order = argsort(years, kind="stable")
+        return cls(years[order], values[..., order])
+
+    def __post_init__(self):
+        steps = diff(self.year_axis)
+        if not (steps > 0).all():
+            raise ValueError(
+                "The years of the points should be strictly increasing,"
+                f" got {self.year_axis.tolist()}."
+            )
+        object.__setattr__(self, "slopes", diff(self.values, axis=-1) / steps)
+
+    def compute(self, years: ndarray) -> ndarray:
+        """Compute the price of one kWh.
+
+        Args:
+            years: The years.
+
+        Returns:
+            The price shaped as ``(*years.shape)`` or ``(n_samples, *years.shape)``.
+        """
+        last = self.year_axis.size - 1
+        i = clip(searchsorted(self.year_axis, years, side="right") - 1, 0, last - 1)
+        return where(
+            years <= self.year_axis[0],
+            self.values[..., full(years.shape, 0)],
+            where(
+                years >= self.year_axis[last],
+                self.values[..., full(years.shape, last)],
+                self.slopes[..., i] * (years - self.year_axis[i]) + self.values[..., i],
+            ),
+        )
+
+    def __compute_weights(self, years: ndarray) -> ndarray:
+        """Compute the weights of the values interpolated at the years.
+
+        Args:
+            years: The years shaped as ``(n_years,)``.
+
+        Returns:
+            The weights shaped as ``(n_points, n_years)``.
+        """
+        last = self.year_axis.size - 1
+        i = clip(searchsorted(self.year_axis, years, side="right") - 1, 0, last - 1)
+        # The weights of the extrapolated years are those of the first or last point.
+        weight = clip(
+            (years - self.year_axis[i]) / (self.year_axis[i + 1] - self.year_axis[i]),
+            0.0,
+            1.0,
+        )
+        weights = zeros((self.year_axis.size, years.size))
+        columns = arange(years.size)
+        weights[i, columns] = 1 - weight
+        weights[i + 1, columns] = weight
+        return weights
+
+    def compute_band_jacobian(self, years: ndarray) -> ndarray:
+        years = asarray(years, dtype=float)
+        return 0.5 * (self.__compute_weights(years) + self.__compute_weights(years + 1))
+
+
+@dataclass(frozen=True)
+class SeriesProfile(BaseProfile):
+    """A price of one kWh constant over every year, e.g. averaged from a series."""
+
+    yearly_values: ndarray
+    """The prices over the years, shaped as ``(n_years,)``."""
+
+    @property
+    def last_year(self) -> float:
+        return self.yearly_values.size - 1
+
+    def compute(self, years: ndarray) -> ndarray:
+        """Compute the price of one kWh.
+
+        Args:
+            years: The years.
+
+        Returns:
+            The price over the year containing every year, shaped as ``years``.
+        """
+        return self.yearly_values[floor(years).astype(int)]
+
+    def compute_band_values(self, years: ndarray) -> ndarray:
+        return self.compute(years)
+
+    def compute_band_jacobian(self, years: ndarray) -> ndarray:
+        return zeros((0,) + asarray(years).shape)
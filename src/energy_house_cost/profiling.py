@@ -0,0 +1,177 @@
+"""Opt-in timers and counters of the evaluation of energy scenarios.
+
+The timers are enabled either within :func:`profile`
+or for the whole process by setting the environment variable
+``ENERGY_HOUSE_COST_PROFILE`` to ``1``,
+or to the path of a file where to dump the :mod:`cProfile` statistics,
+and the summary is then written to the standard error at exit.
+When disabled, a timer costs a function call.
+"""
+from __future__ import annotations
+
+import atexit
+import cProfile
+import logging
+import os
+import sys
+from contextlib import contextmanager
+from contextlib import nullcontext
+from pathlib import Path
+from time import perf_counter
+from typing import ContextManager
+from typing import Iterator
+
+LOGGER = logging.getLogger(__name__)
+
+ENVIRONMENT_VARIABLE = "ENERGY_HOUSE_COST_PROFILE"
+"""The environment variable enabling the profiling of the process."""
+
+
+class Profiler:
+    """The timings and counts of the steps of the evaluation."""
+
+    def __init__(self):
+        self.timings = {}
+        """The number of calls and the total time in seconds per step."""
+
+        self.counters = {}
+        """The count per name."""
+
+    def record(self, name: str, seconds: float):
+        """Record the duration of a step.
+
+        Args:
+            name: The name of the step.
+            seconds: The duration in seconds.
+        """
+        timing = self.timings.get(name)
+        if timing is None:
+            self.timings[name] = [1, seconds]
+        else:
+            timing[0] += 1
+            timing[1] += seconds
+
+    def increment(self, name: str, count: int = 1):
+        """Increment a counter.
+
+        Args:
+            name: The name of the counter.
+            count: The increment.
+        """
+        self.counters[name] = self.counters.get(name, 0) + count
+
+    def get_summary(self) -> str:
+        """Return a table of the timings sorted by decreasing total time."""
+        width = max(map(len, [*self.timings, *self.counters, "step"]))
+        lines = [f"{'step':<{width}} {'calls':>9} {'total [s]':>11} {'mean [us]':>11}"]
+        for name, (n_calls, seconds) in sorted(
+            self.timings.items(), key=lambda item: -item[1][1]
+        ):
+            lines.append(
+                f"{name:<{width}} {n_calls:>9} {seconds:>11.4f}"
+                f" {1e6 * seconds / n_calls:>11.1f}"
+            )
+        for name, count in sorted(self.counters.items()):
+            lines.append(f"{name:<{width}} {count:>9}")
+        return "\n".join(lines)
+
+    def __str__(self):
+        return self.get_summary()
+
+
+class _Timer:
+    """A context manager recording its duration in a profiler."""
+
+    __slots__ = ("__profiler", "__name", "__start")
+
+    def __init__(self, profiler: Profiler, name: str):
+        self.__profiler = profiler
+        self.__name = name
+
+    def __enter__(self):
+        self.__start = perf_counter()
+
+    def __exit__(self, *args):
+        self.__profiler.record(self.__name, perf_counter() - self.__start)
+
+
+# The profiler of the enabled timers.
+_profiler: Profiler | None = None
+
+_NULL_TIMER = nullcontext()
+
+
+def timed(name: str, component: str | None = None) -> ContextManager:
+    """Return a timer of a step, doing nothing when the profiling is disabled.
+
+    Args:
+        name: The name of the step.
+        component: The name of the component for a breakdown per component.
+            If ``None``, do not break down the step.
+
+    Returns:
+        The timer.
+    """
+    if _profiler is None:
+        return _NULL_TIMER
+    return _Timer(_profiler, name if component is None else f"{name}[{component}]")
+
+
+def count(name: str, increment: int = 1):
+    """Increment a counter when the profiling is enabled.
+
+    Args:
+        name: The name of the counter.
+        increment: The increment.
+    """
+    if _profiler is not None:
+        _profiler.increment(name, increment)
+
+
+@contextmanager
+def profile(
+    pstats_path: str | Path | None = None, log_summary: bool = True
+) -> Iterator[Profiler]:
+    """Enable the timers and counters.
+
+    Args:
+        pstats_path: The path to the file where to dump the :mod:`cProfile`
+            statistics, readable with :mod:`pstats`.
+            If ``None``, do not run :mod:`cProfile`.
+        log_summary: Whether to log the summary of the timings at exit.
+
+    Yields:
+        The profiler.
+    """
+    global _profiler
+    previous_profiler = _profiler
+    _profiler = profiler = Profiler()
+    c_profile = None
+    if pstats_path is not None:
+        c_profile = cProfile.Profile()
+        c_profile.enable()
+    try:
+        yield profiler
+    finally:
+        if c_profile is not None:
+            c_profile.disable()
+            c_profile.dump_stats(pstats_path)
+        _profiler = previous_profiler
+        if log_summary:
+            LOGGER.info("Profiling summary\n%s", profiler)
+
+
+def _profile_process(value: str):
+    """Profile the process until its exit."""
+    context = profile(None if value == "1" else value, log_summary=False)
+    profiler = context.__enter__()
+
+    def write_summary():
+        context.__exit__(None, None, None)
+        print(f"Profiling summary\n{profiler}", file=sys.stderr)
+
+    atexit.register(write_summary)
+
+
+if os.environ.get(ENVIRONMENT_VARIABLE):
+    _profile_process(os.environ[ENVIRONMENT_VARIABLE])
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from typing import Mapping
+from typing import Sequence
+
+from numpy import ndarray
+
+from energy_house_cost.energy_item import EnergyItem
+from energy_house_cost.uncertain import UncertainParameter
+
+LOGGER = logging.getLogger(__name__)
+
+QUIET = 0
+"""The verbosity level logging nothing."""
+
+SUMMARY = 1
+"""The verbosity level logging the integrated cost."""
+
+DETAILED = 2
+"""The verbosity level logging the parameters and the cost per energy item."""
+
+
+@dataclass
+class ScenarioReport:
+    """The cost of an energy scenario, rendered as text only when asked."""
+
+    energy_items: Sequence[EnergyItem]
+    duration_years: int
+    total_cost: float
+    cost_per_year_per_component: ndarray
+    """The cost in euros shaped as ``(duration_years, n_items)``."""
+
+    parameter_values: Mapping[str, float] | None = None
+    """The values of the uncertain parameters used to compute the cost.
+
+    If ``None``, the current values of the uncertain parameters.
+    """
+
+    def get_summary(self) -> str:
+        """Return the description of the integrated cost."""
+        return (
+            f"Integrated cost is {self.total_cost} euros"
+            f" over {self.duration_years} years."
+        )
+
+    def get_details(self) -> list[str]:
+        """Return the description of the cost of every energy item."""
+        details = []
+        for item, cost_evolution in zip(
+            self.energy_items, self.cost_per_year_per_component.T
+        ):
+            energy_value = item.component.compute(
+                item.energy_value, item.is_produced, self.parameter_values
+            )
+            year_averaged_cost = cost_evolution.sum() / self.duration_years
+            details.append(
+                f"{item.component.name} "
+                f"{item.component.get_summary(energy_value, self.parameter_values)}"
+                f" of {item.energy_cost.name}\n"
+                f" which represents {year_averaged_cost:.0f}"
+                f" euros (average per year, including initial cost and maintenance)"
+            )
+        return details
+
+    def __str__(self):
+        return "\n".join(
+            [self.get_summary(), "Detailed cost in kWh per year"] + self.get_details()
+        )
+
+
+def format_parameters(parameters: Mapping[str, UncertainParameter]) -> str:
+    """Return a description of uncertain parameters, one per line."""
+    return "\n".join(
+        ["Scenario parameters"]
+        + [f"{name}: {param}" for name, param in parameters.items()]
+    )
+
+
+def log_report(report: ScenarioReport, verbosity: int):
+    """Log a report of an energy scenario.
+
+    Args:
+        report: The report.
+        verbosity: The verbosity level, either :data:`QUIET`, :data:`SUMMARY`
+            or :data:`DETAILED`.
+    """
+    if verbosity >= DETAILED:
+        LOGGER.info("%s", report)
+    elif verbosity >= SUMMARY:
+        LOGGER.info("%s", report.get_summary())
@@ -0,0 +1,523 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
+from typing import Callable
+from typing import Iterable
+from typing import Iterator
+from typing import Mapping
+from typing import TYPE_CHECKING
+
+from numpy import arange
+from numpy import ascontiguousarray
+from numpy import concatenate
+from numpy import isfinite
+from numpy import load
+from numpy import ndarray
+from numpy import save
+from numpy import tile
+from numpy.random import default_rng
+from numpy.random import SeedSequence
+from numpy.typing import NDArray
+
+from energy_house_cost.cache import compute_fingerprint
+from energy_house_cost.energy_item import EnergyItem
+from energy_house_cost.evaluation import compute_cost_batch
+from energy_house_cost.parameter_store import ParameterStore
+from energy_house_cost.statistics import OnlineStatistics
+
+if TYPE_CHECKING:
+    from energy_house_cost.energy_scenario import EnergyScenario
+
+
+@dataclass
+class SamplingResult:
+    """The inputs and outputs of the samples of an energy scenario."""
+
+    input_names: tuple[str, ...]
+    """The names of the uncertain parameters."""
+
+    inputs: ndarray
+    """The samples shaped as ``(n_samples, n_parameters)``."""
+
+    total_cost: ndarray
+    """The integrated cost in euros shaped as ``(n_samples,)``."""
+
+    cost_per_year_per_component: ndarray
+    """The cost in euros shaped as ``(n_samples, duration_years, n_items)``."""
+
+    def to_dataset(self):
+        """Convert the result into a gemseo dataset.
+
+        Returns:
+            The dataset with the parameters as inputs and, as outputs,
+            ``total_cost`` and the flattened ``cost_per_year_per_component``.
+        """
+        from gemseo.core.dataset import Dataset
+
+        dataset = Dataset()
+        for i, name in enumerate(self.input_names):
+            dataset.add_variable(name, self.inputs[:, [i]], group=Dataset.INPUT_GROUP)
+        dataset.add_variable(
+            "total_cost", self.total_cost[:, None], group=Dataset.OUTPUT_GROUP
+        )
+        dataset.add_variable(
+            "cost_per_year_per_component",
+            self.cost_per_year_per_component.reshape(len(self.total_cost), -1),
+            group=Dataset.OUTPUT_GROUP,
+        )
+        return dataset
+
+
+def generate_samples(
+    parameter_store: ParameterStore, n_samples: int, seed: int | SeedSequence = 0
+) -> ndarray:
+    """Sample the uncertain parameters from triangular distributions.
+
+    The distribution of a parameter ranges between its bounds and its mode is its
+    default value. The parameters without finite bounds
+    or whose bounds are equal keep their default value.
+
+    Args:
+        parameter_store: The store of the uncertain parameters.
+        n_samples: The number of samples.
+        seed: The seed of the random number generator.
+
+    Returns:
+        The samples shaped as ``(n_samples, n_parameters)``.
+    """
+    rng = default_rng(seed)
+    samples = tile(parameter_store.default_values, (n_samples, 1))
+    is_uncertain = (
+        isfinite(parameter_store.min_values)
+        & isfinite(parameter_store.max_values)
+        & (parameter_store.min_values < parameter_store.max_values)
+    )
+    for i in arange(parameter_store.size)[is_uncertain]:
+        samples[:, i] = rng.triangular(
+            parameter_store.min_values[i],
+            parameter_store.default_values[i],
+            parameter_store.max_values[i],
+            n_samples,
+        )
+    return samples
+
+
+# The model evaluated by the current worker process.
+_worker_model = None
+
+
+def _initialize_worker(
+    energy_items: Iterable[EnergyItem],
+    duration_years: int,
+    parameter_store: ParameterStore,
+):
+    global _worker_model
+    _worker_model = (energy_items, duration_years, parameter_store)
+
+
+def _evaluate_shard(
+    shard: NDArray[float] | tuple[int, SeedSequence]
+) -> tuple[ndarray, ndarray, ndarray]:
+    """Evaluate a shard of samples, given or drawn from a number and a seed."""
+    energy_items, duration_years, parameter_store = _worker_model
+    if isinstance(shard, tuple):
+        shard = generate_samples(parameter_store, *shard)
+    total_cost, cost_per_year_per_component = compute_cost_batch(
+        energy_items, duration_years, shard, parameter_store
+    )
+    return shard, total_cost, cost_per_year_per_component
+
+
+def _get_integrated_costs(
+    total_cost: ndarray, cost_per_year_per_component: ndarray
+) -> ndarray:
+    """Return the total cost and the integrated cost of every energy item
+    shaped as ``(n_samples, 1 + n_items)``."""
+    return concatenate(
+        [total_cost[:, None], cost_per_year_per_component.sum(axis=1)], axis=1
+    )
+
+
+def _compute_shard_statistics(
+    shard: NDArray[float] | tuple[int, SeedSequence],
+    output_names: Iterable[str],
+    capacity: int,
+) -> OnlineStatistics:
+    """Compute the statistics of the outputs of a shard of samples."""
+    _, total_cost, cost_per_year_per_component = _evaluate_shard(shard)
+    statistics = OnlineStatistics(output_names, capacity)
+    statistics.update(_get_integrated_costs(total_cost, cost_per_year_per_component))
+    return statistics
+
+
+def _create_shards(
+    samples: NDArray[float] | None, n_samples: int, seed: int, chunk_size: int
+) -> list[NDArray[float] | tuple[int, SeedSequence]]:
+    """Split the samples into shards, or the samples to draw into sizes and seeds.
+
+    Raises:
+        ValueError: When there is no sample to evaluate.
+    """
+    if samples is None:
+        sizes = [chunk_size] * (n_samples // chunk_size)
+        if n_samples % chunk_size:
+            sizes.append(n_samples % chunk_size)
+        seeds = SeedSequence(seed).spawn(len(sizes))
+        shards = list(zip(sizes, seeds))
+    else:
+        shards = [
+            samples[start : start + chunk_size]
+            for start in range(0, len(samples), chunk_size)
+        ]
+    if not shards:
+        raise ValueError("The number of samples must be positive.")
+    return shards
+
+
+def _map_shards(
+    scenario: EnergyScenario,
+    function: Callable,
+    shards: list[NDArray[float] | tuple[int, SeedSequence]],
+    n_workers: int | None,
+) -> Iterator:
+    """Yield in order the results of a function applied to the shards
+    with a pool of processes evaluating a model."""
+    args = (scenario._energy_items, scenario.duration_years, scenario.parameter_store)
+    if n_workers == 1:
+        _initialize_worker(*args)
+        yield from map(function, shards)
+        return
+
+    with ProcessPoolExecutor(
+        n_workers, initializer=_initialize_worker, initargs=args
+    ) as executor:
+        yield from executor.map(function, shards)
+
+
+def sample_scenario(
+    scenario: EnergyScenario,
+    samples: NDArray[float] | None = None,
+    n_samples: int = 0,
+    seed: int = 0,
+    n_workers: int | None = None,
+    chunk_size: int = 10000,
+) -> SamplingResult:
+    """Evaluate an energy scenario for many samples with a pool of processes.
+
+    The samples are split into shards of ``chunk_size`` samples
+    evaluated in batch by the worker processes.
+    When the samples are drawn with :func:`generate_samples`,
+    each shard is drawn by a worker from its own seed spawned from ``seed``,
+    so that the result depends neither on ``n_workers`` nor on the scheduling.
+
+    Args:
+        scenario: The energy scenario.
+        samples: The samples shaped as ``(n_samples, n_parameters)``,
+            whose columns are ordered as the names of ``scenario.parameter_store``.
+            If ``None``, draw ``n_samples`` samples with :func:`generate_samples`.
+        n_samples: The number of samples to draw when ``samples`` is ``None``.
+        seed: The seed of the random number generator when ``samples`` is ``None``.
+        n_workers: The number of worker processes.
+            If ``None``, use the number of processors.
+            If 1, evaluate the shards in the current process.
+        chunk_size: The maximum number of samples per shard.
+
+    Returns:
+        The samples and the outputs of the scenario.
+
+    Raises:
+        ValueError: When there is no sample to evaluate.
+    """
+    shards = _create_shards(samples, n_samples, seed, chunk_size)
+    results = _map_shards(scenario, _evaluate_shard, shards, n_workers)
+    inputs, total_cost, cost_per_year_per_component = zip(*results)
+    return SamplingResult(
+        scenario.parameter_store.names,
+        concatenate(inputs),
+        concatenate(total_cost),
+        concatenate(cost_per_year_per_component),
+    )
+
+
+def compute_statistics(
+    scenario: EnergyScenario,
+    samples: NDArray[float] | None = None,
+    n_samples: int = 0,
+    seed: int = 0,
+    n_workers: int | None = None,
+    chunk_size: int = 10000,
+    capacity: int = 1024,
+) -> OnlineStatistics:
+    """Compute the statistics of the outputs of an energy scenario for many samples.
+
+    The samples are evaluated as with :func:`sample_scenario`,
+    but every worker process reduces its shards to statistics
+    so that the outputs are never stored.
+
+    Args:
+        scenario: The energy scenario.
+        samples: The samples shaped as ``(n_samples, n_parameters)``,
+            whose columns are ordered as the names of ``scenario.parameter_store``.
+            If ``None``, draw ``n_samples`` samples with :func:`generate_samples`.
+        n_samples: The number of samples to draw when ``samples`` is ``None``.
+        seed: The seed of the random number generator when ``samples`` is ``None``.
+        n_workers: The number of worker processes.
+            If ``None``, use the number of processors.
+            If 1, evaluate the shards in the current process.
+        chunk_size: The maximum number of samples per shard.
+        capacity: The capacity of the quantile sketch.
+
+    Returns:
+        The statistics of ``"total_cost"`` and of the integrated cost of every energy
+        item named after :attr:`.EnergyScenario.cost_output_names`.
+
+    Raises:
+        ValueError: When there is no sample to evaluate.
+    """
+    output_names = ("total_cost", *scenario.cost_output_names)
+    shards = _create_shards(samples, n_samples, seed, chunk_size)
+    statistics = OnlineStatistics(output_names, capacity)
+    for shard_statistics in _map_shards(
+        scenario,
+        partial(
+            _compute_shard_statistics, output_names=output_names, capacity=capacity
+        ),
+        shards,
+        n_workers,
+    ):
+        statistics.merge(shard_statistics)
+    return statistics
+
+
+class SamplingStore:
+    """The chunks of the samples of an energy scenario stored in a directory.
+
+    Every completed chunk is a directory ``chunk_{index}`` of ``.npy`` files
+    named after the attributes of :class:`SamplingResult`,
+    renamed from a temporary directory once written,
+    so that a chunk interrupted while written is ignored.
+    The chunks are read lazily as memory-mapped arrays.
+    """
+
+    __METADATA = "metadata.json"
+
+    __ARRAYS = ("inputs", "total_cost", "cost_per_year_per_component")
+
+    def __init__(self, directory: str | Path):
+        """Constructor.
+
+        Args:
+            directory: The directory of the store.
+        """
+        self.directory = Path(directory)
+        path = self.directory / self.__METADATA
+        self.metadata = json.loads(path.read_text()) if path.exists() else {}
+        """The settings of the sampling."""
+
+    @property
+    def input_names(self) -> tuple[str, ...]:
+        """The names of the uncertain parameters."""
+        return tuple(self.metadata["input_names"])
+
+    @property
+    def cost_output_names(self) -> tuple[str, ...]:
+        """The names of the outputs of the energy items."""
+        return tuple(self.metadata["cost_output_names"])
+
+    @property
+    def chunk_indices(self) -> list[int]:
+        """The indices of the completed chunks."""
+        return sorted(
+            int(path.name.split("_")[1])
+            for path in self.directory.glob("chunk_*")
+            if path.suffix != ".tmp"
+        )
+
+    def initialize(self, metadata: Mapping[str, object]):
+        """Create the store or check that it has the same settings.
+
+        Args:
+            metadata: The settings of the sampling.
+
+        Raises:
+            ValueError: When the store exists with other settings.
+        """
+        metadata = json.loads(json.dumps(metadata))
+        if not self.metadata:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            (self.directory / self.__METADATA).write_text(json.dumps(metadata))
+            self.metadata = metadata
+        elif metadata != self.metadata:
+            raise ValueError(
+                f"The store {self.directory} was created with other settings:"
+                f" {self.metadata}."
+            )
+
+    def __get_chunk_path(self, index: int) -> Path:
+        return self.directory / f"chunk_{index:06d}"
+
+    def write_chunk(
+        self,
+        index: int,
+        inputs: NDArray[float],
+        total_cost: NDArray[float],
+        cost_per_year_per_component: NDArray[float],
+    ):
+        """Write a chunk.
+
+        Args:
+            index: The index of the chunk.
+            inputs: The samples shaped as ``(n_samples, n_parameters)``.
+            total_cost: The integrated cost in euros shaped as ``(n_samples,)``.
+            cost_per_year_per_component: The cost in euros
+                shaped as ``(n_samples, duration_years, n_items)``.
+        """
+        path = self.__get_chunk_path(index)
+        temporary_path = path.with_suffix(".tmp")
+        shutil.rmtree(temporary_path, ignore_errors=True)
+        temporary_path.mkdir()
+        for name, array in zip(
+            self.__ARRAYS, (inputs, total_cost, cost_per_year_per_component)
+        ):
+            save(temporary_path / f"{name}.npy", array)
+        os.replace(temporary_path, path)
+
+    def get_chunk(self, index: int) -> SamplingResult:
+        """Return a chunk as memory-mapped arrays.
+
+        Args:
+            index: The index of the chunk.
+
+        Returns:
+            The samples of the chunk.
+        """
+        path = self.__get_chunk_path(index)
+        return SamplingResult(
+            self.input_names,
+            *(load(path / f"{name}.npy", mmap_mode="r") for name in self.__ARRAYS),
+        )
+
+    def iter_chunks(self) -> Iterator[SamplingResult]:
+        """Yield the completed chunks in order, as memory-mapped arrays."""
+        for index in self.chunk_indices:
+            yield self.get_chunk(index)
+
+    def load(self) -> SamplingResult:
+        """Load all the completed chunks in memory.
+
+        Returns:
+            The samples of the completed chunks.
+        """
+        chunks = list(self.iter_chunks())
+        return SamplingResult(
+            self.input_names,
+            *(
+                concatenate([getattr(chunk, name) for chunk in chunks])
+                for name in self.__ARRAYS
+            ),
+        )
+
+    def compute_statistics(self, capacity: int = 1024) -> OnlineStatistics:
+        """Compute the statistics of the outputs reading one chunk at a time.
+
+        Args:
+            capacity: The capacity of the quantile sketch.
+
+        Returns:
+            The statistics of ``"total_cost"`` and of the integrated cost of every
+            energy item named after :attr:`cost_output_names`.
+        """
+        statistics = OnlineStatistics(("total_cost", *self.cost_output_names), capacity)
+        for chunk in self.iter_chunks():
+            statistics.update(
+                _get_integrated_costs(
+                    chunk.total_cost, chunk.cost_per_year_per_component
+                )
+            )
+        return statistics
+
+
+def sample_scenario_to_store(
+    scenario: EnergyScenario,
+    directory: str | Path,
+    samples: NDArray[float] | None = None,
+    n_samples: int = 0,
+    seed: int = 0,
+    n_workers: int | None = None,
+    chunk_size: int = 10000,
+) -> SamplingStore:
+    """Evaluate an energy scenario for many samples and store the chunks on disk.
+
+    The samples are evaluated as with :func:`sample_scenario`
+    and every chunk is written to the store as soon as it is evaluated.
+    A sampling interrupted with the same arguments
+    resumes from the completed chunks,
+    since the drawn samples depend neither on ``n_workers`` nor on the scheduling.
+    The store records a digest of the samples passed as ``samples``,
+    so that it is not resumed with other samples,
+    and a fingerprint of the energy items and the values and bounds of the parameters,
+    so that it is not resumed with another model.
+
+    Args:
+        scenario: The energy scenario.
+        directory: The directory of the store.
+        samples: The samples shaped as ``(n_samples, n_parameters)``,
+            whose columns are ordered as the names of ``scenario.parameter_store``.
+            If ``None``, draw ``n_samples`` samples with :func:`generate_samples`.
+        n_samples: The number of samples to draw when ``samples`` is ``None``.
+        seed: The seed of the random number generator when ``samples`` is ``None``.
+        n_workers: The number of worker processes.
+            If ``None``, use the number of processors.
+            If 1, evaluate the shards in the current process.
+        chunk_size: The maximum number of samples per chunk.
+
+    Returns:
+        The store.
+
+    Raises:
+        ValueError: When there is no sample to evaluate
+            or when the store exists with other settings.
+        TypeError: When an attribute of a component cannot be fingerprinted.
+    """
+    shards = _create_shards(samples, n_samples, seed, chunk_size)
+    if samples is None:
+        samples_digest = None
+    else:
+        samples_digest = hashlib.sha256(
+            ascontiguousarray(samples, dtype=float).tobytes()
+        ).hexdigest()
+    parameter_store = scenario.parameter_store
+    store = SamplingStore(directory)
+    store.initialize(
+        {
+            "fingerprint": compute_fingerprint(
+                scenario._energy_items, scenario.duration_years
+            ),
+            "default_values": parameter_store.default_values.tolist(),
+            "min_values": parameter_store.min_values.tolist(),
+            "max_values": parameter_store.max_values.tolist(),
+            "input_names": parameter_store.names,
+            "cost_output_names": scenario.cost_output_names,
+            "duration_years": scenario.duration_years,
+            "n_samples": n_samples if samples is None else len(samples),
+            "seed": seed if samples is None else None,
+            "samples_digest": samples_digest,
+            "chunk_size": chunk_size,
+            "n_chunks": len(shards),
+        }
+    )
+    completed_indices = set(store.chunk_indices)
+    indices = [i for i in range(len(shards)) if i not in completed_indices]
+    for index, result in zip(
+        indices,
+        _map_shards(scenario, _evaluate_shard, [shards[i] for i in indices], n_workers),
+    ):
+        store.write_chunk(index, *result)
+    return store
@@ -0,0 +1,287 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from numpy import arange
+from numpy import concatenate
+from numpy import empty
+from numpy import flatnonzero
+from numpy import inf
+from numpy import isfinite
+from numpy import moveaxis
+from numpy import ndarray
+from numpy import percentile
+from numpy import stack
+from numpy import tile
+from numpy import where
+from numpy.random import default_rng
+from numpy.random import SeedSequence
+from numpy.typing import NDArray
+
+from energy_house_cost.parameter_store import ParameterStore
+from energy_house_cost.sampling import generate_samples
+
+if TYPE_CHECKING:
+    from energy_house_cost.energy_scenario import EnergyScenario
+
+
+@dataclass
+class SobolResult:
+    """The Sobol' indices of the outputs of an energy scenario."""
+
+    input_names: tuple[str, ...]
+    """The names of the uncertain parameters."""
+
+    output_names: tuple[str, ...]
+    """The names of the outputs, ``"total_cost"`` and the integrated cost of every
+    energy item named after :attr:`.EnergyScenario.cost_output_names`."""
+
+    first_order: ndarray
+    """The first-order indices shaped as ``(n_outputs, n_inputs)``."""
+
+    total_order: ndarray
+    """The total-order indices shaped as ``(n_outputs, n_inputs)``."""
+
+    first_order_interval: ndarray
+    """The bounds of the bootstrap confidence intervals of the first-order indices,
+    shaped as ``(2, n_outputs, n_inputs)``."""
+
+    total_order_interval: ndarray
+    """The bounds of the bootstrap confidence intervals of the total-order indices,
+    shaped as ``(2, n_outputs, n_inputs)``."""
+
+    def get_indices(
+        self, output_name: str = "total_cost"
+    ) -> dict[str, tuple[float, float]]:
+        """Return the first- and total-order indices of an output.
+
+        Args:
+            output_name: The name of the output.
+
+        Returns:
+            The first- and total-order indices per parameter name.
+        """
+        i = self.output_names.index(output_name)
+        return dict(
+            zip(self.input_names, zip(self.first_order[i], self.total_order[i]))
+        )
+
+
+@dataclass
+class MorrisResult:
+    """The Morris indices of the outputs of an energy scenario.
+
+    The elementary effects are the variations of the outputs
+    when a parameter varies over its whole range.
+    """
+
+    input_names: tuple[str, ...]
+    """The names of the uncertain parameters."""
+
+    output_names: tuple[str, ...]
+    """The names of the outputs, see :attr:`SobolResult.output_names`."""
+
+    mu: ndarray
+    """The means of the elementary effects shaped as ``(n_outputs, n_inputs)``."""
+
+    mu_star: ndarray
+    """The means of the absolute elementary effects
+    shaped as ``(n_outputs, n_inputs)``."""
+
+    sigma: ndarray
+    """The standard deviations of the elementary effects
+    shaped as ``(n_outputs, n_inputs)``."""
+
+
+def _get_uncertain_indices(parameter_store: ParameterStore) -> ndarray:
+    """Return the indices of the parameters with distinct finite bounds."""
+    return flatnonzero(
+        isfinite(parameter_store.min_values)
+        & isfinite(parameter_store.max_values)
+        & (parameter_store.min_values < parameter_store.max_values)
+    )
+
+
+def _evaluate(
+    scenario: EnergyScenario, samples: NDArray[float], chunk_size: int
+) -> ndarray:
+    """Evaluate the total cost and the integrated cost of every energy item.
+
+    Returns:
+        The outputs shaped as ``(n_samples, 1 + n_items)``.
+    """
+    outputs = empty((len(samples), 1 + len(scenario.cost_output_names)))
+    for start in range(0, len(samples), chunk_size):
+        stop = start + chunk_size
+        total_cost, cost_per_year_per_component = scenario.compute_batch(
+            samples[start:stop]
+        )
+        outputs[start:stop, 0] = total_cost
+        outputs[start:stop, 1:] = cost_per_year_per_component.sum(axis=1)
+    return outputs
+
+
+def _compute_sobol_estimators(
+    f_a: ndarray, f_b: ndarray, f_ab: ndarray
+) -> tuple[ndarray, ndarray]:
+    """Compute the Saltelli first-order and Jansen total-order estimators.
+
+    Args:
+        f_a: The outputs of the first matrix shaped as ``(n_samples, n_outputs)``.
+        f_b: The outputs of the second matrix shaped as ``(n_samples, n_outputs)``.
+        f_ab: The outputs of the first matrix with the column of every input
+            taken from the second one, shaped as ``(n_inputs, n_samples, n_outputs)``.
+
+    Returns:
+        The first- and total-order indices shaped as ``(n_outputs, n_inputs)``,
+        zero for the constant outputs.
+    """
+    # The outputs are centered to reduce the variance of the first-order estimator.
+    f_ab = f_ab - f_a.mean(axis=0)
+    f_b = f_b - f_a.mean(axis=0)
+    f_a = f_a - f_a.mean(axis=0)
+    variance = concatenate([f_a, f_b]).var(axis=0)
+    variance = where(variance > 0, variance, inf)
+    first_order = (f_b * (f_ab - f_a)).mean(axis=1) / variance
+    total_order = 0.5 * ((f_a - f_ab) ** 2).mean(axis=1) / variance
+    return first_order.T, total_order.T
+
+
+def compute_sobol_indices(
+    scenario: EnergyScenario,
+    n_samples: int,
+    seed: int = 0,
+    n_bootstrap: int = 100,
+    confidence_level: float = 0.95,
+    chunk_size: int = 10000,
+) -> SobolResult:
+    """Estimate the Sobol' indices of the outputs of an energy scenario.
+
+    The uncertain parameters are sampled as with :func:`.generate_samples`
+    following a Saltelli design of ``n_samples * (n_inputs + 2)`` samples
+    evaluated in batch.
+    The confidence intervals are estimated by bootstrap over the ``n_samples`` rows
+    of the design.
+
+    Args:
+        scenario: The energy scenario.
+        n_samples: The number of samples of each matrix of the design.
+        seed: The seed of the random number generator.
+        n_bootstrap: The number of bootstrap replicates.
+        confidence_level: The level of the confidence intervals.
+        chunk_size: The maximum number of samples evaluated at once.
+
+    Returns:
+        The Sobol' indices of the uncertain parameters.
+    """
+    parameter_store = scenario.parameter_store
+    indices = _get_uncertain_indices(parameter_store)
+    a_seed, b_seed, bootstrap_seed = SeedSequence(seed).spawn(3)
+    a = generate_samples(parameter_store, n_samples, a_seed)
+    b = generate_samples(parameter_store, n_samples, b_seed)
+    design = [a, b]
+    for i in indices:
+        ab = a.copy()
+        ab[:, i] = b[:, i]
+        design.append(ab)
+
+    outputs = _evaluate(scenario, concatenate(design), chunk_size).reshape(
+        len(design), n_samples, -1
+    )
+    f_a, f_b, f_ab = outputs[0], outputs[1], outputs[2:]
+    first_order, total_order = _compute_sobol_estimators(f_a, f_b, f_ab)
+
+    rng = default_rng(bootstrap_seed)
+    bootstrap = [[], []]
+    for _ in range(n_bootstrap):
+        rows = rng.integers(n_samples, size=n_samples)
+        estimators = _compute_sobol_estimators(f_a[rows], f_b[rows], f_ab[:, rows])
+        for replicates, estimator in zip(bootstrap, estimators):
+            replicates.append(estimator)
+    quantiles = 50 * (1 - confidence_level), 50 * (1 + confidence_level)
+    first_order_interval, total_order_interval = (
+        percentile(stack(replicates), quantiles, axis=0) for replicates in bootstrap
+    )
+    return SobolResult(
+        tuple(parameter_store.names[i] for i in indices),
+        ("total_cost", *scenario.cost_output_names),
+        first_order,
+        total_order,
+        first_order_interval,
+        total_order_interval,
+    )
+
+
+def compute_morris_indices(
+    scenario: EnergyScenario,
+    n_trajectories: int,
+    n_levels: int = 4,
+    seed: int = 0,
+    chunk_size: int = 10000,
+) -> MorrisResult:
+    """Estimate the Morris indices of the outputs of an energy scenario.
+
+    The uncertain parameters vary over ``n_levels`` levels evenly spaced between
+    their bounds, along ``n_trajectories`` random one-at-a-time trajectories
+    of ``n_inputs + 1`` samples evaluated in batch.
+
+    Args:
+        scenario: The energy scenario.
+        n_trajectories: The number of trajectories.
+        n_levels: The number of levels, which must be even.
+        seed: The seed of the random number generator.
+        chunk_size: The maximum number of samples evaluated at once.
+
+    Returns:
+        The Morris indices of the uncertain parameters.
+
+    Raises:
+        ValueError: When the number of levels is not even.
+    """
+    if n_levels < 2 or n_levels % 2:
+        raise ValueError(f"The number of levels must be even, got {n_levels}.")
+
+    parameter_store = scenario.parameter_store
+    indices = _get_uncertain_indices(parameter_store)
+    n_inputs = indices.size
+    rng = default_rng(seed)
+    delta = n_levels / (2 * (n_levels - 1))
+    signs = rng.choice([-1.0, 1.0], (n_trajectories, n_inputs))
+    orders = rng.random((n_trajectories, n_inputs)).argsort(axis=1)
+    trajectories = arange(n_trajectories)[:, None]
+
+    # The trajectories in the unit hypercube,
+    # shaped as (n_trajectories, n_inputs + 1, n_inputs).
+    points = empty((n_trajectories, n_inputs + 1, n_inputs))
+    points[:, 0] = rng.integers(n_levels // 2, size=(n_trajectories, n_inputs)) / (
+        n_levels - 1
+    ) + delta * (signs < 0)
+    steps = signs[trajectories, orders] * delta
+    for k in range(n_inputs):
+        points[:, k + 1] = points[:, k]
+        points[trajectories[:, 0], k + 1, orders[:, k]] += steps[:, k]
+
+    min_values = parameter_store.min_values[indices]
+    max_values = parameter_store.max_values[indices]
+    samples = tile(parameter_store.default_values, (points.size // n_inputs, 1))
+    samples[:, indices] = min_values + points.reshape(-1, n_inputs) * (
+        max_values - min_values
+    )
+    outputs = _evaluate(scenario, samples, chunk_size).reshape(
+        n_trajectories, n_inputs + 1, -1
+    )
+
+    # The elementary effects shaped as (n_trajectories, n_inputs, n_outputs).
+    effects = empty((n_trajectories, n_inputs, outputs.shape[-1]))
+    effects[trajectories, orders] = (outputs[:, 1:] - outputs[:, :-1]) / steps[
+        ..., None
+    ]
+    effects = moveaxis(effects, -1, 0)
+    return MorrisResult(
+        tuple(parameter_store.names[i] for i in indices),
+        ("total_cost", *scenario.cost_output_names),
+        effects.mean(axis=1),
+        abs(effects).mean(axis=1),
+        effects.std(axis=1, ddof=min(1, n_trajectories - 1)),
+    )
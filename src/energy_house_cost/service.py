@@ -0,0 +1,330 @@
+"""A local evaluation service batching concurrent queries.
+
+The queries are collected into micro-batches evaluated at once
+by :func:`.compute_cost_batch`, e.g. to serve a web front end::
+
+    evaluator = BatchingEvaluator(energy_items, 15)
+    asyncio.run(serve(evaluator, port=8080))
+
+The service answers HTTP requests on a TCP port or on a Unix socket:
+
+- ``POST /evaluate`` with a JSON object of parameter values returns
+  ``{"total_cost": ..., "cost_per_year_per_component": [[...], ...]}``,
+- ``GET /metrics`` returns the metrics of :meth:`ServiceMetrics.get_summary`.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from collections import deque
+from math import isfinite
+from numbers import Real
+from time import perf_counter
+from typing import Mapping
+from typing import Sequence
+
+from numpy import ndarray
+from numpy import percentile
+from numpy import stack
+
+from energy_house_cost.energy_item import create_parameter_store
+from energy_house_cost.energy_item import EnergyItem
+from energy_house_cost.evaluation import compute_cost_batch
+
+LOGGER = logging.getLogger(__name__)
+
+
+class ServiceMetrics:
+    """The latency and throughput of the evaluation of the queries."""
+
+    def __init__(self, max_latencies: int = 100000):
+        """Constructor.
+
+        Args:
+            max_latencies: The number of latest latencies used by the percentiles.
+        """
+        self.n_queries = 0
+        self.n_batches = 0
+        self.latencies = deque(maxlen=max_latencies)
+        """The latest latencies in seconds."""
+
+        self.__start = None
+        self.__stop = None
+
+    def record_batch(self, latencies: Sequence[float]):
+        """Record the evaluation of a batch.
+
+        Args:
+            latencies: The latencies in seconds of the queries of the batch,
+                from their reception to their result.
+        """
+        now = perf_counter()
+        if self.__start is None:
+            self.__start = now - max(latencies)
+        self.__stop = now
+        self.n_queries += len(latencies)
+        self.n_batches += 1
+        self.latencies.extend(latencies)
+
+    def get_summary(self) -> dict[str, float]:
+        """Return the metrics.
+
+        Returns:
+            The numbers of queries and batches, the mean batch size,
+            the throughput in queries per second
+            from the first query to the latest batch,
+            and the 50th and 99th percentiles of the latency in seconds.
+        """
+        summary = {
+            "n_queries": self.n_queries,
+            "n_batches": self.n_batches,
+            "mean_batch_size": 0.0,
+            "throughput": 0.0,
+            "latency_p50": 0.0,
+            "latency_p99": 0.0,
+        }
+        if not self.n_batches:
+            return summary
+
+        summary["mean_batch_size"] = self.n_queries / self.n_batches
+        duration = self.__stop - self.__start
+        if duration > 0:
+            summary["throughput"] = self.n_queries / duration
+        summary["latency_p50"], summary["latency_p99"] = percentile(
+            self.latencies, (50, 99)
+        ).tolist()
+        return summary
+
+
+class BatchingEvaluator:
+    """An evaluator of energy items batching the concurrent queries.
+
+    A query waits at most :attr:`max_wait` seconds for other queries
+    to be evaluated with it,
+    and a batch is evaluated as soon as it has :attr:`max_batch_size` queries.
+    The batches are evaluated one at a time in a thread,
+    while the next queries are collected.
+    """
+
+    def __init__(
+        self,
+        energy_items: Sequence[EnergyItem],
+        duration_years: int,
+        max_batch_size: int = 256,
+        max_wait: float = 0.002,
+    ):
+        """Constructor.
+
+        Args:
+            energy_items: The energy items.
+            duration_years: The period in years over which the cost is computed.
+            max_batch_size: The maximum number of queries per batch.
+            max_wait: The maximum time in seconds to wait for the queries of a batch.
+        """
+        self.energy_items = energy_items
+        self.duration_years = duration_years
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.parameter_store = create_parameter_store(energy_items)
+        self.metrics = ServiceMetrics()
+        self.__queue = None
+        self.__worker = None
+
+    async def evaluate(
+        self, parameter_values: Mapping[str, float]
+    ) -> tuple[float, ndarray]:
+        """Evaluate the energy items with a batch of concurrent queries.
+
+        Args:
+            parameter_values: The values of the uncertain parameters,
+                the missing ones keeping their default value.
+
+        Returns:
+            total_cost: The integrated cost in euros.
+            cost_per_year_per_component: The cost in euros
+                shaped as ``(duration_years, n_items)``.
+
+        Raises:
+            ValueError: When a parameter is unknown, is not a finite number
+                or is out of its bounds.
+        """
+        for name, value in parameter_values.items():
+            if (
+                not isinstance(value, Real)
+                or isinstance(value, bool)
+                or not isfinite(value)
+            ):
+                raise ValueError(
+                    f"The value of the parameter {name} should be a finite number,"
+                    f" got {value!r}."
+                )
+        values = self.parameter_store.to_array(parameter_values)[0]
+        self.parameter_store.check(values)
+        if self.__worker is None or self.__worker.done():
+            self.__queue = asyncio.Queue()
+            self.__worker = asyncio.get_running_loop().create_task(self.__run())
+        future = asyncio.get_running_loop().create_future()
+        await self.__queue.put((perf_counter(), values, future))
+        return await future
+
+    async def close(self):
+        """Stop evaluating the queries."""
+        if self.__worker is not None:
+            self.__worker.cancel()
+            try:
+                await self.__worker
+            except asyncio.CancelledError:
+                pass
+            self.__worker = None
+
+    async def __collect_batch(self) -> list[tuple[float, ndarray, asyncio.Future]]:
+        """Wait for the queries of the next batch."""
+        batch = [await self.__queue.get()]
+        deadline = batch[0][0] + self.max_wait
+        while len(batch) < self.max_batch_size:
+            if not self.__queue.empty():
+                batch.append(self.__queue.get_nowait())
+                continue
+            timeout = deadline - perf_counter()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self.__queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def __run(self):
+        """Evaluate the batches of queries until cancelled."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = await self.__collect_batch()
+            try:
+                total_cost, cost_per_year_per_component = await loop.run_in_executor(
+                    None,
+                    compute_cost_batch,
+                    self.energy_items,
+                    self.duration_years,
+                    stack([values for _, values, _ in batch]),
+                    self.parameter_store,
+                )
+            except Exception as error:
+                for _, _, future in batch:
+                    if not future.done():
+                        future.set_exception(error)
+                continue
+
+            now = perf_counter()
+            for i, (_, _, future) in enumerate(batch):
+                if not future.done():
+                    future.set_result(
+                        (float(total_cost[i]), cost_per_year_per_component[i])
+                    )
+            self.metrics.record_batch([now - start for start, _, _ in batch])
+
+
+def _create_response(status: str, data: object, keep_alive: bool) -> bytes:
+    """Create an HTTP response with a JSON body."""
+    body = json.dumps(data).encode()
+    return (
+        f"HTTP/1.1 {status}\r\n"
+        "Content-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+    ).encode() + body
+
+
+async def _handle_request(
+    evaluator: BatchingEvaluator, method: str, path: str, body: bytes
+) -> tuple[str, object]:
+    """Return the status and the data of the response to an HTTP request."""
+    if method == "GET" and path == "/metrics":
+        return "200 OK", evaluator.metrics.get_summary()
+
+    if method == "POST" and path == "/evaluate":
+        try:
+            parameter_values = json.loads(body or b"{}")
+            if not isinstance(parameter_values, dict):
+                raise ValueError("The parameter values must be a JSON object.")
+            total_cost, cost_per_year_per_component = await evaluator.evaluate(
+                parameter_values
+            )
+        except ValueError as error:
+            return "400 Bad Request", {"error": str(error)}
+        return "200 OK", {
+            "total_cost": total_cost,
+            "cost_per_year_per_component": cost_per_year_per_component.tolist(),
+        }
+
+    return "404 Not Found", {"error": f"Unknown resource {method} {path}."}
+
+
+async def _handle_connection(
+    evaluator: BatchingEvaluator,
+    reader: asyncio.StreamReader,
+    writer: asyncio.StreamWriter,
+):
+    """Answer the HTTP requests of a connection."""
+    try:
+        while True:
+            request_line = await reader.readline()
+            if not request_line.strip():
+                break
+            method, path, version = request_line.decode("latin-1").split()
+            headers = {}
+            while True:
+                line = await reader.readline()
+                if line in (b"\r\n", b"\n", b""):
+                    break
+                name, _, value = line.decode("latin-1").partition(":")
+                headers[name.strip().lower()] = value.strip()
+            body = await reader.readexactly(int(headers.get("content-length", 0)))
+            keep_alive = (
+                headers.get("connection", "").lower() != "close"
+                and version == "HTTP/1.1"
+            )
+            status, data = await _handle_request(evaluator, method, path, body)
+            writer.write(_create_response(status, data, keep_alive))
+            await writer.drain()
+            if not keep_alive:
+                break
+    except (ValueError, ConnectionError, asyncio.IncompleteReadError) as error:
+        LOGGER.debug("Closing a connection: %s", error)
+    finally:
+        writer.close()
+
+
+async def serve(
+    evaluator: BatchingEvaluator,
+    host: str = "127.0.0.1",
+    port: int = 8080,
+    unix_socket_path: str | None = None,
+):
+    """Serve the evaluations of energy items over HTTP until cancelled.
+
+    Args:
+        evaluator: The evaluator of the energy items.
+        host: The host of the TCP server.
+        port: The port of the TCP server.
+        unix_socket_path: The path to the Unix socket.
+            If ``None``, listen on the TCP port.
+    """
+
+    def handle_connection(reader, writer):
+        return _handle_connection(evaluator, reader, writer)
+
+    if unix_socket_path is None:
+        server = await asyncio.start_server(handle_connection, host, port)
+    else:
+        server = await asyncio.start_unix_server(handle_connection, unix_socket_path)
+
+    LOGGER.info(
+        "Serving the evaluations on %s",
+        ", ".join(str(socket.getsockname()) for socket in server.sockets),
+    )
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        await evaluator.close()
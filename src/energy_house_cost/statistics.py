@@ -0,0 +1,239 @@
+from __future__ import annotations
+
+from typing import Sequence
+
+from numpy import atleast_2d
+from numpy import concatenate
+from numpy import cumsum
+from numpy import empty
+from numpy import full
+from numpy import inf
+from numpy import maximum
+from numpy import minimum
+from numpy import ndarray
+from numpy import sort
+from numpy import sqrt
+from numpy import take_along_axis
+from numpy import zeros
+from numpy.typing import NDArray
+
+
+class QuantileSketch:
+    """A mergeable sketch of the quantiles of several outputs.
+
+    The samples are stored in levels of at most ``capacity`` samples,
+    the samples of level ``h`` standing for ``2**h`` samples each.
+    When a level is full, its samples are sorted and every other one is promoted
+    to the next level, alternating between the odd and even ones.
+    Every such compaction shifts the ranks by at most the weight of the level
+    and there are at most ``n_samples / (capacity * 2**h)`` compactions at level
+    ``h``, so the rank of an estimated quantile is within
+    :attr:`rank_error_bound` ``* n_samples`` of the exact one.
+    The memory is at most ``capacity * log2(n_samples / capacity)`` samples.
+    """
+
+    def __init__(self, n_outputs: int, capacity: int = 1024):
+        """Constructor.
+
+        Args:
+            n_outputs: The number of outputs.
+            capacity: The maximum number of samples per level.
+        """
+        self.n_outputs = n_outputs
+        self.capacity = capacity
+        self.n_samples = 0
+        self.__levels = []
+        self.__n_compactions = []
+
+    @property
+    def rank_error_bound(self) -> float:
+        """The bound of the error on the rank of a quantile relative to the number of
+        samples."""
+        return (len(self.__levels) - 1) / self.capacity if self.__levels else 0.0
+
+    def update(self, samples: NDArray[float]):
+        """Add samples.
+
+        Args:
+            samples: The samples shaped as ``(n_samples, n_outputs)``.
+        """
+        self.n_samples += len(samples)
+        self.__add(0, samples)
+
+    def merge(self, other: QuantileSketch):
+        """Add the samples of another sketch.
+
+        Args:
+            other: The other sketch.
+        """
+        self.n_samples += other.n_samples
+        for level, samples in enumerate(other.__levels):
+            self.__add(level, samples)
+
+    def __add(self, level: int, samples: ndarray):
+        """Add samples to a level and compact the full levels."""
+        while samples.size:
+            while level >= len(self.__levels):
+                self.__levels.append(empty((0, self.n_outputs)))
+                self.__n_compactions.append(0)
+            samples = concatenate([self.__levels[level], samples])
+            if len(samples) < self.capacity:
+                self.__levels[level] = samples
+                return
+
+            # Keep one sample when their number is odd.
+            n_promoted = len(samples) // 2
+            samples = sort(samples, axis=0)
+            offset = self.__n_compactions[level] % 2
+            self.__n_compactions[level] += 1
+            self.__levels[level] = samples[2 * n_promoted :]
+            samples = samples[offset : 2 * n_promoted : 2]
+            level += 1
+
+    def compute_quantile(self, probability: float) -> ndarray:
+        """Estimate the quantile of the outputs.
+
+        Args:
+            probability: The probability of being lower than the quantile.
+
+        Returns:
+            The quantile shaped as ``(n_outputs,)``.
+
+        Raises:
+            ValueError: When the sketch is empty.
+        """
+        if not self.n_samples:
+            raise ValueError("The sketch is empty.")
+
+        samples = concatenate(self.__levels)
+        weights = concatenate(
+            [
+                full(len(samples_), 2.0**level)
+                for level, samples_ in enumerate(self.__levels)
+            ]
+        )
+        order = samples.argsort(axis=0)
+        cumulated_weights = cumsum(weights[order], axis=0)
+        i = (cumulated_weights < probability * cumulated_weights[-1]).sum(axis=0)
+        i = minimum(i, len(samples) - 1)
+        return take_along_axis(samples, take_along_axis(order, i[None], 0), 0)[0]
+
+
+class OnlineStatistics:
+    """Statistics of outputs updated with batches of samples.
+
+    The mean and the variance are updated with the Welford algorithm generalized
+    to batches, and the quantiles are estimated with a :class:`QuantileSketch`.
+    Statistics computed from different samples, e.g. by different processes,
+    can be merged.
+    """
+
+    def __init__(self, output_names: Sequence[str], capacity: int = 1024):
+        """Constructor.
+
+        Args:
+            output_names: The names of the outputs.
+            capacity: The capacity of the quantile sketch.
+        """
+        self.output_names = tuple(output_names)
+        n_outputs = len(self.output_names)
+        self.n_samples = 0
+        self.mean = zeros(n_outputs)
+        self.min = full(n_outputs, inf)
+        self.max = full(n_outputs, -inf)
+        self.sketch = QuantileSketch(n_outputs, capacity)
+        self.__m2 = zeros(n_outputs)
+
+    def update(self, samples: NDArray[float]):
+        """Add samples.
+
+        Args:
+            samples: The samples shaped as ``(n_samples, n_outputs)``,
+                or ``(n_samples,)`` for a single output.
+        """
+        samples = atleast_2d(samples.T).T
+        if not len(samples):
+            return
+        mean = samples.mean(axis=0)
+        self.__combine(len(samples), mean, ((samples - mean) ** 2).sum(axis=0))
+        self.min = minimum(self.min, samples.min(axis=0))
+        self.max = maximum(self.max, samples.max(axis=0))
+        self.sketch.update(samples)
+
+    def merge(self, other: OnlineStatistics):
+        """Add the samples of other statistics.
+
+        Args:
+            other: The other statistics.
+        """
+        if not other.n_samples:
+            return
+        self.__combine(other.n_samples, other.mean, other.__m2)
+        self.min = minimum(self.min, other.min)
+        self.max = maximum(self.max, other.max)
+        self.sketch.merge(other.sketch)
+
+    def __combine(self, n_samples: int, mean: ndarray, m2: ndarray):
+        """Combine the moments with the ones of other samples."""
+        total = self.n_samples + n_samples
+        delta = mean - self.mean
+        self.mean = self.mean + delta * (n_samples / total)
+        self.__m2 = self.__m2 + m2 + delta**2 * (self.n_samples * n_samples / total)
+        self.n_samples = total
+
+    def __to_dict(self, values: ndarray) -> dict[str, float]:
+        return dict(zip(self.output_names, values.tolist()))
+
+    def __get_standard_deviation(self) -> ndarray:
+        return sqrt(self.__m2 / max(self.n_samples - 1, 1))
+
+    def compute_mean(self) -> dict[str, float]:
+        """Return the mean of every output."""
+        return self.__to_dict(self.mean)
+
+    def compute_variance(self) -> dict[str, float]:
+        """Return the unbiased variance of every output."""
+        return self.__to_dict(self.__m2 / max(self.n_samples - 1, 1))
+
+    def compute_standard_deviation(self) -> dict[str, float]:
+        """Return the unbiased standard deviation of every output."""
+        return self.__to_dict(self.__get_standard_deviation())
+
+    def compute_variation_coefficient(self) -> dict[str, float]:
+        """Return the standard deviation of every output divided by its mean."""
+        return self.__to_dict(self.__get_standard_deviation() / self.mean)
+
+    def compute_margin(self, std_factor: float) -> dict[str, float]:
+        """Return the mean of every output plus a factor of its standard deviation.
+
+        Args:
+            std_factor: The factor of the standard deviation.
+        """
+        return self.__to_dict(self.mean + std_factor * self.__get_standard_deviation())
+
+    def compute_quantile(self, probability: float) -> dict[str, float]:
+        """Estimate the quantile of every output.
+
+        The rank of the estimated quantile differs from the exact one by at most
+        ``sketch.rank_error_bound * n_samples``.
+
+        Args:
+            probability: The probability of being lower than the quantile.
+        """
+        return self.__to_dict(self.sketch.compute_quantile(probability))
+
+    def compute_quartile(self, order: int) -> dict[str, float]:
+        """Estimate a quartile of every output.
+
+        Args:
+            order: The order of the quartile, either 1, 2 or 3.
+        """
+        return self.compute_quantile(0.25 * order)
+
+    def compute_percentile(self, order: int) -> dict[str, float]:
+        """Estimate a percentile of every output.
+
+        Args:
+            order: The order of the percentile, between 0 and 100.
+        """
+        return self.compute_quantile(0.01 * order)
@@ -0,0 +1,273 @@
+from __future__ import annotations
+
+from itertools import combinations_with_replacement
+from pathlib import Path
+from typing import Sequence
+from typing import TYPE_CHECKING
+
+import numpy as np
+from numpy import arange
+from numpy import atleast_2d
+from numpy import flatnonzero
+from numpy import ndarray
+from numpy import sqrt
+from numpy import zeros
+from numpy.linalg import lstsq
+from numpy.random import default_rng
+from numpy.typing import NDArray
+
+from energy_house_cost.sampling import generate_samples
+
+if TYPE_CHECKING:
+    from energy_house_cost.energy_scenario import EnergyScenario
+
+
+class PolynomialSurrogate:
+    """A polynomial approximation of the cost per year per energy item.
+
+    The polynomial of total degree :attr:`degree` is fitted by least squares
+    on the inputs scaled to ``[-1, 1]``.
+    Since the fit is linear, the total cost is the sum of the approximated costs.
+    """
+
+    def __init__(
+        self,
+        input_names: Sequence[str],
+        default_values: NDArray[float],
+        cost_output_names: Sequence[str],
+        duration_years: int,
+        degree: int = 2,
+    ):
+        """Constructor.
+
+        Args:
+            input_names: The names of the uncertain parameters.
+            default_values: The default values of the uncertain parameters.
+            cost_output_names: The names of the outputs of the energy items,
+                see :attr:`.EnergyScenario.cost_output_names`.
+            duration_years: The period in years over which the cost is computed.
+            degree: The total degree of the polynomial.
+        """
+        self.input_names = tuple(input_names)
+        self.default_values = np.asarray(default_values, dtype=float)
+        self.cost_output_names = tuple(cost_output_names)
+        self.duration_years = duration_years
+        self.degree = degree
+        self.cross_validation_error = {}
+        """The root mean square error of the cross-validation relative to the
+        standard deviation of the outputs, for ``"total_cost"`` and the integrated
+        cost of every energy item."""
+
+        self.__active_indices = arange(0)
+        self.__center = self.__scale = zeros(0)
+        self.__exponents = zeros((0, 0), dtype=int)
+        self.__coefficients = zeros((0, 0))
+
+    @classmethod
+    def from_scenario(cls, scenario: EnergyScenario, degree: int = 2):
+        """Create an unfitted surrogate of an energy scenario.
+
+        Args:
+            scenario: The energy scenario.
+            degree: The total degree of the polynomial.
+
+        Returns:
+            The surrogate.
+        """
+        return cls(
+            scenario.parameter_store.names,
+            scenario.parameter_store.default_values,
+            scenario.cost_output_names,
+            scenario.duration_years,
+            degree,
+        )
+
+    def __compute_basis(self, inputs: ndarray) -> ndarray:
+        """Evaluate the monomials at inputs shaped as ``(n_samples, n_inputs)``."""
+        scaled_inputs = (
+            inputs[:, self.__active_indices] - self.__center
+        ) / self.__scale
+        return (scaled_inputs[:, None, :] ** self.__exponents).prod(axis=-1)
+
+    def fit(self, inputs: NDArray[float], cost_per_year_per_component: NDArray[float]):
+        """Fit the surrogate.
+
+        The inputs that do not vary are ignored.
+
+        Args:
+            inputs: The samples shaped as ``(n_samples, n_inputs)``.
+            cost_per_year_per_component: The cost in euros
+                shaped as ``(n_samples, duration_years, n_items)``.
+
+        Raises:
+            ValueError: When there are fewer samples than monomials.
+        """
+        lower = inputs.min(axis=0)
+        upper = inputs.max(axis=0)
+        self.__active_indices = flatnonzero(upper > lower)
+        self.__center = 0.5 * (upper + lower)[self.__active_indices]
+        self.__scale = 0.5 * (upper - lower)[self.__active_indices]
+        n_active = self.__active_indices.size
+        exponents = [zeros(n_active, dtype=int)]
+        for degree in range(1, self.degree + 1):
+            for indices in combinations_with_replacement(range(n_active), degree):
+                exponents.append(np.bincount(indices, minlength=n_active))
+        self.__exponents = np.array(exponents)
+        if len(inputs) < len(exponents):
+            raise ValueError(
+                f"The surrogate needs at least {len(exponents)} samples,"
+                f" got {len(inputs)}."
+            )
+
+        self.__coefficients = lstsq(
+            self.__compute_basis(inputs),
+            cost_per_year_per_component.reshape(len(inputs), -1),
+            rcond=None,
+        )[0]
+
+    def predict(self, inputs: NDArray[float]) -> tuple[ndarray, ndarray]:
+        """Approximate the cost of the energy scenario.
+
+        Args:
+            inputs: The samples shaped as ``(n_samples, n_inputs)``.
+
+        Returns:
+            total_cost: the integrated cost in euros shaped as ``(n_samples,)``.
+            cost_per_year_per_component: the cost in euros
+                shaped as ``(n_samples, duration_years, n_items)``.
+        """
+        inputs = atleast_2d(inputs)
+        cost_per_year_per_component = (
+            self.__compute_basis(inputs) @ self.__coefficients
+        ).reshape(len(inputs), self.duration_years, -1)
+        return cost_per_year_per_component.sum(axis=(1, 2)), cost_per_year_per_component
+
+    def cross_validate(
+        self,
+        inputs: NDArray[float],
+        cost_per_year_per_component: NDArray[float],
+        n_folds: int = 5,
+        seed: int = 0,
+    ) -> dict[str, float]:
+        """Estimate the error of the surrogate by cross-validation, then fit it.
+
+        Args:
+            inputs: The samples shaped as ``(n_samples, n_inputs)``.
+            cost_per_year_per_component: The cost in euros
+                shaped as ``(n_samples, duration_years, n_items)``.
+            n_folds: The number of folds.
+            seed: The seed of the random shuffling of the samples.
+
+        Returns:
+            The relative errors, also stored in :attr:`cross_validation_error`.
+        """
+        folds = np.array_split(default_rng(seed).permutation(len(inputs)), n_folds)
+        predictions = np.empty_like(cost_per_year_per_component)
+        for fold in folds:
+            is_trained = np.ones(len(inputs), dtype=bool)
+            is_trained[fold] = False
+            self.fit(inputs[is_trained], cost_per_year_per_component[is_trained])
+            predictions[fold] = self.predict(inputs[fold])[1]
+
+        self.fit(inputs, cost_per_year_per_component)
+        item_costs = cost_per_year_per_component.sum(axis=1)
+        predicted_item_costs = predictions.sum(axis=1)
+        outputs = np.column_stack([item_costs.sum(axis=1), item_costs])
+        predicted_outputs = np.column_stack(
+            [predicted_item_costs.sum(axis=1), predicted_item_costs]
+        )
+        standard_deviation = outputs.std(axis=0)
+        error = sqrt(((predicted_outputs - outputs) ** 2).mean(axis=0)) / np.where(
+            standard_deviation > 0, standard_deviation, 1.0
+        )
+        self.cross_validation_error = dict(
+            zip(("total_cost", *self.cost_output_names), error.tolist())
+        )
+        return self.cross_validation_error
+
+    def save(self, path: str | Path):
+        """Save the fitted surrogate in a ``.npz`` file.
+
+        Args:
+            path: The path to the file.
+        """
+        np.savez(
+            path,
+            input_names=np.array(self.input_names),
+            default_values=self.default_values,
+            cost_output_names=np.array(self.cost_output_names),
+            duration_years=self.duration_years,
+            degree=self.degree,
+            cross_validation_error=np.array(list(self.cross_validation_error.values())),
+            active_indices=self.__active_indices,
+            center=self.__center,
+            scale=self.__scale,
+            exponents=self.__exponents,
+            coefficients=self.__coefficients,
+        )
+
+    @classmethod
+    def load(cls, path: str | Path) -> PolynomialSurrogate:
+        """Load a surrogate saved with :meth:`save`.
+
+        Args:
+            path: The path to the file.
+
+        Returns:
+            The surrogate.
+        """
+        with np.load(path) as data:
+            surrogate = cls(
+                data["input_names"].tolist(),
+                data["default_values"],
+                data["cost_output_names"].tolist(),
+                int(data["duration_years"]),
+                int(data["degree"]),
+            )
+            if data["cross_validation_error"].size:
+                surrogate.cross_validation_error = dict(
+                    zip(
+                        ("total_cost", *surrogate.cost_output_names),
+                        data["cross_validation_error"].tolist(),
+                    )
+                )
+            surrogate.__active_indices = data["active_indices"]
+            surrogate.__center = data["center"]
+            surrogate.__scale = data["scale"]
+            surrogate.__exponents = data["exponents"]
+            surrogate.__coefficients = data["coefficients"]
+        return surrogate
+
+
+def train_surrogate(
+    scenario: EnergyScenario,
+    n_samples: int,
+    degree: int = 2,
+    seed: int = 0,
+    n_folds: int = 5,
+) -> PolynomialSurrogate:
+    """Train a polynomial surrogate of an energy scenario on a batch DOE.
+
+    Args:
+        scenario: The energy scenario.
+        n_samples: The number of samples drawn with :func:`.generate_samples`.
+        degree: The total degree of the polynomial.
+        seed: The seed of the random number generator.
+        n_folds: The number of folds of the cross-validation.
+
+    Returns:
+        The fitted surrogate with its cross-validation error.
+    """
+    samples = generate_samples(scenario.parameter_store, n_samples, seed)
+    surrogate = PolynomialSurrogate.from_scenario(scenario, degree)
+    surrogate.cross_validate(samples, scenario.compute_batch(samples)[1], n_folds, seed)
+    return surrogate
+
+
+def __getattr__(name: str):
+    # The gemseo discipline is imported only when used.
+    if name == "SurrogateScenario":
+        from energy_house_cost.energy_scenario import SurrogateScenario
+
+        return SurrogateScenario
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
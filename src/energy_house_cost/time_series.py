@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from pathlib import Path
+
+from numpy import arange
+from numpy import cos
+from numpy import empty
+from numpy import load
+from numpy import maximum
+from numpy import minimum
+from numpy import ndarray
+from numpy import ones
+from numpy import pi
+from numpy import sin
+from numpy.typing import NDArray
+
+HOURS_PER_YEAR = 8760
+"""The number of steps of an hourly profile over one year."""
+
+QUARTER_HOURS_PER_YEAR = 4 * HOURS_PER_YEAR
+"""The number of steps of a 15-minute profile over one year."""
+
+MONTHS_PER_YEAR = 12
+"""The number of steps of a monthly profile over one year."""
+
+_DAYS_PER_YEAR = 365
+
+
+def _get_days(n_steps: int) -> ndarray:
+    """Return the day of the year at the middle of every time step."""
+    return (arange(n_steps) + 0.5) * _DAYS_PER_YEAR / n_steps
+
+
+def _normalize(profile: ndarray, annual_kwh: float) -> ndarray:
+    return profile * (annual_kwh / profile.sum())
+
+
+def create_flat_profile(annual_kwh: float, n_steps: int = HOURS_PER_YEAR) -> ndarray:
+    """Create a profile of energy evenly distributed over one year.
+
+    Args:
+        annual_kwh: The energy in kWh over the year.
+        n_steps: The number of time steps, e.g. :data:`HOURS_PER_YEAR`.
+
+    Returns:
+        The energy in kWh per time step.
+    """
+    return _normalize(ones(n_steps), annual_kwh)
+
+
+def create_heating_profile(
+    annual_kwh: float, n_steps: int = HOURS_PER_YEAR, base_ratio: float = 0.1
+) -> ndarray:
+    """Create a seasonal profile of energy consumed for heating.
+
+    The consumption peaks mid-January and vanishes in summer,
+    except for a base consumption.
+
+    Args:
+        annual_kwh: The energy in kWh over the year.
+        n_steps: The number of time steps, e.g. :data:`HOURS_PER_YEAR`.
+        base_ratio: The base consumption relative to the peak consumption.
+
+    Returns:
+        The energy in kWh per time step.
+    """
+    season = maximum(cos(2 * pi * (_get_days(n_steps) - 15) / _DAYS_PER_YEAR), 0.0)
+    return _normalize(base_ratio + season, annual_kwh)
+
+
+def create_pv_profile(annual_kwh: float, n_steps: int = HOURS_PER_YEAR) -> ndarray:
+    """Create a profile of energy produced by photovoltaic panels.
+
+    The production peaks at the summer solstice and, for hourly profiles, at noon,
+    with no production at night.
+
+    Args:
+        annual_kwh: The energy in kWh over the year.
+        n_steps: The number of time steps, e.g. :data:`HOURS_PER_YEAR`.
+
+    Returns:
+        The energy in kWh per time step.
+    """
+    profile = 1 + 0.5 * cos(2 * pi * (_get_days(n_steps) - 172) / _DAYS_PER_YEAR)
+    if n_steps == HOURS_PER_YEAR:
+        hours = arange(n_steps) % 24
+        profile *= maximum(sin(pi * (hours - 6) / 12), 0.0)
+    return _normalize(profile, annual_kwh)
+
+
+def compute_self_consumption(
+    production: NDArray[float], consumption: NDArray[float]
+) -> tuple[ndarray, ndarray]:
+    """Compute the energy produced and consumed on site or injected in the grid.
+
+    Args:
+        production: The energy produced in kWh per time step,
+            shaped as ``(..., n_steps)``.
+        consumption: The energy consumed in kWh per time step,
+            shaped as ``(..., n_steps)``.
+
+    Returns:
+        The energy self-consumed and the energy injected in kWh over the time steps,
+        shaped as ``(...)``.
+    """
+    self_consumed = minimum(production, consumption).sum(axis=-1)
+    injected = maximum(production - consumption, 0.0).sum(axis=-1)
+    return self_consumed, injected
+
+
+# The modification time is part of the key so that a modified file is mapped again,
+# and the size is bounded since every map keeps its file open.
+@lru_cache(maxsize=32)
+def _load_memory_map(path: Path, mtime: int) -> ndarray:
+    return load(path, mmap_mode="r")
+
+
+def load_series(path: str | Path, column: int | None = None) -> ndarray:
+    """Load a time series from a ``.npy`` file without reading it.
+
+    The file is memory-mapped read-only once per process and per modification,
+    so that the series loaded from the same file share the same memory,
+    which the operating system reads on demand.
+
+    Args:
+        path: The path to a ``.npy`` file storing an array
+            shaped as ``(n_steps,)`` or ``(n_steps, n_columns)``,
+            preferably in Fortran order so that the columns are contiguous.
+        column: The column of a two-dimensional array.
+            If ``None``, the array must be one-dimensional.
+
+    Returns:
+        The memory-mapped series shaped as ``(n_steps,)``.
+
+    Raises:
+        ValueError: When the dimension of the array does not match ``column``.
+    """
+    path = Path(path).resolve()
+    series = _load_memory_map(path, path.stat().st_mtime_ns)
+    if column is None:
+        if series.ndim != 1:
+            raise ValueError(
+                f"The series stored in {path} has {series.ndim} dimensions;"
+                " a column must be given."
+            )
+        return series
+
+    if series.ndim != 2:
+        raise ValueError(
+            f"The series stored in {path} has {series.ndim} dimensions"
+            " but a column is given."
+        )
+    return series[:, column]
+
+
+def compute_yearly_means(series: ndarray, steps_per_year: int) -> ndarray:
+    """Compute the mean of a time series over every complete year.
+
+    The series is read one year at a time,
+    so that a memory-mapped series is never loaded at once.
+
+    Args:
+        series: The time series shaped as ``(n_steps,)``.
+        steps_per_year: The number of steps per year,
+            e.g. :data:`QUARTER_HOURS_PER_YEAR`.
+
+    Returns:
+        The means shaped as ``(n_steps // steps_per_year,)``,
+        ignoring the steps of the last incomplete year.
+
+    Raises:
+        ValueError: When the series does not cover a complete year.
+    """
+    n_years = len(series) // steps_per_year
+    if not n_years:
+        raise ValueError(
+            f"The series has {len(series)} steps,"
+            f" less than the {steps_per_year} steps of one year."
+        )
+    means = empty(n_years)
+    for year in range(n_years):
+        means[year] = series[year * steps_per_year : (year + 1) * steps_per_year].mean()
+    return means
@@ -12,6 +12,15 @@ class UncertainParameter:
         self.max_value = max_value if max_value is not None else inf
         self._value = value
 
+    def __copy__(self) -> UncertainParameter:
+        """Return a copy of the parameter."""
+        parameter = UncertainParameter(
+            self.name, self.default_value, self.min_value, self.max_value
+        )
+        parameter.is_uncertain = self.is_uncertain
+        parameter._value = self._value
+        return parameter
+
     @property
     def value(self) -> float:
         return self._value
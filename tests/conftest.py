@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+import pytest
+from energy_house_cost.database import DB_PATH
+from energy_house_cost.database.lib_components import PV
+from energy_house_cost.energetic_components import EnergeticComponent
+from energy_house_cost.energy_cost import EnergyCostProjection
+from energy_house_cost.energy_scenario import EnergyItem
+from energy_house_cost.energy_scenario import EnergyScenario
+
+
+@pytest.fixture
+def scenario():
+    """A scenario with a gas boiler and a PV."""
+    electricity_cost = EnergyCostProjection(DB_PATH / "electricity_cost.json", 15)
+    gas_cost = EnergyCostProjection(DB_PATH / "gas_cost.json", 15)
+    energy_items = [
+        EnergyItem(3400.0, EnergeticComponent("boiler", 7000.0, 100.0, 0.6), gas_cost),
+        EnergyItem(0.0, PV("pv", 5000.0, 0.0), electricity_cost, is_produced=True),
+    ]
+    return EnergyScenario(energy_items, 15)
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from energy_house_cost.cache import compute_fingerprint
+from energy_house_cost.cache import EvaluationCache
+from energy_house_cost.database import DB_PATH
+from energy_house_cost.database.lib_components import PV
+from energy_house_cost.energetic_components import EnergeticComponent
+from energy_house_cost.energy_cost import EnergyCostProjection
+from energy_house_cost.energy_scenario import compute_cost
+from energy_house_cost.energy_scenario import EnergyItem
+from energy_house_cost.energy_scenario import EnergyScenario
+from numpy import arange
+from numpy import array
+from numpy import full
+from numpy import save
+from numpy import zeros
+from pytest import approx
+from pytest import raises
+
+
+def create_energy_items():
+    cost = EnergyCostProjection(DB_PATH / "mock_energy_cost_linear.json", 15)
+    return [EnergyItem(1e3, EnergeticComponent("mock", 10.0, 1.0), cost)]
+
+
+def test_evaluation_cache_lru():
+    cache = EvaluationCache(max_size=2)
+    for i in range(3):
+        cache.set(str(i), float(i), array([float(i)]))
+    assert len(cache) == 2
+    assert cache.get("0") is None
+    assert cache.get("2")[0] == 2.0
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_evaluation_cache_threads(tmp_path):
+    cache = EvaluationCache(max_size=10, path=tmp_path / "cache.db")
+
+    def set_and_get(i):
+        cache.set(str(i), float(i), array([float(i)]))
+        return cache.get(str(i))[0]
+
+    with ThreadPoolExecutor(8) as executor:
+        assert list(executor.map(set_and_get, range(200))) == list(range(200))
+    assert len(cache) == 10
+    assert cache.hits == 200
+
+
+def test_fingerprint():
+    energy_items = create_energy_items()
+    fingerprint = compute_fingerprint(energy_items, 10)
+    assert compute_fingerprint(create_energy_items(), 10) == fingerprint
+    assert compute_fingerprint(energy_items, 11) != fingerprint
+    energy_items[0].component.initial_install_cost = 20.0
+    assert compute_fingerprint(energy_items, 10) != fingerprint
+
+    # The string representation of an object can contain its memory address.
+    energy_items[0].component.other = object()
+    with raises(TypeError, match="A value of type object cannot be fingerprinted."):
+        compute_fingerprint(energy_items, 10)
+
+
+def test_fingerprint_of_series(tmp_path):
+    save(tmp_path / "prices.npy", arange(8.0))
+    definition = {
+        "name": "spot",
+        "energy_name": "electricity",
+        "profile_type": "series",
+        "path": "prices.npy",
+        "steps_per_year": 4,
+    }
+    (tmp_path / "spot.json").write_text(json.dumps(definition))
+    cost = EnergyCostProjection(tmp_path / "spot.json", 2)
+    energy_items = [EnergyItem(1e3, EnergeticComponent("mock"), cost)]
+    fingerprint = compute_fingerprint(energy_items, 2)
+    assert compute_fingerprint(energy_items, 2) == fingerprint
+
+    # The file of the series is rewritten with the same size.
+    stat = (tmp_path / "prices.npy").stat()
+    save(tmp_path / "prices.npy", arange(8.0) + 1.0)
+    os.utime(tmp_path / "prices.npy", ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    assert compute_fingerprint(energy_items, 2) != fingerprint
+
+
+def test_scenario_cache(tmp_path):
+    cache = EvaluationCache(max_size=1, path=tmp_path / "cache.db")
+    scenario = EnergyScenario(create_energy_items(), 10, cache=cache)
+    scenario.execute({"mock_linear.slope": array([1.9])})
+    total_cost = scenario.get_output_data()["total_cost"]
+    scenario.execute({"mock_linear.slope": array([2.1])})
+    scenario.execute({"mock_linear.slope": array([1.9])})
+    assert scenario.get_output_data()["total_cost"] == approx(total_cost)
+    assert (cache.hits, cache.disk_hits, cache.misses) == (1, 1, 2)
+
+    cache = EvaluationCache(path=tmp_path / "cache.db")
+    scenario = EnergyScenario(create_energy_items(), 10, cache=cache)
+    scenario.execute({"mock_linear.slope": array([1.9])})
+    assert scenario.get_output_data()["total_cost"] == approx(total_cost)
+    assert scenario.get_cost_per_year_per_component().shape == (10, 1)
+    assert (cache.hits, cache.misses) == (1, 0)
+
+
+def test_fingerprint_of_long_profiles():
+    cost = EnergyCostProjection(DB_PATH / "electricity_cost.json", 10)
+    # The profiles have the same edges and the same total production.
+    consumption_profile = full(8760, 0.1)
+    consumption_profile[4000:5000] = 1.0
+    production_profiles = [zeros(8760), zeros(8760)]
+    production_profiles[0][4000:5000] = 1.0
+    production_profiles[1][3000:4000] = 1.0
+    cache = EvaluationCache()
+    for production_profile in production_profiles:
+        pv = PV("pv", 5000.0, 0.0, production_profile, consumption_profile)
+        energy_items = [EnergyItem(0.0, pv, cost, is_produced=True)]
+        scenario = EnergyScenario(energy_items, 10, cache=cache)
+        scenario.execute()
+        assert scenario.get_output_data()["total_cost"] == approx(
+            compute_cost(energy_items, 10)[0]
+        )
+    assert cache.misses == 2
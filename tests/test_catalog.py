@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import json
+import os
+
+import pytest
+from energy_house_cost.database import DB_PATH
+from energy_house_cost.database.catalog import Catalog
+from energy_house_cost.energy_cost import EnergyCostProjection
+from numpy import arange
+from pytest import approx
+
+
+def test_catalog():
+    catalog = Catalog()
+    assert "electricity_cost" in catalog.cost_names
+    cost = catalog.get_cost("mock_energy_cost_user_points", 12)
+    other_cost = catalog.get_cost("mock_energy_cost_user_points", 12)
+    reference = EnergyCostProjection(DB_PATH / "mock_energy_cost_user_points.json", 12)
+    assert cost.duration_years == 12
+    assert cost.compute_profile(arange(12), 1.0) == approx(
+        reference.compute_profile(arange(12), 1.0)
+    )
+
+    # The parameters of the costs are independent.
+    cost.parameters["mock_user_points.point1"].value = 0.9
+    assert other_cost.parameters["mock_user_points.point1"].value == 0.3
+    assert cost.compute(5, 1.0) > other_cost.compute(5, 1.0)
+    with pytest.raises(ValueError, match="foo is not an energy cost"):
+        catalog.get_cost("foo", 12)
+
+
+def test_catalog_refresh(tmp_path):
+    data = json.loads((DB_PATH / "electricity_cost.json").read_text())
+    file_path = tmp_path / "cost.json"
+    file_path.write_text(json.dumps(data))
+    catalog = Catalog(tmp_path)
+    assert catalog.get_cost("cost", 1).compute(0, 1.0) == approx(0.25)
+
+    data["initial_cost_one_kwh"] = 0.34
+    file_path.write_text(json.dumps(data))
+    os.utime(file_path, ns=(0, file_path.stat().st_mtime_ns + 1))
+    assert catalog.get_cost("cost", 1).compute(0, 1.0) == approx(0.25)
+    catalog.refresh()
+    assert catalog.get_cost("cost", 1).compute(0, 1.0) == approx(0.35)
@@ -1,11 +1,29 @@
 from __future__ import annotations
 
+import logging
+
+import pytest
+from energy_house_cost import energy_scenario
 from energy_house_cost.database import DB_PATH
+from energy_house_cost.database.lib_components import PV
 from energy_house_cost.energetic_components import EnergeticComponent
 from energy_house_cost.energy_cost import EnergyCostProjection
+from energy_house_cost.energy_scenario import compute_cost
+from energy_house_cost.energy_scenario import compute_cost_jacobian
 from energy_house_cost.energy_scenario import EnergyItem
 from energy_house_cost.energy_scenario import EnergyScenario
+from energy_house_cost.parameter_store import ParameterStore
+from energy_house_cost.profiles import BaseProfile
+from energy_house_cost.profiles import PiecewiseLinearProfile
+from energy_house_cost.report import SUMMARY
+from numpy import arange
+from numpy import array
+from numpy import concatenate
+from numpy import eye
+from numpy import interp
+from numpy import newaxis
 from pytest import approx
+from pytest import raises
 
 
 def test_energy_cost_user_points():
@@ -30,6 +48,97 @@ def test_energy_cost_linear():
     assert c.compute(2, 1.0) == approx(0.5 * (cost_at_year_2 + cost_at_year_3))
 
 
+@pytest.mark.parametrize(
+    "file_name,expected,samples,expected_samples",
+    [
+        # The price of one kWh is 0.2 + slope * year.
+        (
+            "mock_energy_cost_linear.json",
+            [2.4, 6.4, 10.4, 14.4],
+            {"mock_linear.slope": [1.8, 2.2]},
+            [[1.1, 2.9, 4.7, 6.5], [2.6, 7.0, 11.4, 15.8]],
+        ),
+        # The price of one kWh is 0.2 * (1 + percentage / 100) ** year.
+        (
+            "mock_energy_cost_power.json",
+            [0.41, 0.4305, 0.452025, 0.47462625],
+            {"mock_power.percentage_of_increase_per_year": [0.0, 10.0]},
+            [[0.2, 0.2, 0.2, 0.2], [0.42, 0.462, 0.5082, 0.55902]],
+        ),
+        # The price of one kWh is interpolated between (0, 0.2), (2, 0.2),
+        # (3, point1) and (12, 0.5).
+        (
+            "mock_energy_cost_user_points.json",
+            [0.4, 0.4, 0.5, 0.6 + 0.2 / 9],
+            {"mock_user_points.point1": [0.0, 1.0]},
+            [[0.2, 0.2, 0.1, 0.25 / 9], [0.4, 0.4, 1.2, 2.0 - 0.5 / 9]],
+        ),
+    ],
+)
+def test_energy_cost_profile(file_name, expected, samples, expected_samples):
+    c = EnergyCostProjection(DB_PATH / file_name, 12)
+    years = arange(4)
+    samples = {name: array(values) for name, values in samples.items()}
+    # The price of 2 kWh during a year is the mean of the prices of 2 kWh
+    # at the beginning and at the end of the year.
+    profile = c.compute_profile(years, 2.0)
+    assert profile.shape == (4,)
+    assert profile == approx(expected)
+    assert c.compute(3, 2.0) == approx(expected[3])
+    assert c.compute_integral(4, 2.0) == approx(sum(expected))
+
+    profile = c.compute_profile(years, array([1.0, 2.0]), samples)
+    assert profile.shape == (2, 4)
+    assert profile == approx(array(expected_samples))
+    assert c.compute_integral(4, array([1.0, 2.0]), samples) == approx(
+        array(expected_samples).sum(axis=1)
+    )
+
+
+def test_energy_cost_profile_cache():
+    c = EnergyCostProjection(DB_PATH / "mock_energy_cost_user_points.json", 12)
+    profile = c.get_profile()
+    assert c.get_profile() is profile
+    assert c.get_profile({"other.slope": array([1.0])}) is profile
+    assert profile.year_axis == approx([0.0, 2.0, 3.0, 12.0])
+    assert profile.slopes == approx([0.0, 0.1, 0.2 / 9])
+
+    c.parameters["mock_user_points.point2"].value = 0.8
+    assert c.get_profile() is not profile
+    assert c.compute(11, 1.0) == approx(0.3 + 0.5 * 8.5 / 9)
+
+    # The values of a store holding all the parameters reuse the cached profile
+    # as long as the values of the parameters of the profile do not change.
+    profile = c.get_profile()
+    store = ParameterStore(c.parameters)
+    parameter_values = store.get_parameter_values()
+    assert c.get_profile(parameter_values) is profile
+    store.values[store.indices["mock_user_points.point2"]] = 0.6
+    assert c.get_profile(parameter_values) is not profile
+    assert c.compute(11, 1.0, parameter_values) == approx(0.3 + 0.3 * 8.5 / 9)
+
+
+def test_piecewise_linear_profile_extrapolation():
+    profile = PiecewiseLinearProfile.from_points([3.0, 1.0, 5.0], [0.5, 0.2, 0.4])
+    # The years before the first point and after the last one are clamped.
+    years = array([-1.0, 0.0, 1.0, 2.5, 5.0, 7.0])
+    assert profile.compute(years) == approx(
+        interp(years, [1.0, 3.0, 5.0], [0.2, 0.5, 0.4])
+    )
+    jacobian = profile.compute_band_jacobian(array([-1.0, 6.0]))
+    assert jacobian == approx(array([[1.0, 0.0], [0.0, 0.0], [0.0, 1.0]]))
+
+
+def test_piecewise_linear_profile_duplicate_years():
+    with raises(ValueError, match=r"strictly increasing, got \[0.0, 2.0, 2.0\]"):
+        PiecewiseLinearProfile.from_points([2.0, 0.0, 2.0], [0.5, 0.2, 0.4])
+
+
+def test_base_profile_is_abstract():
+    with raises(TypeError, match="abstract"):
+        BaseProfile()
+
+
 def test_scenario():
     duration_years = 10
     cost = EnergyCostProjection(DB_PATH / "mock_energy_cost_linear.json", 15)
@@ -48,3 +157,200 @@ def test_scenario():
         * 0.5
         * (0.2 + (0.2 + duration_years * 2))
     )
+
+
+def test_scenario_cost_outputs():
+    cost = EnergyCostProjection(DB_PATH / "mock_energy_cost_linear.json", 15)
+    mock_component = EnergeticComponent("mock", 100.0, 10.0)
+    energy_items = [
+        EnergyItem(1e3, mock_component, cost),
+        EnergyItem(2e3, mock_component, cost),
+    ]
+    scenario = EnergyScenario(energy_items, 10)
+    assert scenario.cost_output_names == ["cost.mock", "cost.mock.1"]
+    scenario.execute()
+    output_data = scenario.get_output_data()
+    cost_per_year_per_component = scenario.get_cost_per_year_per_component()
+    assert cost_per_year_per_component.shape == (10, 2)
+    assert output_data["cost.mock"] == approx(cost_per_year_per_component[:, 0])
+    assert output_data["cost.mock.1"] == approx(cost_per_year_per_component[:, 1])
+    assert cost_per_year_per_component == approx(compute_cost(energy_items, 10)[1])
+    assert output_data["total_cost"][0] == approx(cost_per_year_per_component.sum())
+
+
+def test_energy_item_integrated_cost():
+    cost = EnergyCostProjection(DB_PATH / "mock_energy_cost_linear.json", 15)
+    item = EnergyItem(1e3, EnergeticComponent("mock", 100.0, 10.0), cost)
+    integrated_cost = compute_cost([item], 15)[0]
+    assert item.integrated_cost == approx(integrated_cost)
+    assert f" which represents {integrated_cost / 15:.0f} euros" in repr(item)
+
+
+def test_scenario_compute_batch():
+    duration_years = 12
+    electricity_cost = EnergyCostProjection(
+        DB_PATH / "electricity_cost.json", duration_years
+    )
+    user_points_cost = EnergyCostProjection(
+        DB_PATH / "mock_energy_cost_user_points.json", duration_years
+    )
+    energy_items = [
+        EnergyItem(
+            1e3, EnergeticComponent("boiler", 7000.0, 100.0, 0.6), user_points_cost
+        ),
+        EnergyItem(0.0, PV("pv", 5000.0, 0.0), electricity_cost, is_produced=True),
+    ]
+    scenario = EnergyScenario(energy_items, duration_years)
+    samples = {
+        "electricity_cost.slope": array([0.01, 0.02, 0.03]),
+        "pv.auto_consumption_ratio": array([0.5, 0.35, 0.4]),
+        "mock_user_points.point1": array([0.1, 0.3, 0.9]),
+    }
+    total_cost, cost_per_year_per_component = scenario.compute_batch(samples)
+    assert total_cost.shape == (3,)
+    assert cost_per_year_per_component.shape == (3, duration_years, 2)
+    # The parameters of the scenario are not modified.
+    assert electricity_cost.parameters["electricity_cost.slope"].value == 0.02
+    matrix = scenario.parameter_store.to_array(samples)
+    assert scenario.compute_batch(matrix)[0] == approx(total_cost)
+    # A single sample is a matrix with one row.
+    total_cost_of_row, cost_of_row = scenario.compute_batch(matrix[1])
+    assert total_cost_of_row == approx(total_cost[1:2])
+    assert cost_of_row == approx(cost_per_year_per_component[1:2])
+    match = rf"should be shaped as \(n_samples, {scenario.parameter_store.size}\)"
+    with raises(ValueError, match=match):
+        scenario.compute_batch(matrix[:, 1:])
+    with raises(ValueError, match=match):
+        scenario.compute_batch(matrix[newaxis])
+
+    for i in range(3):
+        scenario.execute({name: values[i : i + 1] for name, values in samples.items()})
+        assert total_cost[i] == approx(scenario.get_output_data()["total_cost"][0])
+        _, expected_cost_per_year_per_component = compute_cost(
+            energy_items,
+            duration_years,
+            scenario.parameter_store.get_parameter_values(),
+        )
+        assert cost_per_year_per_component[i] == approx(
+            expected_cost_per_year_per_component
+        )
+
+
+def test_scenario_compute_batch_out_of_bounds():
+    cost = EnergyCostProjection(DB_PATH / "mock_energy_cost_linear.json", 15)
+    energy_items = [EnergyItem(1e3, EnergeticComponent("mock", 0.0, 0.0), cost)]
+    scenario = EnergyScenario(energy_items, 10)
+    with raises(ValueError, match="mock_linear.slope is out of bounds"):
+        scenario.compute_batch({"mock_linear.slope": array([2.0, 3.0])})
+
+
+def test_scenario_report(caplog):
+    caplog.set_level(logging.INFO)
+    cost = EnergyCostProjection(DB_PATH / "mock_energy_cost_linear.json", 15)
+    energy_items = [EnergyItem(1e3, EnergeticComponent("mock", 0.0, 0.0), cost)]
+    scenario = EnergyScenario(energy_items, 10)
+    with raises(ValueError, match="The scenario has not been executed."):
+        scenario.get_report()
+    scenario.execute()
+    assert not caplog.records
+
+    scenario.verbosity = SUMMARY
+    scenario.execute({"mock_linear.slope": array([1.8])})
+    report = scenario.get_report()
+    assert caplog.messages == [report.get_summary()]
+    assert report.total_cost == approx(scenario.get_output_data()["total_cost"][0])
+    assert str(report).splitlines()[2:] == [
+        "mock consumed 1000.0 kWh on the grid of mock_linear",
+        " which represents 9200 euros (average per year, including initial cost"
+        " and maintenance)",
+    ]
+
+
+def test_scenario_report_injected_energy():
+    cost = EnergyCostProjection(DB_PATH / "electricity_cost.json", 15)
+    energy_items = [EnergyItem(0.0, PV("pv", 5000.0, 0.0), cost, is_produced=True)]
+    scenario = EnergyScenario(energy_items, 10)
+    scenario.execute({"pv.auto_consumption_ratio": array([0.35])})
+    details = scenario.get_report().get_details()
+    assert details[0].startswith(
+        "pv saved -1680.0 kWh from the grid and sold 3120.0 kWh of electricity_cost"
+    )
+
+
+def test_scenario_jacobian():
+    duration_years = 12
+    energy_items = [
+        EnergyItem(
+            1e3,
+            EnergeticComponent("boiler", 7000.0, 100.0, 0.6),
+            EnergyCostProjection(DB_PATH / "mock_energy_cost_user_points.json", 12),
+            is_produced=True,
+        ),
+        EnergyItem(
+            2e3,
+            EnergeticComponent("tank", 1000.0, 0.0),
+            EnergyCostProjection(DB_PATH / "mock_energy_cost_power.json", 12),
+        ),
+        EnergyItem(
+            0.0,
+            PV("pv", 5000.0, 0.0),
+            EnergyCostProjection(DB_PATH / "electricity_cost.json", 12),
+            is_produced=True,
+        ),
+    ]
+    scenario = EnergyScenario(energy_items, duration_years)
+    jacobian = compute_cost_jacobian(energy_items, duration_years)
+    store = scenario.parameter_store
+    step = 1e-6
+    samples = store.default_values + step * eye(store.size)
+    samples = concatenate([store.default_values[None], samples])
+    cost_per_year_per_component = scenario.compute_batch(samples)[1]
+    for i, name in enumerate(store.names):
+        assert jacobian[name] == approx(
+            (cost_per_year_per_component[i + 1] - cost_per_year_per_component[0])
+            / step,
+            rel=1e-4,
+            abs=1e-4,
+        )
+
+    assert scenario.check_jacobian(step=1e-6, threshold=1e-4)
+
+
+def test_scenario_incremental(monkeypatch):
+    duration_years = 12
+    electricity_cost = EnergyCostProjection(
+        DB_PATH / "electricity_cost.json", duration_years
+    )
+    user_points_cost = EnergyCostProjection(
+        DB_PATH / "mock_energy_cost_user_points.json", duration_years
+    )
+    energy_items = [
+        EnergyItem(1e3, EnergeticComponent("boiler", 7000.0, 100.0), user_points_cost),
+        EnergyItem(0.0, PV("pv", 5000.0, 0.0), electricity_cost, is_produced=True),
+        EnergyItem(2e3, EnergeticComponent("oven", 500.0, 0.0), electricity_cost),
+    ]
+    scenario = EnergyScenario(energy_items, duration_years)
+    scenario.execute()
+    evaluated_items = []
+    compute_cost_evolution = energy_scenario.compute_cost_evolution
+
+    def compute_cost_evolution_spy(item, *args):
+        evaluated_items.append(item)
+        return compute_cost_evolution(item, *args)
+
+    monkeypatch.setattr(
+        energy_scenario, "compute_cost_evolution", compute_cost_evolution_spy
+    )
+    scenario.execute({"pv.auto_consumption_ratio": array([0.4])})
+    assert evaluated_items == [energy_items[1]]
+    evaluated_items.clear()
+    scenario.execute({"electricity_cost.slope": array([0.03])})
+    assert evaluated_items == energy_items[1:]
+
+    total_cost, cost_per_year_per_component = compute_cost(
+        energy_items, duration_years, scenario.parameter_store.get_parameter_values()
+    )
+    assert scenario.get_output_data()["total_cost"][0] == approx(total_cost)
+    assert scenario.get_cost_per_year_per_component() == approx(
+        cost_per_year_per_component
+    )
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+from energy_house_cost.database import DB_PATH
+from energy_house_cost.database.lib_components import PV
+from energy_house_cost.energetic_components import EnergeticComponent
+from energy_house_cost.energy_cost import EnergyCostProjection
+from energy_house_cost.energy_item import EnergyItem
+from energy_house_cost.energy_item import get_uncertain_parameters
+from energy_house_cost.evaluation import compute_cost
+from energy_house_cost.executor import ThreadedEvaluator
+from energy_house_cost.sampling import generate_samples
+from numpy.testing import assert_allclose
+
+
+def test_threaded_evaluator():
+    electricity_cost = EnergyCostProjection(DB_PATH / "electricity_cost.json", 15)
+    gas_cost = EnergyCostProjection(DB_PATH / "gas_cost.json", 15)
+    energy_items = [
+        EnergyItem(3400.0, EnergeticComponent("boiler", 7000.0, 100.0, 0.6), gas_cost),
+        EnergyItem(0.0, PV("pv", 5000.0, 0.0), electricity_cost, is_produced=True),
+        EnergyItem(0.0, PV("pv2", 3000.0, 0.0), electricity_cost, is_produced=True),
+    ]
+    pv_parameters = [item.component._uncertain_parameters for item in energy_items[1:]]
+    assert list(pv_parameters[1]) == ["pv2.auto_consumption_ratio"]
+    assert pv_parameters[1]["pv2.auto_consumption_ratio"].name == (
+        "pv2.auto_consumption_ratio"
+    )
+    assert (
+        pv_parameters[0]["pv.auto_consumption_ratio"]
+        is not pv_parameters[1]["pv2.auto_consumption_ratio"]
+    )
+
+    evaluator = ThreadedEvaluator(energy_items, 15, n_workers=8)
+    store = evaluator.parameter_store
+    samples = generate_samples(store, 2000, seed=1)
+    serial_results = [
+        compute_cost(energy_items, 15, store.get_parameter_values(values))
+        for values in samples
+    ]
+    with evaluator:
+        total_cost, cost_per_year_per_component = evaluator.map(samples)
+        futures = [evaluator.submit(values) for values in samples[::-1]]
+        results = [future.result() for future in futures][::-1]
+
+    assert_allclose(total_cost, [result[0] for result in serial_results])
+    assert_allclose(
+        cost_per_year_per_component, [result[1] for result in serial_results]
+    )
+    assert_allclose([result[0] for result in results], total_cost)
+    assert_allclose(
+        [p.value for p in get_uncertain_parameters(energy_items).values()],
+        store.default_values,
+    )
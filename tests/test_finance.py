@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+from energy_house_cost.database import DB_PATH
+from energy_house_cost.energetic_components import EnergeticComponent
+from energy_house_cost.energy_cost import EnergyCostProjection
+from energy_house_cost.energy_scenario import compute_cost
+from energy_house_cost.energy_scenario import EnergyItem
+from energy_house_cost.finance import compute_net_present_cost_batch
+from energy_house_cost.finance import FinancialModel
+from numpy import arange
+from numpy import array
+from pytest import approx
+from pytest import raises
+
+
+def create_energy_items():
+    cost = EnergyCostProjection(DB_PATH / "electricity_cost.json", 12)
+    return [
+        EnergyItem(1e3, EnergeticComponent("heat pump", 1200.0, 100.0), cost),
+        EnergyItem(2e3, EnergeticComponent("oven", 500.0, 0.0), cost),
+    ]
+
+
+def test_cash_flows():
+    energy_items = create_energy_items()
+    cost_per_year_per_component = compute_cost(energy_items, 12)[1]
+    model = FinancialModel()
+    assert model.compute_cash_flows(
+        energy_items, cost_per_year_per_component
+    ) == approx(cost_per_year_per_component)
+
+    model = FinancialModel(0.05)
+    discount_factors = 1.05 ** -arange(12)
+    assert model.compute_net_present_cost(
+        energy_items, cost_per_year_per_component
+    ) == approx((cost_per_year_per_component.sum(axis=1) * discount_factors).sum())
+
+    model = FinancialModel()
+    model.set_lifetime("heat pump", 5.0)
+    model.set_loan("heat pump", 4, 0.0)
+    model.set_subsidy("heat pump", 400.0)
+    cash_flows = model.compute_cash_flows(energy_items, cost_per_year_per_component)
+    installations = cash_flows[:, 0] - cost_per_year_per_component[:, 0]
+    installations[0] += 1200.0
+    assert installations == approx(
+        [200.0] * 4 + [0.0] + [300.0] * 4 + [0.0] + [300.0] * 2
+    )
+    assert cash_flows[:, 1] == approx(cost_per_year_per_component[:, 1])
+
+
+def test_net_present_cost_batch():
+    energy_items = create_energy_items()
+    model = FinancialModel(0.03, 0.01, 0.06)
+    model.set_lifetime("heat pump", 8.0, 5.0, 15.0)
+    model.set_loan("heat pump", 5, 0.04, 0.02, 0.06)
+    samples = {
+        "finance.discount_rate": array([0.01, 0.05]),
+        "finance.heat pump.lifetime_years": array([5.0, 14.0]),
+        "finance.heat pump.loan_rate": array([0.02, 0.06]),
+        "electricity_cost.slope": array([0.01, 0.03]),
+    }
+    net_present_cost, cash_flows = compute_net_present_cost_batch(
+        energy_items, 12, model, samples
+    )
+    assert cash_flows.shape == (2, 12, 2)
+    for i in range(2):
+        parameter_values = {name: values[i] for name, values in samples.items()}
+        assert net_present_cost[i] == approx(
+            model.compute_net_present_cost(
+                energy_items,
+                compute_cost(energy_items, 12, parameter_values)[1],
+                parameter_values,
+            )
+        )
+
+
+def test_invalid_lifetimes_and_loans():
+    model = FinancialModel()
+    with raises(ValueError, match="The lifetime of heat pump should be positive"):
+        model.set_lifetime("heat pump", 0.0)
+    with raises(ValueError, match="should be positive, got -1.0."):
+        model.set_lifetime("heat pump", 10.0, -1.0, 20.0)
+    with raises(ValueError, match="should have at least one annuity, got 0."):
+        model.set_loan("heat pump", 0, 0.03)
+    assert not model.parameters.keys() - {"finance.discount_rate"}
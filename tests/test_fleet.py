@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+from energy_house_cost.database import DB_PATH
+from energy_house_cost.database.lib_components import PV
+from energy_house_cost.energetic_components import EnergeticComponent
+from energy_house_cost.energy_cost import EnergyCostProjection
+from energy_house_cost.energy_item import EnergyItem
+from energy_house_cost.energy_scenario import compute_cost
+from energy_house_cost.energy_scenario import EnergyScenario
+from energy_house_cost.fleet import compute_fleet_cost
+from numpy import array
+from numpy import load
+from numpy import save
+from numpy import savez
+from numpy.testing import assert_allclose
+from pandas import DataFrame
+from pytest import raises
+
+
+def test_fleet(tmp_path):
+    electricity_cost = EnergyCostProjection(DB_PATH / "electricity_cost.json", 15)
+    gas_cost = EnergyCostProjection(DB_PATH / "gas_cost.json", 15)
+    energy_items = [
+        EnergyItem(
+            3400.0, EnergeticComponent("boiler", 7000.0, 100.0, 0.8), gas_cost, True
+        ),
+        EnergyItem(0.0, PV("pv", 5000.0, 0.0), electricity_cost, is_produced=True),
+    ]
+    houses = {
+        "boiler.energy_value": array([3000.0, 3400.0, 5000.0]),
+        "boiler.production_over_consumption_ratio": array([0.9, 0.8, 0.7]),
+        "pv.initial_install_cost": array([4000.0, 5000.0, 6000.0]),
+    }
+    result = compute_fleet_cost(energy_items, 15, houses, chunk_size=2)
+    on_disk = compute_fleet_cost(
+        energy_items, 15, houses, chunk_size=2, directory=tmp_path
+    )
+    assert result.item_names == ("boiler", "pv")
+    assert result.cost_per_year_per_component.shape == (3, 15, 2)
+    assert_allclose(on_disk.total_cost, result.total_cost)
+    assert_allclose(
+        on_disk.cost_per_year_per_component, result.cost_per_year_per_component
+    )
+    assert (tmp_path / "total_cost.npy").exists()
+    from_data_frame = compute_fleet_cost(
+        energy_items, 15, DataFrame(houses), chunk_size=2
+    )
+    assert_allclose(from_data_frame.total_cost, result.total_cost)
+    savez(tmp_path / "houses.npz", **houses)
+    with load(tmp_path / "houses.npz") as npz_file:
+        from_npz_file = compute_fleet_cost(energy_items, 15, npz_file, chunk_size=2)
+    assert_allclose(from_npz_file.total_cost, result.total_cost)
+    columns_directory = tmp_path / "houses"
+    columns_directory.mkdir()
+    for name, column in houses.items():
+        save(columns_directory / f"{name}.npy", column)
+    from_directory = compute_fleet_cost(
+        energy_items, 15, columns_directory, chunk_size=2
+    )
+    assert_allclose(from_directory.total_cost, result.total_cost)
+
+    for i in range(3):
+        boiler = EnergeticComponent(
+            "boiler",
+            7000.0,
+            100.0,
+            houses["boiler.production_over_consumption_ratio"][i],
+        )
+        pv = PV("pv", houses["pv.initial_install_cost"][i], 0.0)
+        total_cost, cost_per_year_per_component = compute_cost(
+            [
+                EnergyItem(houses["boiler.energy_value"][i], boiler, gas_cost, True),
+                EnergyItem(0.0, pv, electricity_cost, is_produced=True),
+            ],
+            15,
+        )
+        assert_allclose(result.total_cost[i], total_cost)
+        assert_allclose(
+            result.cost_per_year_per_component[i], cost_per_year_per_component
+        )
+
+
+def test_fleet_versus_scenario():
+    electricity_cost = EnergyCostProjection(DB_PATH / "electricity_cost.json", 15)
+    gas_cost = EnergyCostProjection(DB_PATH / "gas_cost.json", 15)
+    energy_items = [
+        EnergyItem(
+            3400.0, EnergeticComponent("boiler", 7000.0, 100.0, 0.8), gas_cost, True
+        ),
+        EnergyItem(0.0, PV("pv", 5000.0, 0.0), electricity_cost, is_produced=True),
+    ]
+    # The ratio of the PV does not change its energy, computed from its parameters.
+    houses = {
+        "boiler.maintenance_cost": array([50.0, 100.0, 150.0]),
+        "boiler.production_over_consumption_ratio": array([0.9, 0.8, 0.7]),
+        "pv.production_over_consumption_ratio": array([0.5, 0.6, 0.7]),
+        "pv.energy_value": array([1000.0, 2000.0, 3000.0]),
+    }
+    parameter_values = {"pv.auto_consumption_ratio": 0.4}
+    result = compute_fleet_cost(
+        energy_items, 15, houses, chunk_size=2, parameter_values=parameter_values
+    )
+
+    for i in range(3):
+        boiler = EnergeticComponent(
+            "boiler",
+            7000.0,
+            houses["boiler.maintenance_cost"][i],
+            houses["boiler.production_over_consumption_ratio"][i],
+        )
+        scenario = EnergyScenario(
+            [
+                EnergyItem(3400.0, boiler, gas_cost, True),
+                EnergyItem(
+                    houses["pv.energy_value"][i],
+                    PV("pv", 5000.0, 0.0),
+                    electricity_cost,
+                    is_produced=True,
+                ),
+            ],
+            15,
+        )
+        scenario.execute({"pv.auto_consumption_ratio": array([0.4])})
+        assert_allclose(
+            result.total_cost[i], scenario.get_output_data()["total_cost"][0]
+        )
+        assert_allclose(
+            result.cost_per_year_per_component[i],
+            scenario.get_cost_per_year_per_component(),
+        )
+
+
+def test_fleet_without_column():
+    gas_cost = EnergyCostProjection(DB_PATH / "gas_cost.json", 15)
+    energy_items = [EnergyItem(3400.0, EnergeticComponent("boiler", 0.0), gas_cost)]
+    with raises(ValueError, match="The table of the houses has no column."):
+        compute_fleet_cost(energy_items, 15, {})
+
+
+def test_fleet_without_column_in_data_frame():
+    gas_cost = EnergyCostProjection(DB_PATH / "gas_cost.json", 15)
+    energy_items = [EnergyItem(3400.0, EnergeticComponent("boiler", 0.0), gas_cost)]
+    with raises(ValueError, match="The table of the houses has no column."):
+        compute_fleet_cost(energy_items, 15, DataFrame())
+
+
+def test_fleet_columns_of_different_lengths():
+    gas_cost = EnergyCostProjection(DB_PATH / "gas_cost.json", 15)
+    energy_items = [EnergyItem(3400.0, EnergeticComponent("boiler", 0.0), gas_cost)]
+    houses = {
+        "boiler.energy_value": array([3000.0, 3400.0]),
+        "boiler.initial_install_cost": array([4000.0, 5000.0, 6000.0]),
+    }
+    with raises(
+        ValueError,
+        match="The column boiler.initial_install_cost has 3 houses"
+        " instead of 2 like the column boiler.energy_value.",
+    ):
+        compute_fleet_cost(energy_items, 15, houses)
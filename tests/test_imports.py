@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+
+
+def test_core_imports_no_optional_package():
+    modules = (
+        "energy_house_cost.evaluation",
+        "energy_house_cost.finance",
+        "energy_house_cost.fleet",
+        "energy_house_cost.portfolio",
+        "energy_house_cost.sampling",
+        "energy_house_cost.sensitivity",
+        "energy_house_cost.surrogate",
+    )
+    script = (
+        f"import sys\nfor name in {modules!r}: __import__(name)\n"
+        "print(sorted({name.split('.')[0] for name in sys.modules}"
+        " & {'gemseo', 'matplotlib'}))"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", script], check=True, capture_output=True, text=True
+    ).stdout
+    assert output.strip() == "[]"
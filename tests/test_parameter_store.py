@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from energy_house_cost.database.lib_components import PV
+from energy_house_cost.parameter_store import ParameterStore
+from energy_house_cost.parameter_store import resolve_indices
+from energy_house_cost.uncertain import UncertainParameter
+from numpy import array
+from numpy import inf
+from numpy import nan
+from numpy import shares_memory
+from pytest import approx
+from pytest import raises
+
+
+def create_store():
+    return ParameterStore(
+        {
+            "a": UncertainParameter("a", 1.0),
+            "b": UncertainParameter("b", 0.5, 0.0, 1.0),
+        }
+    )
+
+
+def test_parameter_store_update():
+    store = create_store()
+    assert store.names == ("a", "b")
+    store.update({"b": array([0.2]), "other": array([3.0])})
+    assert store.values == approx([1.0, 0.2])
+    assert store.get_parameter_values()["b"] == approx(0.2)
+    with raises(ValueError, match="Parameter b is out of bounds"):
+        store.update({"b": array([2.0])})
+    assert store.values == approx([1.0, 0.2])
+
+
+def test_parameter_store_non_finite_values():
+    store = create_store()
+    with raises(ValueError, match="Parameter b is out of bounds"):
+        store.update({"b": array([nan])})
+    with raises(ValueError, match="Parameter a is out of bounds"):
+        store.set_values([nan, 0.2])
+    with raises(ValueError, match="Parameter a is out of bounds"):
+        store.get_parameter_values(array([[1.0, 0.1], [inf, 0.1]]))
+    assert store.values == approx([1.0, 0.5])
+
+
+def test_parameter_store_samples():
+    store = create_store()
+    samples = store.to_array({"b": [0.1, 0.9]})
+    assert samples == approx(array([[1.0, 0.1], [1.0, 0.9]]))
+    parameter_values = store.get_parameter_values(samples)
+    assert dict(parameter_values).keys() == {"a", "b"}
+    assert shares_memory(parameter_values["b"], samples)
+    with raises(ValueError, match="Parameter c is not a parameter of the store."):
+        store.to_array({"c": [0.1]})
+    with raises(ValueError, match="Parameter b is out of bounds"):
+        store.get_parameter_values(array([[1.0, 0.1], [1.0, -0.1]]))
+
+
+def test_parameter_store_indices():
+    assert resolve_indices("pv", ["pv.a", "pv.b"], {"x": 0, "pv.b": 1}) == {"b": 1}
+
+    pv = PV("pv")
+    store = ParameterStore({"x": UncertainParameter("x"), **pv.parameters})
+    name = "pv.auto_consumption_ratio"
+    store.values[store.indices[name]] = 0.5
+    assert pv._get_parameter_value("auto_consumption_ratio") == 0.45
+    parameter_values = store.get_parameter_values()
+    assert pv._get_parameter_value("auto_consumption_ratio", parameter_values) == 0.5
+    assert pv._parameter_indices == (store.indices, {"auto_consumption_ratio": 1})
+    assert pv._get_parameter_value("auto_consumption_ratio", {name: 0.4}) == 0.4
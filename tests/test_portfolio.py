@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from energy_house_cost.database import DB_PATH
+from energy_house_cost.database.lib_components import PV
+from energy_house_cost.energetic_components import EnergeticComponent
+from energy_house_cost.energy_cost import EnergyCostProjection
+from energy_house_cost.energy_scenario import EnergyItem
+from energy_house_cost.energy_scenario import EnergyScenario
+from energy_house_cost.portfolio import ScenarioPortfolio
+from numpy import array
+from numpy import newaxis
+from pytest import approx
+from pytest import raises
+
+
+def test_portfolio():
+    electricity_cost = EnergyCostProjection(DB_PATH / "electricity_cost.json", 15)
+    gas_cost = EnergyCostProjection(DB_PATH / "gas_cost.json", 15)
+    boiler = EnergyItem(3400.0, EnergeticComponent("boiler", 7000.0, 100.0), gas_cost)
+    heat_pump = EnergyItem(
+        3400.0, EnergeticComponent("heat pump", 15000.0, 200.0), electricity_cost
+    )
+    pv = EnergyItem(0.0, PV("pv", 5000.0, 0.0), electricity_cost, is_produced=True)
+    configurations = {
+        "boiler": [boiler],
+        "heat pump": [heat_pump],
+        "heat pump and pv": [heat_pump, pv],
+    }
+    portfolio = ScenarioPortfolio(configurations, 15)
+    samples = {
+        "electricity_cost.slope": array([0.01, 0.03, 0.01]),
+        "gas_cost.slope": array([0.02, 0.005, 0.005]),
+    }
+    result = portfolio.compute(samples)
+    assert result.total_cost.shape == (3, 3)
+    for j, energy_items in enumerate(configurations.values()):
+        scenario = EnergyScenario(energy_items, 15)
+        names = scenario.parameter_store.names
+        expected = scenario.compute_batch(
+            {name: value for name, value in samples.items() if name in names}
+        )[0]
+        assert result.total_cost[:, j] == approx(expected)
+
+    probabilities = result.compute_probability_of_being_cheapest()
+    assert sum(probabilities.values()) == approx(1.0)
+    cheapest = result.total_cost.argmin(axis=1)
+    assert probabilities["boiler"] == approx((cheapest == 0).mean())
+    ranks = result.compute_mean_rank()
+    assert sum(ranks.values()) == approx(6.0)
+
+
+def test_portfolio_sample_matrix():
+    gas_cost = EnergyCostProjection(DB_PATH / "gas_cost.json", 15)
+    boiler = EnergyItem(3400.0, EnergeticComponent("boiler", 7000.0, 100.0), gas_cost)
+    portfolio = ScenarioPortfolio({"boiler": [boiler]}, 15)
+    matrix = portfolio.parameter_store.to_array(
+        {"gas_cost.slope": array([0.02, 0.005])}
+    )
+    total_cost = portfolio.compute(matrix).total_cost
+    # A single sample is a matrix with one row.
+    assert portfolio.compute(matrix[1]).total_cost == approx(total_cost[1:2])
+    match = rf"should be shaped as \(n_samples, {portfolio.parameter_store.size}\)"
+    with raises(ValueError, match=match):
+        portfolio.compute(matrix[:, 1:])
+    with raises(ValueError, match=match):
+        portfolio.compute(matrix[newaxis])
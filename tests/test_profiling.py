@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import logging
+import pstats
+
+from energy_house_cost.database import DB_PATH
+from energy_house_cost.database.lib_components import PV
+from energy_house_cost.energetic_components import EnergeticComponent
+from energy_house_cost.energy_cost import EnergyCostProjection
+from energy_house_cost.energy_scenario import EnergyItem
+from energy_house_cost.energy_scenario import EnergyScenario
+from energy_house_cost.profiling import profile
+from energy_house_cost.profiling import timed
+from numpy import array
+
+
+def test_profile(tmp_path, caplog):
+    caplog.set_level(logging.INFO)
+    cost = EnergyCostProjection(DB_PATH / "electricity_cost.json", 10)
+    scenario = EnergyScenario(
+        [
+            EnergyItem(1e3, EnergeticComponent("oven", 0.0, 0.0), cost),
+            EnergyItem(0.0, PV("pv", 5000.0, 0.0), cost, is_produced=True),
+        ],
+        10,
+    )
+    pstats_path = tmp_path / "scenario.pstats"
+    with profile(pstats_path) as profiler:
+        scenario.execute()
+        scenario.execute({"pv.auto_consumption_ratio": array([0.4])})
+
+    assert profiler.timings["scenario.execute"][0] == 2
+    assert profiler.timings["scenario.run"][0] == 2
+    assert profiler.timings["item_cost[oven]"][0] == 1
+    assert profiler.timings["item_cost[pv]"][0] == 2
+    assert profiler.counters == {"scenario.recomputed_items": 3}
+    assert caplog.messages == [f"Profiling summary\n{profiler}"]
+    assert "item_cost[pv]" in profiler.get_summary()
+    assert pstats.Stats(str(pstats_path)).total_calls > 0
+
+    # The timers are disabled out of the context.
+    scenario.execute({"pv.auto_consumption_ratio": array([0.35])})
+    assert profiler.timings["scenario.execute"][0] == 2
+    assert timed("scenario.execute") is timed("scenario.run")
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import shutil
+
+from energy_house_cost.parameter_store import ParameterStore
+from energy_house_cost.sampling import generate_samples
+from energy_house_cost.sampling import sample_scenario
+from energy_house_cost.sampling import sample_scenario_to_store
+from energy_house_cost.sampling import SamplingStore
+from energy_house_cost.uncertain import UncertainParameter
+from numpy.testing import assert_array_equal
+from pytest import approx
+from pytest import raises
+
+
+def test_sample_scenario(scenario):
+    result = sample_scenario(scenario, n_samples=25, seed=3, n_workers=1, chunk_size=10)
+    assert result.inputs.shape == (25, scenario.parameter_store.size)
+    assert result.cost_per_year_per_component.shape == (25, 15, 2)
+    slope = result.inputs[:, scenario.parameter_store.indices["gas_cost.slope"]]
+    assert ((slope >= 0.005) & (slope <= 0.02)).all()
+    assert len(set(slope)) == 25
+
+    parallel_result = sample_scenario(
+        scenario, n_samples=25, seed=3, n_workers=2, chunk_size=10
+    )
+    assert_array_equal(parallel_result.inputs, result.inputs)
+    assert_array_equal(parallel_result.total_cost, result.total_cost)
+
+    result = sample_scenario(scenario, result.inputs, n_workers=2, chunk_size=7)
+    assert result.total_cost == approx(scenario.compute_batch(result.inputs)[0])
+
+
+def test_generate_samples_of_constant_parameters():
+    store = ParameterStore(
+        {
+            "a": UncertainParameter("a", 0.5, 0.0, 1.0),
+            "b": UncertainParameter("b", 2.0, 2.0, 2.0),
+            "c": UncertainParameter("c", 3.0),
+        }
+    )
+    samples = generate_samples(store, 10, seed=3)
+    assert ((samples[:, 0] >= 0.0) & (samples[:, 0] <= 1.0)).all()
+    assert len(set(samples[:, 0])) == 10
+    assert (samples[:, 1] == 2.0).all()
+    assert (samples[:, 2] == 3.0).all()
+
+
+def test_sample_scenario_to_store(scenario, tmp_path):
+    expected = sample_scenario(
+        scenario, n_samples=25, seed=3, n_workers=1, chunk_size=10
+    )
+    store = sample_scenario_to_store(
+        scenario, tmp_path, n_samples=25, seed=3, n_workers=1, chunk_size=10
+    )
+    assert store.chunk_indices == [0, 1, 2]
+
+    # Simulate a sampling killed while writing the second chunk.
+    shutil.rmtree(tmp_path / "chunk_000001")
+    (tmp_path / "chunk_000001.tmp").mkdir()
+    assert SamplingStore(tmp_path).chunk_indices == [0, 2]
+    store = sample_scenario_to_store(
+        scenario, tmp_path, n_samples=25, seed=3, n_workers=2, chunk_size=10
+    )
+    result = store.load()
+    assert result.input_names == expected.input_names
+    assert_array_equal(result.inputs, expected.inputs)
+    assert_array_equal(
+        result.cost_per_year_per_component, expected.cost_per_year_per_component
+    )
+    statistics = store.compute_statistics()
+    assert statistics.compute_mean()["total_cost"] == approx(expected.total_cost.mean())
+
+    with raises(ValueError, match="was created with other settings"):
+        sample_scenario_to_store(scenario, tmp_path, n_samples=25, seed=4)
+
+
+def test_sample_scenario_to_store_other_model(scenario, tmp_path):
+    sample_scenario_to_store(
+        scenario, tmp_path, n_samples=10, seed=3, n_workers=1, chunk_size=5
+    )
+    shutil.rmtree(tmp_path / "chunk_000001")
+    scenario._energy_items[0].energy_value = 3000.0
+    with raises(ValueError, match="was created with other settings"):
+        sample_scenario_to_store(
+            scenario, tmp_path, n_samples=10, seed=3, n_workers=1, chunk_size=5
+        )
+
+    scenario._energy_items[0].energy_value = 3400.0
+    scenario.parameter_store.max_values[
+        scenario.parameter_store.indices["gas_cost.slope"]
+    ] = 0.03
+    with raises(ValueError, match="was created with other settings"):
+        sample_scenario_to_store(
+            scenario, tmp_path, n_samples=10, seed=3, n_workers=1, chunk_size=5
+        )
+
+
+def test_sample_scenario_to_store_samples(scenario, tmp_path):
+    samples = sample_scenario(scenario, n_samples=5, seed=3, n_workers=1).inputs
+    store = sample_scenario_to_store(scenario, tmp_path, samples, n_workers=1)
+    assert_array_equal(store.load().inputs, samples)
+
+    samples[0, scenario.parameter_store.indices["gas_cost.slope"]] = 0.01
+    with raises(ValueError, match="was created with other settings"):
+        sample_scenario_to_store(scenario, tmp_path, samples, n_workers=1)
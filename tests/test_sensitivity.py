@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import pytest
+from energy_house_cost.sensitivity import compute_morris_indices
+from energy_house_cost.sensitivity import compute_sobol_indices
+from pytest import approx
+
+
+def test_sobol_indices(scenario):
+    result = compute_sobol_indices(scenario, 2000, n_bootstrap=50)
+    assert result.output_names == ("total_cost", "cost.boiler", "cost.pv")
+    n_inputs = len(result.input_names)
+    assert result.first_order.shape == result.total_order.shape == (3, n_inputs)
+    assert result.first_order_interval.shape == (2, 3, n_inputs)
+    assert (result.first_order_interval[0] <= result.first_order_interval[1]).all()
+
+    # The cost of the boiler depends only on the slope of the gas cost.
+    indices = result.get_indices("cost.boiler")
+    assert indices.pop("gas_cost.slope") == approx((1.0, 1.0), abs=0.1)
+    assert all(index == (0.0, 0.0) for index in indices.values())
+    first_order, total_order = result.get_indices()["gas_cost.slope"]
+    assert first_order == approx(total_order, abs=0.1)
+    assert 0.0 < total_order < 1.0
+
+
+def test_morris_indices(scenario):
+    result = compute_morris_indices(scenario, 10)
+    assert result.mu_star.shape == (3, len(result.input_names))
+    assert (result.mu_star >= abs(result.mu)).all()
+
+    # The cost of the boiler is linear in the slope of the gas cost.
+    i = result.input_names.index("gas_cost.slope")
+    store = scenario.parameter_store
+    j = store.indices["gas_cost.slope"]
+    total_cost = scenario.compute_batch(
+        {
+            "gas_cost.slope": store.min_values[[j]].tolist()
+            + store.max_values[[j]].tolist()
+        }
+    )[1][:, :, 0].sum(axis=1)
+    assert result.mu_star[1, i] == approx(total_cost[1] - total_cost[0])
+    assert result.sigma[1, i] == approx(0.0, abs=1e-6)
+    with pytest.raises(ValueError, match="must be even, got 3"):
+        compute_morris_indices(scenario, 10, 3)
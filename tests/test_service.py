@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import asyncio
+import json
+
+from energy_house_cost.service import BatchingEvaluator
+from energy_house_cost.service import serve
+from numpy import linspace
+from numpy.testing import assert_allclose
+from pytest import approx
+from pytest import raises
+
+
+def test_batching_evaluator(scenario):
+    evaluator = BatchingEvaluator(scenario._energy_items, 15, max_batch_size=16)
+    slopes = linspace(0.005, 0.02, 40)
+
+    async def evaluate():
+        results = await asyncio.gather(
+            *(evaluator.evaluate({"gas_cost.slope": slope}) for slope in slopes)
+        )
+        await evaluator.close()
+        return results
+
+    results = asyncio.run(evaluate())
+    total_cost, cost_per_year_per_component = scenario.compute_batch(
+        {"gas_cost.slope": slopes}
+    )
+    assert [result[0] for result in results] == approx(total_cost)
+    assert_allclose(results[-1][1], cost_per_year_per_component[-1])
+    summary = evaluator.metrics.get_summary()
+    assert summary["n_queries"] == 40
+    assert 3 <= summary["n_batches"] < 40
+    assert summary["latency_p99"] >= summary["latency_p50"] > 0
+
+    with raises(ValueError, match="Parameter gas_cost.slope is out of bounds"):
+        asyncio.run(evaluator.evaluate({"gas_cost.slope": 1.0}))
+
+
+def test_serve(scenario, tmp_path):
+    evaluator = BatchingEvaluator(scenario._energy_items, 15)
+    path = str(tmp_path / "service.sock")
+
+    async def request(method, resource, data=None):
+        reader, writer = await asyncio.open_unix_connection(path)
+        body = json.dumps(data).encode() if data is not None else b""
+        writer.write(
+            f"{method} {resource} HTTP/1.1\r\nContent-Length: {len(body)}\r\n"
+            "Connection: close\r\n\r\n".encode() + body
+        )
+        status_line, _, response_body = (await reader.read()).partition(b"\r\n")
+        writer.close()
+        return status_line.split()[1], json.loads(response_body.split(b"\r\n\r\n")[1])
+
+    async def run():
+        server = asyncio.ensure_future(serve(evaluator, unix_socket_path=path))
+        while not (tmp_path / "service.sock").exists():
+            await asyncio.sleep(0.01)
+        responses = [
+            await request("POST", "/evaluate", {"gas_cost.slope": 0.01}),
+            await request("POST", "/evaluate", {"unknown": 0.01}),
+            await request("POST", "/evaluate", {"gas_cost.slope": [0.01, 0.02]}),
+            *[
+                await request("POST", "/evaluate", {"gas_cost.slope": value})
+                for value in (None, float("nan"), "0.01", True)
+            ],
+            await request("GET", "/metrics"),
+            await request("GET", "/unknown"),
+        ]
+        server.cancel()
+        return responses
+
+    (
+        evaluation,
+        error,
+        list_error,
+        null_error,
+        nan_error,
+        string_error,
+        boolean_error,
+        metrics,
+        not_found,
+    ) = asyncio.run(run())
+    assert evaluation[0] == b"200"
+    assert evaluation[1]["total_cost"] == approx(
+        scenario.compute_batch({"gas_cost.slope": [0.01]})[0][0]
+    )
+    assert len(evaluation[1]["cost_per_year_per_component"]) == 15
+    assert error == (
+        b"400",
+        {"error": "Parameter unknown is not a parameter of the store."},
+    )
+    assert list_error == (
+        b"400",
+        {
+            "error": "The value of the parameter gas_cost.slope should be"
+            " a finite number, got [0.01, 0.02]."
+        },
+    )
+    for response, value in zip(
+        (null_error, nan_error, string_error, boolean_error),
+        ("None", "nan", "'0.01'", "True"),
+    ):
+        assert response == (
+            b"400",
+            {
+                "error": "The value of the parameter gas_cost.slope should be"
+                f" a finite number, got {value}."
+            },
+        )
+    assert metrics[0] == b"200"
+    assert metrics[1]["n_queries"] == 1
+    assert not_found[0] == b"404"
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import pytest
+from energy_house_cost.sampling import compute_statistics
+from energy_house_cost.sampling import sample_scenario
+from energy_house_cost.statistics import OnlineStatistics
+from numpy import quantile
+from numpy import searchsorted
+from numpy import sort
+from numpy.random import default_rng
+from pytest import approx
+
+
+def test_online_statistics():
+    samples = default_rng(1).lognormal(size=(50000, 2))
+    statistics = OnlineStatistics(["a", "b"], capacity=256)
+    for batch in samples[:30000].reshape(-1, 1000, 2):
+        statistics.update(batch)
+    other_statistics = OnlineStatistics(["a", "b"], capacity=256)
+    other_statistics.update(samples[30000:])
+    statistics.merge(other_statistics)
+
+    assert statistics.n_samples == 50000
+    assert list(statistics.compute_mean().values()) == approx(samples.mean(axis=0))
+    assert list(statistics.compute_standard_deviation().values()) == approx(
+        samples.std(axis=0, ddof=1)
+    )
+    assert statistics.max == approx(samples.max(axis=0))
+    error_bound = statistics.sketch.rank_error_bound
+    assert 0.0 < error_bound < 0.05
+    for probability in [0.01, 0.23, 0.5, 0.8, 0.99]:
+        for i, estimate in enumerate(statistics.compute_quantile(probability).values()):
+            rank = searchsorted(sort(samples[:, i]), estimate) / len(samples)
+            assert rank == approx(probability, abs=error_bound)
+    assert statistics.compute_quartile(3)["a"] == approx(
+        quantile(samples[:, 0], 0.75), rel=0.05
+    )
+    merged_statistics = OnlineStatistics(["a", "b"], capacity=256)
+    merged_statistics.merge(statistics)
+    assert merged_statistics.compute_quantile(0.5) == statistics.compute_quantile(0.5)
+    with pytest.raises(ValueError, match="The sketch is empty."):
+        OnlineStatistics(["a"]).compute_quantile(0.5)
+
+
+def test_compute_statistics(scenario):
+    statistics = compute_statistics(
+        scenario, n_samples=2500, seed=3, n_workers=2, chunk_size=1000
+    )
+    result = sample_scenario(
+        scenario, n_samples=2500, seed=3, n_workers=1, chunk_size=1000
+    )
+    assert statistics.output_names == ("total_cost", "cost.boiler", "cost.pv")
+    assert statistics.compute_mean()["total_cost"] == approx(result.total_cost.mean())
+    assert statistics.compute_mean()["cost.pv"] == approx(
+        result.cost_per_year_per_component[:, :, 1].sum(axis=1).mean()
+    )
+    assert statistics.compute_variance()["total_cost"] == approx(
+        result.total_cost.var(ddof=1)
+    )
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import pytest
+from energy_house_cost.surrogate import PolynomialSurrogate
+from energy_house_cost.surrogate import SurrogateScenario
+from energy_house_cost.surrogate import train_surrogate
+from numpy import array
+from pytest import approx
+
+
+def test_surrogate(scenario, tmp_path):
+    # The costs of the linear profiles are polynomials of degree 2.
+    surrogate = train_surrogate(scenario, 50, degree=2)
+    assert set(surrogate.cross_validation_error) == {
+        "total_cost",
+        "cost.boiler",
+        "cost.pv",
+    }
+    assert max(surrogate.cross_validation_error.values()) < 1e-6
+
+    surrogate.save(tmp_path / "surrogate.npz")
+    surrogate = PolynomialSurrogate.load(tmp_path / "surrogate.npz")
+    assert max(surrogate.cross_validation_error.values()) < 1e-6
+    surrogate_scenario = SurrogateScenario(surrogate)
+    input_data = {"pv.auto_consumption_ratio": array([0.4])}
+    scenario.execute(input_data)
+    surrogate_scenario.execute(input_data)
+    for name, value in scenario.get_output_data().items():
+        assert surrogate_scenario.get_output_data()[name] == approx(value)
+
+    with pytest.raises(ValueError, match="needs at least 10 samples"):
+        train_surrogate(scenario, 5, n_folds=2)
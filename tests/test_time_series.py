@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import json
+import os
+
+import pytest
+from energy_house_cost.database import lib_components
+from energy_house_cost.database.lib_components import PV
+from energy_house_cost.energy_cost import EnergyCostProjection
+from energy_house_cost.time_series import compute_self_consumption
+from energy_house_cost.time_series import compute_yearly_means
+from energy_house_cost.time_series import create_heating_profile
+from energy_house_cost.time_series import create_pv_profile
+from energy_house_cost.time_series import HOURS_PER_YEAR
+from energy_house_cost.time_series import load_series
+from energy_house_cost.time_series import MONTHS_PER_YEAR
+from numpy import arange
+from numpy import array
+from numpy import column_stack
+from numpy import memmap
+from numpy import save
+from pytest import approx
+
+
+@pytest.mark.parametrize("n_steps", [HOURS_PER_YEAR, MONTHS_PER_YEAR])
+def test_profiles(n_steps):
+    heating = create_heating_profile(3400.0, n_steps)
+    production = create_pv_profile(4800.0, n_steps)
+    assert heating.shape == production.shape == (n_steps,)
+    assert heating.sum() == approx(3400.0)
+    assert production.sum() == approx(4800.0)
+    # More heating in winter, more production in summer.
+    assert heating[0] > heating[n_steps // 2]
+    assert production[0] < production[n_steps // 2]
+
+
+def test_compute_self_consumption():
+    production = array([[0.0, 2.0, 3.0], [1.0, 1.0, 1.0]])
+    consumption = array([1.0, 1.0, 1.0])
+    self_consumed, injected = compute_self_consumption(production, consumption)
+    assert self_consumed == approx([2.0, 3.0])
+    assert injected == approx([3.0, 0.0])
+
+
+def test_time_resolved_pv(monkeypatch):
+    production = create_pv_profile(4800.0)
+    consumption = create_heating_profile(3400.0) + 0.1
+    pv = PV("pv", production_profile=production, consumption_profile=consumption)
+    # The self-consumption is computed once, at construction.
+    monkeypatch.setattr(lib_components, "compute_self_consumption", None)
+    assert pv.is_time_resolved
+    assert not pv.parameters
+    self_consumed = -pv.compute(0.0, True)
+    assert 0.0 < self_consumed < 4800.0
+    assert self_consumed + pv.injected_energy() == approx(4800.0)
+    assert not pv.compute_jacobian(0.0, True)
+    with pytest.raises(ValueError, match="consumption_profile must be defined"):
+        PV("pv", production_profile=production)
+
+
+def test_energy_cost_series(tmp_path):
+    steps_per_year = 4
+    prices = arange(10.0)
+    save(tmp_path / "prices.npy", column_stack([prices, 2 * prices]))
+    data = {
+        "name": "spot",
+        "energy_name": "electricity",
+        "profile_type": "series",
+        "path": "prices.npy",
+        "column": 1,
+        "steps_per_year": steps_per_year,
+        "injected_price_per_kwh": 0.1,
+    }
+    (tmp_path / "spot.json").write_text(json.dumps(data))
+    cost = EnergyCostProjection(tmp_path / "spot.json", 2)
+    assert list(cost.parameters) == ["spot.injected_price_per_kwh"]
+    assert cost.compute_profile(arange(2), 10.0) == approx([30.0, 110.0])
+    assert cost.compute_integral(2, 10.0) == approx(140.0)
+    with pytest.raises(ValueError, match="Last value of year axis"):
+        cost.compute(2, 1.0)
+
+    series = load_series(tmp_path / "prices.npy", 0)
+    assert isinstance(series.base, memmap)
+    assert load_series(tmp_path / "prices.npy", 0).base is series.base
+    assert compute_yearly_means(series, steps_per_year) == approx([1.5, 5.5])
+    with pytest.raises(ValueError, match="a column must be given"):
+        load_series(tmp_path / "prices.npy")
+
+    # A modified file is mapped again.
+    stat = (tmp_path / "prices.npy").stat()
+    save(tmp_path / "prices.npy", column_stack([prices, 3 * prices]))
+    os.utime(tmp_path / "prices.npy", ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    assert load_series(tmp_path / "prices.npy", 1) == approx(3 * prices)